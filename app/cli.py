@@ -0,0 +1,82 @@
+"""Flask CLI commands for database maintenance.
+
+Run with ``flask --app app.main:create_app <command>``.
+"""
+
+from datetime import date
+
+import click
+from flask import Flask
+
+
+def register_cli_commands(app: Flask) -> None:
+    """Register maintenance commands on the application.
+
+    Args:
+        app: Flask application instance.
+    """
+
+    @app.cli.command("rebuild-projections")
+    def rebuild_projections() -> None:
+        """Rebuild all card projection tables from their source tables."""
+        from app.services import ProjectionService
+
+        for table_name, rows in ProjectionService.rebuild().items():
+            click.echo(f"{table_name}: {rows} rows")
+
+    @app.cli.command("reconcile-counters")
+    @click.option("--fix", is_flag=True, help="Rebuild counters when drift is found.")
+    def reconcile_counters(fix: bool) -> None:
+        """Recount entity counters from scratch and report any drift."""
+        from app.services import CounterService
+
+        drift = CounterService.reconcile(fix=fix)
+        for row in drift:
+            click.echo(
+                f"{row['table']}.{row['name']}: stored {row['stored']}, actual {row['actual']}"
+            )
+        if not drift:
+            click.echo("entity_counters: no drift")
+        elif fix:
+            click.echo(f"entity_counters: rebuilt, {len(drift)} counters corrected")
+
+    @app.cli.command("reconcile-change-log")
+    def reconcile_change_log() -> None:
+        """Log entity writes made by bulk statements that skipped the listeners."""
+        from app.services import ChangeLogService
+
+        logged = ChangeLogService.reconcile()
+        for table_name, changes in logged.items():
+            click.echo(f"{table_name}: {changes} changes logged")
+        if not logged:
+            click.echo("entity_changes: up to date")
+
+    @app.cli.command("backfill-seniority")
+    def backfill_seniority() -> None:
+        """Reclassify stakeholder job titles into the indexed seniority column.
+
+        Run after changing the classifier or writing job titles outside the ORM.
+        """
+        from app.models import Stakeholder
+        from app.utils.stakeholder_utils import backfill_seniority
+
+        changed = backfill_seniority(Stakeholder)
+        for level, rows in sorted(changed.items()):
+            click.echo(f"{level}: {rows} stakeholders")
+        if not changed:
+            click.echo("stakeholders: seniority up to date")
+
+    @app.cli.command("snapshot-pipeline")
+    @click.option(
+        "--date",
+        "snapshot_date",
+        type=click.DateTime(formats=["%Y-%m-%d"]),
+        help="Day to record (default today). Re-running replaces that day.",
+    )
+    def snapshot_pipeline(snapshot_date) -> None:
+        """Write the daily pipeline snapshot - schedule once a day."""
+        from app.services import PipelineSnapshotService
+
+        day = snapshot_date.date() if snapshot_date else date.today()
+        rows = PipelineSnapshotService.take_snapshot(day)
+        click.echo(f"pipeline_snapshots: {rows} rows for {day.isoformat()}")
@@ -52,6 +52,49 @@ SQLALCHEMY_TRACK_MODIFICATIONS = False
 LOG_LEVEL = get_log_level()
 LOG_FILE = get_log_file()
 
+# Dashboard cache - seconds served fresh, then extra seconds served stale while refreshing
+DASHBOARD_CACHE_TTL = int(os.environ.get("DASHBOARD_CACHE_TTL", 60))
+DASHBOARD_CACHE_STALE_TTL = int(os.environ.get("DASHBOARD_CACHE_STALE_TTL", 300))
+
+# Entity index stats headers and filter bars, rendered once per data version
+FRAGMENT_CACHE_TTL = int(os.environ.get("FRAGMENT_CACHE_TTL", 60))
+FRAGMENT_CACHE_STALE_TTL = int(os.environ.get("FRAGMENT_CACHE_STALE_TTL", 300))
+
+# Forecast column arrays (also invalidated by opportunity writes)
+FORECAST_CACHE_TTL = int(os.environ.get("FORECAST_CACHE_TTL", 600))
+FORECAST_CACHE_STALE_TTL = int(os.environ.get("FORECAST_CACHE_STALE_TTL", 600))
+
+# Default byte limit of each in-process cache namespace
+CACHE_MAX_BYTES = int(os.environ.get("CACHE_MAX_BYTES", 32 * 1024 * 1024))
+
+# Shared cache tier reused across worker processes: "none", "sqlite" or "redis"
+CACHE_SHARED_BACKEND = os.environ.get("CACHE_SHARED_BACKEND", "none")
+# SQLite file path or redis:// URL of the shared tier, and its byte limit
+CACHE_SHARED_URL = os.environ.get("CACHE_SHARED_URL", "instance/cache.db")
+CACHE_SHARED_MAX_BYTES = int(os.environ.get("CACHE_SHARED_MAX_BYTES", 256 * 1024 * 1024))
+
+# Search and autocomplete results (also invalidated by writes to searched tables)
+SEARCH_CACHE_TTL = int(os.environ.get("SEARCH_CACHE_TTL", 30))
+
+# Rendered entity cards kept per process by the {% cache %} template tag
+CARD_CACHE_MAX_ENTRIES = int(os.environ.get("CARD_CACHE_MAX_ENTRIES", 20000))
+
+# Directory of compiled template bytecode, reused by restarted workers
+# ("" = a per-user temp directory, "none" = disabled)
+JINJA_BYTECODE_CACHE_DIR = os.environ.get("JINJA_BYTECODE_CACHE_DIR", "")
+
+# Largest number of items (creates + updates + deletes) in one bulk API request
+BULK_MAX_ITEMS = int(os.environ.get("BULK_MAX_ITEMS", 10000))
+
+# Largest page of a delta sync (/api/<table>/changes) and the default size
+CHANGES_MAX_LIMIT = int(os.environ.get("CHANGES_MAX_LIMIT", 1000))
+
+# Largest number of sub-requests in one /api/batch request
+BATCH_MAX_REQUESTS = int(os.environ.get("BATCH_MAX_REQUESTS", 50))
+
+# Rows inserted per transaction by file imports
+IMPORT_CHUNK_SIZE = int(os.environ.get("IMPORT_CHUNK_SIZE", 5000))
+
 # Development vs Production settings
 DEBUG = os.environ.get("FLASK_ENV") == "development"
 TESTING = os.environ.get("TESTING", "false").lower() == "true"
@@ -1,7 +1,12 @@
 """Dropdown configuration builders - DRY and reusable."""
 
 from dataclasses import dataclass
-from typing import Dict, Any, List, Optional
+from typing import Dict, Any, List, Optional, Tuple
+
+from app.services.cache_service import Cache, DataVersions
+
+# Options of choices_source dropdowns per source table, versioned by its writes
+source_options_cache = Cache("dropdowns", max_entries=None, shared=True)
 
 
 @dataclass
@@ -68,20 +73,10 @@ class DropdownBuilder:
             options = [{"value": "", "label": f'All {field_info["label"]}'}]
 
             # Handle dynamic choices from other models
-            if field_info.get("choices_source") == "users":
-                from app.models import User
-                users = User.query.order_by(User.name).all()
-                options.extend([
-                    {"value": str(user.id), "label": user.name}
-                    for user in users
-                ])
-            elif field_info.get("choices_source") == "companies":
-                from app.models import Company
-                companies = Company.query.order_by(Company.name).all()
-                options.extend([
-                    {"value": str(company.id), "label": company.name}
-                    for company in companies
-                ])
+            if field_info.get("choices_source") in ("users", "companies"):
+                options.extend(
+                    DropdownBuilder.source_options(field_info["choices_source"])
+                )
             elif field_info.get("choices"):
                 # Static choices defined in the model
                 options.extend(
@@ -235,6 +230,51 @@ class DropdownBuilder:
 
         return dropdowns
 
+    @staticmethod
+    def source_options(source: str) -> List[Dict[str, str]]:
+        """Get the options of a ``choices_source`` table, sorted by name.
+
+        Args:
+            source: Source table name, ``users`` or ``companies``.
+
+        Returns:
+            Option dictionaries, cached until the table is written.
+        """
+
+        def build() -> List[Dict[str, str]]:
+            from app.models import Company, User
+
+            model = {"users": User, "companies": Company}[source]
+            rows = model.query.with_entities(model.id, model.name).order_by(model.name)
+            return [{"value": str(row.id), "label": row.name} for row in rows]
+
+        return source_options_cache.get_or_compute(
+            source, build, version=DataVersions.get((source,))
+        )
+
+    @staticmethod
+    def source_tables(model: type) -> Tuple[str, ...]:
+        """Get the tables filter dropdown options are loaded from.
+
+        Args:
+            model: SQLAlchemy model class.
+
+        Returns:
+            Sorted table names of ``choices_source`` entities.
+        """
+        from app.services import MetadataService
+
+        metadata = MetadataService.get_field_metadata(model)
+        return tuple(
+            sorted(
+                {
+                    info["choices_source"]
+                    for info in metadata.values()
+                    if info.get("filterable") and info.get("choices_source")
+                }
+            )
+        )
+
     @classmethod
     def get_dropdown_options(
         cls, dropdown_type: str, entity_type: str = None
@@ -1,10 +1,12 @@
 """Entity statistics generation - DRY, configurable, extensible."""
 
 from dataclasses import dataclass
-from typing import List, Dict, Any, Optional, Callable
+from typing import List, Dict, Any, Optional, Callable, Mapping, Tuple
 from datetime import datetime, timedelta
-from sqlalchemy import func
+from sqlalchemy import and_, case, func, select
+from sqlalchemy.orm import aliased
 from app.models import db
+from app.models.enums import TaskStatus
 from app.utils.formatters import format_currency_short, format_percentage
 
 
@@ -33,14 +35,37 @@ class Stat:
         return str(self.value)
 
 
+def count_where(condition: Any) -> Any:
+    """Aggregate counting the rows that match a condition.
+
+    Args:
+        condition: SQL boolean expression.
+
+    Returns:
+        ``SUM(CASE WHEN condition THEN 1 ELSE 0 END)`` that is 0 on empty tables.
+    """
+    return func.coalesce(func.sum(case((condition, 1), else_=0)), 0)
+
+
 class StatsGenerator:
     """Generate statistics for entities with zero duplication.
 
+    Every stat for a model is a labelled column of a single aggregate
+    ``SELECT``, so a page render costs one query. Totals and stage/status
+    counts read the maintained entity counters instead of scanning rows;
+    only date and content based stats aggregate over the model's table.
+
     Attributes:
         model: SQLAlchemy model class.
         table_name: Database table name.
     """
 
+    # Other tables whose writes change a model's stats
+    RELATED_TABLES = {
+        "companies": ("opportunities",),
+        "users": ("opportunities", "tasks"),
+    }
+
     def __init__(self, model: type, table_name: str) -> None:
         """Initialize stats generator.
 
@@ -51,139 +76,194 @@ class StatsGenerator:
         self.model = model
         self.table_name = table_name
 
+    @property
+    def tables(self) -> Tuple[str, ...]:
+        """Tables the stats are computed from, for cache invalidation."""
+        return (self.table_name, *self.RELATED_TABLES.get(self.table_name, ()))
+
     def generate(self) -> List[Dict[str, Any]]:
         """Generate statistics based on entity type.
 
         Returns:
             List of stat dictionaries with value and label.
         """
-        stats = [self._total_stat()]
-
-        # Route to specific stat generators
+        # Route to specific stat generators - (aggregate columns, stat builder)
         generators = {
-            "companies": self._company_stats,
-            "stakeholders": self._stakeholder_stats,
-            "opportunities": self._opportunity_stats,
-            "tasks": self._task_stats,
-            "users": self._user_stats,
+            "companies": (self._company_columns, self._company_stats),
+            "stakeholders": (self._stakeholder_columns, self._stakeholder_stats),
+            "opportunities": (self._opportunity_columns, self._opportunity_stats),
+            "tasks": (self._task_columns, self._task_stats),
+            "users": (self._user_columns, self._user_stats),
         }
+        columns_for, stats_for = generators.get(self.table_name, (dict, None))
 
-        if generator := generators.get(self.table_name):
-            stats.extend(generator())
+        # No explicit FROM - counter-only stats must not run once per row
+        columns = {"total": self._counter(), **columns_for()}
+        row = db.session.execute(
+            select(*[column.label(name) for name, column in columns.items()])
+        ).one()._mapping
+
+        stats = [self._total_stat(row)]
+        if stats_for:
+            stats.extend(stats_for(row))
 
         return stats
 
-    def _total_stat(self) -> Stat:
+    def _counter(self, name: str = "total", table_name: Optional[str] = None) -> Any:
+        """Stored entity counter for this (or another) table.
+
+        Args:
+            name: Counter name, e.g. "total" or "stage:closed-won".
+            table_name: Counter table, defaults to this model's table.
+
+        Returns:
+            Scalar subquery reading the counter.
+        """
+        from app.services.counter_service import CounterService
+
+        return CounterService.counter(table_name or self.table_name, name)
+
+    def _total_stat(self, row: Mapping[str, Any]) -> Stat:
         """Generate total count stat.
 
+        Args:
+            row: Aggregate row for the model.
+
         Returns:
             Stat with total count.
         """
-        total = self.model.query.count()
         label = f"Total {self.model.get_display_name_plural()}"
-        return Stat(label=label, value=total)
+        return Stat(label=label, value=row["total"])
 
-    def _company_stats(self) -> List[Stat]:
-        """Generate company-specific statistics.
+    def _company_columns(self) -> Dict[str, Any]:
+        """Aggregate columns for company statistics.
 
         Returns:
-            List of company statistics.
+            Dictionary of column name to SQL expression.
         """
         from app.models import Opportunity
 
-        stats = []
-
-        # Active companies
-        active = (
-            db.session.query(func.count(func.distinct(self.model.id)))
-            .join(Opportunity)
-            .scalar()
-            or 0
+        has_opportunity = (
+            select(Opportunity.id).where(Opportunity.company_id == self.model.id).exists()
         )
-        stats.append(Stat(label="Active Companies", value=active))
-
-        # Total opportunities
-        total_opps = Opportunity.query.count()
-        stats.append(Stat(label="Total Opportunities", value=total_opps))
 
-        # Top industry
+        # Uncorrelated top industry lookup over an alias of the companies table
+        industries = aliased(self.model)
+        industry_count = func.count(industries.id)
         top_industry = (
-            db.session.query(self.model.industry, func.count(self.model.id))
-            .filter(self.model.industry.isnot(None))
-            .group_by(self.model.industry)
-            .order_by(func.count(self.model.id).desc())
-            .first()
+            select(industries.industry, industry_count)
+            .where(industries.industry.isnot(None))
+            .group_by(industries.industry)
+            .order_by(industry_count.desc())
+            .limit(1)
         )
 
-        if top_industry:
+        return {
+            "active": count_where(has_opportunity),
+            "opportunities": self._counter(table_name=Opportunity.__tablename__),
+            "top_industry": top_industry.with_only_columns(
+                industries.industry, maintain_column_froms=True
+            ).scalar_subquery(),
+            "top_industry_count": top_industry.with_only_columns(
+                industry_count, maintain_column_froms=True
+            ).scalar_subquery(),
+        }
+
+    def _company_stats(self, row: Mapping[str, Any]) -> List[Stat]:
+        """Generate company-specific statistics.
+
+        Args:
+            row: Aggregate row for the model.
+
+        Returns:
+            List of company statistics.
+        """
+        stats = [
+            Stat(label="Active Companies", value=row["active"]),
+            Stat(label="Total Opportunities", value=row["opportunities"]),
+        ]
+
+        # Top industry
+        if row["top_industry"]:
             stats.append(
-                Stat(label=f"In {top_industry[0].title()}", value=top_industry[1])
+                Stat(
+                    label=f"In {row['top_industry'].title()}",
+                    value=row["top_industry_count"],
+                )
             )
 
         return stats
 
-    def _stakeholder_stats(self) -> List[Stat]:
+    def _stakeholder_columns(self) -> Dict[str, Any]:
+        """Aggregate columns for stakeholder statistics.
+
+        Returns:
+            Dictionary of column name to SQL expression.
+        """
+        from app.utils.stakeholder_utils import DECISION_MAKER_LEVELS
+
+        return {
+            "decision_makers": sum(
+                self._counter(f"seniority:{level}") for level in DECISION_MAKER_LEVELS
+            ),
+            "with_email": func.count(self.model.email),
+            "companies": func.count(func.distinct(self.model.company_id)),
+        }
+
+    def _stakeholder_stats(self, row: Mapping[str, Any]) -> List[Stat]:
         """Generate stakeholder-specific statistics.
 
+        Args:
+            row: Aggregate row for the model.
+
         Returns:
             List of stakeholder statistics.
         """
-        stats = []
-
-        # Decision makers
-        decision_titles = [
-            "%CEO%",
-            "%CTO%",
-            "%CFO%",
-            "%President%",
-            "%VP%",
-            "%Director%",
-            "%Vice President%",
+        return [
+            Stat(label="Decision Makers", value=row["decision_makers"]),
+            Stat(label="With Email", value=row["with_email"]),
+            Stat(label="Companies", value=row["companies"]),
         ]
-        conditions = [self.model.job_title.ilike(title) for title in decision_titles]
-        decision_makers = self.model.query.filter(db.or_(*conditions)).count()
-        stats.append(Stat(label="Decision Makers", value=decision_makers))
-
-        # With email
-        with_email = self.model.query.filter(self.model.email.isnot(None)).count()
-        stats.append(Stat(label="With Email", value=with_email))
-
-        # Companies represented
-        companies = (
-            db.session.query(func.count(func.distinct(self.model.company_id))).scalar()
-            or 0
-        )
-        stats.append(Stat(label="Companies", value=companies))
 
-        return stats
+    def _opportunity_columns(self) -> Dict[str, Any]:
+        """Aggregate columns for opportunity statistics.
+
+        Returns:
+            Dictionary of column name to SQL expression.
+        """
+        return {
+            "total_value": func.coalesce(func.sum(self.model.value), 0),
+            "avg_value": func.coalesce(func.avg(self.model.value), 0),
+            "closed_won": self._counter("stage:closed-won"),
+            "closed_lost": self._counter("stage:closed-lost"),
+        }
 
-    def _opportunity_stats(self) -> List[Stat]:
+    def _opportunity_stats(self, row: Mapping[str, Any]) -> List[Stat]:
         """Generate opportunity-specific statistics.
 
+        Args:
+            row: Aggregate row for the model.
+
         Returns:
             List of opportunity statistics.
         """
-        stats = []
-
-        # Pipeline value
-        total_value = db.session.query(func.sum(self.model.value)).scalar() or 0
-        stats.append(
-            Stat(label="Pipeline Value", value=total_value, formatter=format_currency_short)
-        )
-
-        # Average deal size
-        avg_value = db.session.query(func.avg(self.model.value)).scalar() or 0
-        stats.append(
-            Stat(label="Avg Deal Size", value=avg_value, formatter=format_currency_short)
-        )
+        stats = [
+            Stat(
+                label="Pipeline Value",
+                value=row["total_value"],
+                formatter=format_currency_short,
+            ),
+            Stat(
+                label="Avg Deal Size",
+                value=row["avg_value"],
+                formatter=format_currency_short,
+            ),
+        ]
 
         # Win rate
-        closed_won = self.model.query.filter_by(stage="closed-won").count()
-        closed_lost = self.model.query.filter_by(stage="closed-lost").count()
-        total_closed = closed_won + closed_lost
-
+        total_closed = row["closed_won"] + row["closed_lost"]
         if total_closed > 0:
-            win_rate = (closed_won / total_closed) * 100
+            win_rate = (row["closed_won"] / total_closed) * 100
             stats.append(
                 Stat(label="Win Rate", value=win_rate, formatter=format_percentage)
             )
@@ -192,54 +272,65 @@ class StatsGenerator:
 
         return stats
 
-    def _task_stats(self) -> List[Stat]:
-        """Generate task-specific statistics.
+    def _task_columns(self) -> Dict[str, Any]:
+        """Aggregate columns for task statistics.
 
         Returns:
-            List of task statistics.
+            Dictionary of column name to SQL expression.
         """
-        stats = []
         now = datetime.now().date()
-
-        # Overdue
-        overdue = self.model.query.filter(
-            self.model.due_date < now, self.model.status != "completed"
-        ).count()
-        stats.append(Stat(label="Overdue", value=overdue))
-
-        # Due this week
         week_end = now + timedelta(days=7)
-        due_week = self.model.query.filter(
-            self.model.due_date.between(now, week_end), self.model.status != "completed"
-        ).count()
-        stats.append(Stat(label="Due This Week", value=due_week))
-
-        # Completed
-        completed = self.model.query.filter_by(status="completed").count()
-        stats.append(Stat(label="Completed", value=completed))
+        is_open = self.model.status != TaskStatus.COMPLETE.value
+
+        return {
+            "overdue": count_where(and_(self.model.due_date < now, is_open)),
+            "due_week": count_where(
+                and_(self.model.due_date.between(now, week_end), is_open)
+            ),
+            "completed": self._counter(f"status:{TaskStatus.COMPLETE.value}"),
+        }
 
-        return stats
+    def _task_stats(self, row: Mapping[str, Any]) -> List[Stat]:
+        """Generate task-specific statistics.
 
-    def _user_stats(self) -> List[Stat]:
-        """Generate user/team statistics.
+        Args:
+            row: Aggregate row for the model.
 
         Returns:
-            List of user statistics.
+            List of task statistics.
         """
-        from app.models import Task, Opportunity, User
+        return [
+            Stat(label="Overdue", value=row["overdue"]),
+            Stat(label="Due This Week", value=row["due_week"]),
+            Stat(label="Completed", value=row["completed"]),
+        ]
+
+    def _user_columns(self) -> Dict[str, Any]:
+        """Aggregate columns for user/team statistics.
 
-        stats = []
+        Returns:
+            Dictionary of column name to SQL expression.
+        """
+        from app.models import Task, Opportunity
 
-        # Total team members
-        team_members = User.query.count()
-        stats.append(Stat(label="Team Members", value=team_members))
+        tasks = Task.__tablename__
+        return {
+            "opportunities": self._counter(table_name=Opportunity.__tablename__),
+            "open_tasks": self._counter(table_name=tasks)
+            - self._counter(f"status:{TaskStatus.COMPLETE.value}", tasks),
+        }
 
-        # Total opportunities
-        total_opps = Opportunity.query.count()
-        stats.append(Stat(label="Total Opportunities", value=total_opps))
+    def _user_stats(self, row: Mapping[str, Any]) -> List[Stat]:
+        """Generate user/team statistics.
 
-        # Open tasks
-        open_tasks = Task.query.filter(Task.status != "complete").count()
-        stats.append(Stat(label="Open Tasks", value=open_tasks))
+        Args:
+            row: Aggregate row for the model.
 
-        return stats
+        Returns:
+            List of user statistics.
+        """
+        return [
+            Stat(label="Team Members", value=row["total"]),
+            Stat(label="Total Opportunities", value=row["opportunities"]),
+            Stat(label="Open Tasks", value=row["open_tasks"]),
+        ]
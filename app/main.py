@@ -6,10 +6,22 @@ from flask import Flask
 
 # Add project root to Python path
 sys.path.insert(0, str(Path(__file__).parent.parent))
-from app.models import db
+from app.models import db, Note, Stakeholder, User, MODEL_REGISTRY
 from app.routes.api import register_api_blueprints
 from app.routes.web import register_web_blueprints
+from app.services import (
+    ChangeLogService,
+    CounterService,
+    ProjectionService,
+    SerializationService,
+)
+from app.cli import register_cli_commands
+from app.utils.model_utils import backfill_updated_at, ensure_column, ensure_indexes
+from app.utils.stakeholder_utils import backfill_seniority, ensure_seniority_column
+from app.utils.json_utils import OrjsonProvider
 from app.utils.template_utils import badge_class, get_dashboard_action_buttons
+from app.utils.fragment_cache import FragmentCacheExtension
+from app.utils.template_cache import configure_bytecode_cache, precompile_templates
 from app.utils.formatters import format_number, format_currency, format_currency_short, format_percentage
 from app.utils.logging_config import setup_crm_logging, request_logging_middleware, get_crm_logger
 from app import config
@@ -18,6 +30,7 @@ from app import config
 def create_app():
     """Create and configure Flask application."""
     app = Flask(__name__, template_folder="templates", static_folder="static")
+    app.json = OrjsonProvider(app)
 
     # Initialize logging system first
     from app.logging_config import setup_logging
@@ -45,6 +58,8 @@ def create_app():
     # Global configuration
     app.url_map.strict_slashes = False
     app.jinja_env.add_extension("jinja2.ext.do")
+    app.jinja_env.add_extension(FragmentCacheExtension)
+    configure_bytecode_cache(app.jinja_env)
 
     # Template globals and filters
     def entity_url(entity, entity_type, action):
@@ -94,10 +109,24 @@ def create_app():
     # Register blueprints
     register_api_blueprints(app)
     register_web_blueprints(app)
+    register_cli_commands(app)
 
-    # Create tables
+    # Create tables and backfill read models for pre-existing data
     with app.app_context():
         db.create_all()
+        seniority_added = ensure_seniority_column(Stakeholder)
+        for model in (Note, User):
+            if ensure_column(model, "updated_at"):
+                backfill_updated_at(model)
+        for table in db.metadata.sorted_tables:
+            ensure_indexes(table)
+        ChangeLogService.ensure_built()
+        if seniority_added:
+            backfill_seniority(Stakeholder)
+        ProjectionService.ensure_built()
+        CounterService.ensure_built()
+        SerializationService.compile_all(MODEL_REGISTRY.values())
+        precompile_templates(app.jinja_env)
 
     return app
 
@@ -103,6 +103,10 @@ class LoggingMiddleware:
             if hasattr(response, 'content_length') and response.content_length:
                 return response.content_length
 
+            # Streamed responses would be buffered whole by get_data()
+            if response.is_streamed:
+                return 0
+
             # For dynamic content, try to get actual data length
             data = response.get_data()
             return len(data) if data else 0
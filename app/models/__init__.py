@@ -9,6 +9,16 @@ from .note import Note as Note  # noqa: E402
 from .opportunity import Opportunity as Opportunity  # noqa: E402
 from .task import Task as Task  # noqa: E402
 from .user import User, CompanyAccountTeam, OpportunityAccountTeam  # noqa: E402
+from .projections import (  # noqa: E402
+    CompanyCard,
+    StakeholderCard,
+    OpportunityCard,
+    TaskCard,
+    UserCard,
+)
+from .pipeline_snapshot import PipelineSnapshot  # noqa: E402
+from .entity_counter import EntityCounter  # noqa: E402
+from .entity_change import EntityChange, EntityTombstone  # noqa: E402
 
 # Single source of truth for model name-to-class mapping
 MODEL_REGISTRY = {
@@ -30,5 +40,14 @@ __all__ = [
     "User",
     "CompanyAccountTeam",
     "OpportunityAccountTeam",
+    "CompanyCard",
+    "StakeholderCard",
+    "OpportunityCard",
+    "TaskCard",
+    "UserCard",
+    "PipelineSnapshot",
+    "EntityCounter",
+    "EntityChange",
+    "EntityTombstone",
     "MODEL_REGISTRY",
 ]
@@ -2,7 +2,8 @@
 
 from . import db
 from typing import Dict, Any, List, Callable
-from sqlalchemy import event
+from sqlalchemy import event, inspect
+from sqlalchemy.orm import Session, object_session
 from app.utils.logging_config import get_crm_logger, log_database_operation
 import time
 
@@ -26,6 +27,7 @@ class BaseModel(db.Model):
     __search_config__ = {}
     __include_properties__: List[str] = []  # Additional properties for serialization
     __relationship_transforms__: Dict[str, Callable] = {}  # Custom transforms
+    __relationship_filters__: Dict[str, Dict[str, Any]] = {}  # Many-to-many filters
 
     # UI configuration
     __modal_size__ = "md"  # sm, md, lg, xl
@@ -35,6 +37,11 @@ class BaseModel(db.Model):
     __api_enabled__ = True  # Enable API endpoints
     __web_enabled__ = True  # Enable web pages
 
+    # List view configuration
+    __page_size__ = 50  # Rows rendered per list page
+    __defer_count__ = False  # Load list totals and stats via separate HTMX requests
+    __counted_columns__: tuple = ()  # Columns with a maintained per-value counter
+
     # Delegation to services - simple pass-through methods
     @classmethod
     def get_display_name(cls) -> str:
@@ -284,3 +291,123 @@ def log_after_delete(mapper, connection, target):
         entity_id=target.id if hasattr(target, 'id') else None,
         success=True
     )
+
+
+# Read-model projection maintenance (ProjectionService)
+@event.listens_for(BaseModel, 'after_insert', propagate=True)
+@event.listens_for(BaseModel, 'after_update', propagate=True)
+@event.listens_for(BaseModel, 'before_delete', propagate=True)
+def mark_projection_rows(mapper, connection, target):
+    """Queue card projection rows that depend on the written entity."""
+    from app.services.projection_service import ProjectionService
+
+    ProjectionService.mark_affected(connection, target)
+
+
+@event.listens_for(Session, 'after_flush')
+def refresh_projection_rows(session, flush_context):
+    """Refresh queued card projection rows in the flushing transaction."""
+    from app.services.projection_service import ProjectionService
+
+    ProjectionService.refresh_pending(session)
+
+
+# Entity counter maintenance (CounterService)
+@event.listens_for(BaseModel, 'mapper_configured', propagate=True)
+def track_counted_column_history(mapper, class_):
+    """Load the old value of counted columns on assignment so updates see transitions."""
+    for column in class_.__counted_columns__:
+        event.listen(getattr(class_, column), 'set', lambda *args: None, active_history=True)
+
+
+@event.listens_for(BaseModel, 'after_insert', propagate=True)
+def count_inserted(mapper, connection, target):
+    """Queue counter increments for an inserted entity."""
+    from app.services.counter_service import CounterService
+
+    CounterService.track(target, "insert")
+
+
+@event.listens_for(BaseModel, 'after_update', propagate=True)
+def count_updated(mapper, connection, target):
+    """Queue counter moves for counted column transitions (stage, status)."""
+    from app.services.counter_service import CounterService
+
+    CounterService.track(target, "update")
+
+
+@event.listens_for(BaseModel, 'before_delete', propagate=True)
+def count_deleted(mapper, connection, target):
+    """Queue counter decrements for a deleted entity."""
+    from app.services.counter_service import CounterService
+
+    CounterService.track(target, "delete")
+
+
+@event.listens_for(Session, 'after_flush')
+def apply_counter_deltas(session, flush_context):
+    """Apply queued counter deltas in the flushing transaction."""
+    from app.services.counter_service import CounterService
+
+    CounterService.apply_pending(session)
+
+
+@event.listens_for(Session, 'after_rollback')
+def discard_counter_deltas(session):
+    """Forget counter deltas of a rolled back flush."""
+    from app.services.counter_service import CounterService
+
+    CounterService.discard(session)
+
+
+# Change log for delta sync (ChangeLogService)
+@event.listens_for(BaseModel, 'after_insert', propagate=True)
+@event.listens_for(BaseModel, 'after_update', propagate=True)
+def log_upserted(mapper, connection, target):
+    """Queue a change log entry for an inserted or updated entity."""
+    from app.services.change_log_service import ChangeLogService
+
+    ChangeLogService.track(target, deleted=False)
+
+
+@event.listens_for(BaseModel, 'after_delete', propagate=True)
+def log_deleted(mapper, connection, target):
+    """Queue a change log entry and tombstone for a deleted entity."""
+    from app.services.change_log_service import ChangeLogService
+
+    ChangeLogService.track(target, deleted=True)
+
+
+def log_link_owners(mapper, connection, target):
+    """Queue change log entries for the entities a link row (e.g. an assignment) joins.
+
+    Registered on link models, which are not BaseModels. Old and new
+    foreign key values are logged so both owners of a moved row change.
+    """
+    from app.services.change_log_service import ChangeLogService
+
+    session = object_session(target)
+    if session is None:
+        return
+    state = inspect(target)
+    for column in mapper.columns:
+        for foreign_key in column.foreign_keys:
+            history = state.attrs[column.key].history
+            ids = {*history.added, *history.unchanged, *history.deleted} - {None}
+            ChangeLogService.track_ids(session, foreign_key.column.table.name, ids)
+
+
+@event.listens_for(Session, 'after_flush')
+def record_entity_changes(session, flush_context):
+    """Record queued entity changes in the flushing transaction."""
+    from app.services.change_log_service import ChangeLogService
+
+    ChangeLogService.apply_pending(session)
+
+
+@event.listens_for(Session, 'after_rollback')
+def discard_entity_changes(session):
+    """Forget entity changes of a rolled back flush."""
+    from app.services.change_log_service import ChangeLogService
+
+    ChangeLogService.discard(session)
@@ -57,6 +57,8 @@ class Company(BaseModel):
             for opp in self.opportunities
         ],
     }
+    # Relationships the transforms read, loaded for a whole list at once
+    __eager_relationships__ = ("stakeholders", "opportunities")
 
     id = db.Column(db.Integer, primary_key=True)
     name = db.Column(
@@ -179,6 +181,12 @@ class Company(BaseModel):
     # Relationships
     stakeholders = db.relationship("Stakeholder", back_populates="company", lazy=True)
     opportunities = db.relationship("Opportunity", back_populates="company", lazy=True)
+    card = db.relationship(
+        "CompanyCard",
+        primaryjoin="Company.id == foreign(CompanyCard.entity_id)",
+        uselist=False,
+        viewonly=True,
+    )  # Read-model projection maintained by ProjectionService
 
     def get_account_team(self) -> List[Dict[str, Any]]:
         """
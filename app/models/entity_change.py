@@ -0,0 +1,62 @@
+"""Change log and tombstones for delta sync."""
+
+from datetime import datetime
+from . import db
+
+
+class EntityChange(db.Model):
+    """
+    Latest write to an entity, positioned in a monotonic change sequence.
+
+    The log is compacted: each write to an entity moves its single row to a
+    new sequence number, so reading every row after a cursor yields each
+    changed entity once. Rows are written by ChangeLogService from the
+    BaseModel write listeners inside the writing transaction.
+
+    Attributes:
+        seq: Change sequence number, never reused (AUTOINCREMENT).
+        table_name: Entity table of the changed row.
+        entity_id: Id of the changed row.
+        changed_at: Time of the latest write.
+    """
+
+    __tablename__ = "entity_changes"
+    __api_enabled__ = False
+    __web_enabled__ = False
+    __table_args__ = (
+        db.UniqueConstraint("table_name", "entity_id"),
+        db.Index("ix_entity_changes_table_seq", "table_name", "seq"),
+        {"sqlite_autoincrement": True},
+    )
+
+    seq = db.Column(db.Integer, primary_key=True, autoincrement=True)
+    table_name = db.Column(db.String(50), nullable=False)
+    entity_id = db.Column(db.Integer, nullable=False)
+    changed_at = db.Column(db.DateTime, nullable=False, default=datetime.utcnow)
+
+    def __repr__(self) -> str:
+        return f"<EntityChange {self.seq} {self.table_name}:{self.entity_id}>"
+
+
+class EntityTombstone(db.Model):
+    """
+    Record of a deleted entity, written by the delete listeners.
+
+    Removed again if the database reuses the id for a new row.
+
+    Attributes:
+        table_name: Entity table of the deleted row.
+        entity_id: Id of the deleted row.
+        deleted_at: Time of deletion.
+    """
+
+    __tablename__ = "entity_tombstones"
+    __api_enabled__ = False
+    __web_enabled__ = False
+
+    table_name = db.Column(db.String(50), primary_key=True)
+    entity_id = db.Column(db.Integer, primary_key=True, autoincrement=False)
+    deleted_at = db.Column(db.DateTime, nullable=False, default=datetime.utcnow)
+
+    def __repr__(self) -> str:
+        return f"<EntityTombstone {self.table_name}:{self.entity_id}>"
@@ -0,0 +1,29 @@
+"""Incrementally maintained entity counters."""
+
+from . import db
+
+
+class EntityCounter(db.Model):
+    """
+    Running row count for an entity table, or for one value of a counted column.
+
+    Rows are adjusted by CounterService from the BaseModel write listeners
+    inside the writing transaction, so stats read a stored number instead
+    of running COUNT(*) over the entity table.
+
+    Attributes:
+        table_name: Entity table the counter belongs to.
+        name: "total", or "<column>:<value>" for a counted column value.
+        value: Current count.
+    """
+
+    __tablename__ = "entity_counters"
+    __api_enabled__ = False
+    __web_enabled__ = False
+
+    table_name = db.Column(db.String(50), primary_key=True)
+    name = db.Column(db.String(100), primary_key=True)
+    value = db.Column(db.Integer, nullable=False, default=0)
+
+    def __repr__(self) -> str:
+        return f"<EntityCounter {self.table_name}.{self.name}={self.value}>"
@@ -54,6 +54,16 @@ class OpportunityStage(str, Enum):
     CLOSED_LOST = "closed-lost"
 
 
+class Seniority(str, Enum):
+    """Stakeholder seniority levels classified from job titles."""
+
+    EXECUTIVE = "executive"
+    VP = "vp"
+    DIRECTOR = "director"
+    MANAGER = "manager"
+    INDIVIDUAL = "individual"
+
+
 class EntityType(str, Enum):
     """Entity types for relationships."""
 
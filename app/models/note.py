@@ -17,6 +17,7 @@ class Note(BaseModel):
         content: Note text content (required).
         is_internal: Whether note is internal-only or customer-facing.
         created_at: Note creation timestamp.
+        updated_at: Last modification timestamp.
         entity_type: Type of entity this note is attached to.
         entity_id: ID of the entity this note is attached to.
     """
@@ -30,6 +31,7 @@ class Note(BaseModel):
     content = db.Column(db.Text, nullable=False)
     is_internal = db.Column(db.Boolean, default=True)  # Internal vs external-facing
     created_at = db.Column(db.DateTime, default=datetime.utcnow)
+    updated_at = db.Column(db.DateTime, default=datetime.utcnow, onupdate=datetime.utcnow)
 
     # Polymorphic relationship - can attach to any entity
     entity_type = db.Column(
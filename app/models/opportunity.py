@@ -19,6 +19,7 @@ class Opportunity(BaseModel):
 
     __tablename__ = "opportunities"
     __display_name__ = "Opportunity"
+    __counted_columns__ = ("stage",)
     __search_config__ = {
         "subtitle_fields": ["value", "stage"],
         "relationships": [("company", "name")],
@@ -65,12 +66,13 @@ class Opportunity(BaseModel):
             "unit": "%",
             "min_value": 0,
             "max_value": 100,
+            "filter_type": "range",  # Filter on choice buckets, not raw values
             "choices": {
-                "0-20": {"label": "0-20%", "description": "Very low probability"},
-                "21-40": {"label": "21-40%", "description": "Low probability"},
-                "41-60": {"label": "41-60%", "description": "Medium probability"},
-                "61-80": {"label": "61-80%", "description": "High probability"},
-                "81-100": {"label": "81-100%", "description": "Very high probability"},
+                "0-20": {"label": "0-20%", "description": "Very low probability", "max": 20},
+                "21-40": {"label": "21-40%", "description": "Low probability", "min": 21, "max": 40},
+                "41-60": {"label": "41-60%", "description": "Medium probability", "min": 41, "max": 60},
+                "61-80": {"label": "61-80%", "description": "High probability", "min": 61, "max": 80},
+                "81-100": {"label": "81-100%", "description": "Very high probability", "min": 81},
             },
         },
     )
@@ -116,9 +118,16 @@ class Opportunity(BaseModel):
     company_id = db.Column(
         db.Integer,
         db.ForeignKey("companies.id", ondelete="CASCADE"),
+        index=True,
         info={"display_label": "Company", "form_include": True, "required": True},
     )
     company = db.relationship("Company", back_populates="opportunities")
+    card = db.relationship(
+        "OpportunityCard",
+        primaryjoin="Opportunity.id == foreign(OpportunityCard.entity_id)",
+        uselist=False,
+        viewonly=True,
+    )  # Read-model projection maintained by ProjectionService
 
     comments = db.Column(
         db.Text, info={"display_label": "Comments", "form_include": True, "rows": 3, "sortable": False}
@@ -159,15 +168,20 @@ class Opportunity(BaseModel):
 
     def get_probability_range(self):
         """Get the probability range for grouping and filtering."""
-        if self.probability is None:
+        return self.probability_range(self.probability)
+
+    @staticmethod
+    def probability_range(probability):
+        """Get the probability range of a probability value."""
+        if probability is None:
             return "0-20%"
-        elif self.probability <= 20:
+        elif probability <= 20:
             return "0-20%"
-        elif self.probability <= 40:
+        elif probability <= 40:
             return "21-40%"
-        elif self.probability <= 60:
+        elif probability <= 60:
             return "41-60%"
-        elif self.probability <= 80:
+        elif probability <= 80:
             return "61-80%"
         else:
             return "81-100%"
@@ -0,0 +1,53 @@
+"""Daily pipeline snapshot time series."""
+
+from datetime import datetime
+from . import db
+
+
+class PipelineSnapshot(db.Model):
+    """
+    Daily pipeline aggregate for one stage, industry or owner.
+
+    Rows are written by PipelineSnapshotService once per day so trend
+    charts read a compact series instead of recomputing from opportunities.
+
+    Attributes:
+        snapshot_date: Day the figures describe.
+        dimension: Breakdown the row belongs to (stage, industry or owner).
+        key: Stage or industry value, or owner user id ("none" when unset).
+        label: Display label at snapshot time (owner names may change later).
+        opportunity_count: Number of opportunities in the bucket.
+        total_value: Sum of opportunity values.
+        weighted_value: Sum of value weighted by win probability.
+    """
+
+    __tablename__ = "pipeline_snapshots"
+    __api_enabled__ = False  # Exposed through /api/pipeline/snapshots
+    __web_enabled__ = False
+    __table_args__ = (
+        db.UniqueConstraint("snapshot_date", "dimension", "key"),
+        db.Index("ix_pipeline_snapshots_dimension_date", "dimension", "snapshot_date"),
+    )
+
+    id = db.Column(db.Integer, primary_key=True)
+    snapshot_date = db.Column(db.Date, nullable=False)
+    dimension = db.Column(db.String(20), nullable=False)
+    key = db.Column(db.String(100), nullable=False)
+    label = db.Column(db.String(255))
+    opportunity_count = db.Column(db.Integer, nullable=False, default=0)
+    total_value = db.Column(db.Float, nullable=False, default=0)
+    weighted_value = db.Column(db.Float, nullable=False, default=0)
+    created_at = db.Column(db.DateTime, default=datetime.utcnow)
+
+    def to_point(self):
+        """Convert to a time series point for JSON serialization"""
+        return {
+            "date": self.snapshot_date.isoformat(),
+            "count": self.opportunity_count,
+            "value": self.total_value,
+            "weighted_value": self.weighted_value,
+        }
+
+    def __repr__(self) -> str:
+        """Return string representation of the snapshot row."""
+        return f"<PipelineSnapshot {self.snapshot_date} {self.dimension}={self.key}>"
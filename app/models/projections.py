@@ -0,0 +1,74 @@
+"""Read-model projection tables for entity list cards.
+
+Each table holds the denormalized fields an entity card needs from other
+tables, keyed by the source entity id. Rows are maintained by
+ProjectionService from the BaseModel write listeners - never edit directly.
+"""
+
+from datetime import datetime
+from . import db
+
+
+class ProjectionModel(db.Model):
+    """Base for card projection tables - one row per source entity."""
+
+    __abstract__ = True
+    __source__ = None  # REQUIRED: source entity table name, e.g. "companies"
+
+    # No foreign key so the source row can be deleted before its card
+    entity_id = db.Column(db.Integer, primary_key=True, autoincrement=False)
+    refreshed_at = db.Column(db.DateTime, default=datetime.utcnow, nullable=False)
+
+
+class CompanyCard(ProjectionModel):
+    """Pipeline, stakeholder and account team rollups for company cards."""
+
+    __tablename__ = "company_cards"
+    __source__ = "companies"
+
+    pipeline_value = db.Column(db.Float, nullable=False, default=0)
+    active_opportunities = db.Column(db.Integer, nullable=False, default=0)
+    stakeholders = db.Column(db.Integer, nullable=False, default=0)
+    account_team = db.Column(db.Integer, nullable=False, default=0)
+
+
+class StakeholderCard(ProjectionModel):
+    """Company name, open opportunities and MEDDPICC roles for stakeholder cards."""
+
+    __tablename__ = "stakeholder_cards"
+    __source__ = "stakeholders"
+
+    company_name = db.Column(db.String(255))
+    active_opportunities = db.Column(db.Integer, nullable=False, default=0)
+    meddpicc_roles = db.Column(db.Text)  # Comma-separated role names, unordered (sort on read)
+
+
+class OpportunityCard(ProjectionModel):
+    """Company name for opportunity cards and company grouping."""
+
+    __tablename__ = "opportunity_cards"
+    __source__ = "opportunities"
+
+    company_name = db.Column(db.String(255))
+
+
+class TaskCard(ProjectionModel):
+    """Subtask progress for multi-task cards."""
+
+    __tablename__ = "task_cards"
+    __source__ = "tasks"
+
+    child_tasks = db.Column(db.Integer, nullable=False, default=0)
+    completed_child_tasks = db.Column(db.Integer, nullable=False, default=0)
+
+
+class UserCard(ProjectionModel):
+    """Assignment counts and owned pipeline for team member cards."""
+
+    __tablename__ = "user_cards"
+    __source__ = "users"
+
+    assigned_companies = db.Column(db.Integer, nullable=False, default=0)
+    assigned_opportunities = db.Column(db.Integer, nullable=False, default=0)
+    total_pipeline = db.Column(db.Float, nullable=False, default=0)
+    stakeholder_relationships = db.Column(db.Integer, nullable=False, default=0)
@@ -1,6 +1,8 @@
 from datetime import datetime
+from sqlalchemy import event
 from . import db
 from .base import BaseModel
+from ..utils.stakeholder_utils import classify_seniority, get_seniority_choices
 
 
 # Many-to-many table for stakeholder MEDDPICC roles
@@ -34,6 +36,7 @@ stakeholder_opportunities = db.Table(
         db.Integer,
         db.ForeignKey("opportunities.id"),
         primary_key=True,
+        index=True,  # Second key column; lookups by opportunity need their own index
     ),
     db.Column("created_at", db.DateTime, default=datetime.utcnow),
 )
@@ -52,6 +55,7 @@ class Stakeholder(BaseModel):
         id: Primary key identifier.
         name: Stakeholder full name (required).
         job_title: Professional title/position.
+        seniority: Level classified from job_title on write (indexed).
         email: Primary email address.
         phone: Contact phone number.
         company_id: Associated company foreign key.
@@ -60,6 +64,7 @@ class Stakeholder(BaseModel):
 
     __tablename__ = "stakeholders"
     __display_name__ = "Stakeholder"
+    __counted_columns__ = ("seniority",)
     __search_config__ = {
         "subtitle_fields": ["job_title", "email"],
         "relationships": [("company", "name")],
@@ -74,6 +79,7 @@ class Stakeholder(BaseModel):
     __relationship_transforms__ = {
         "meddpicc_roles": lambda self: self.get_meddpicc_role_names(),
         "relationship_owners": lambda self: self.get_relationship_owners(),
+        "company_name": lambda self: self.company.name if self.company else None,
         "opportunities": lambda self: [
             {
                 "id": opp.id,
@@ -83,6 +89,19 @@ class Stakeholder(BaseModel):
             for opp in self.opportunities
         ],
     }
+    # Relationships the transforms read, loaded for a whole list at once
+    __eager_relationships__ = ("company", "relationship_owners", "opportunities")
+
+    # Filterable many-to-many relationships (QueryService / MetadataService)
+    __relationship_filters__ = {
+        "relationship_owners": {
+            "label": "Relationship Owner",
+            "secondary": stakeholder_relationship_owners,
+            "column": "user_id",
+            "choices_source": "users",
+            "empty_label": "No Owner",
+        }
+    }
 
     id = db.Column(db.Integer, primary_key=True)
     name = db.Column(
@@ -110,6 +129,15 @@ class Stakeholder(BaseModel):
             },
         },
     )  # Their actual job: "VP Sales", "CTO", etc.
+    seniority = db.Column(
+        db.String(20),
+        index=True,
+        info={
+            "display_label": "Seniority",
+            "form_exclude": True,  # Derived from job_title
+            "choices": get_seniority_choices(),
+        },
+    )
 
     # Virtual field for forms only - MEDDPICC roles are stored in junction table
     meddpicc_role = db.Column(
@@ -163,6 +191,7 @@ class Stakeholder(BaseModel):
         db.Integer,
         db.ForeignKey("companies.id", ondelete="CASCADE"),
         nullable=False,
+        index=True,
         info={
             "display_label": "Company",
             "groupable": True,
@@ -194,6 +223,12 @@ class Stakeholder(BaseModel):
     opportunities = db.relationship(
         "Opportunity", secondary=stakeholder_opportunities, backref="stakeholders"
     )
+    card = db.relationship(
+        "StakeholderCard",
+        primaryjoin="Stakeholder.id == foreign(StakeholderCard.entity_id)",
+        uselist=False,
+        viewonly=True,
+    )  # Read-model projection maintained by ProjectionService
 
     def get_meddpicc_role_names(self):
         """Get list of MEDDPICC role names for this stakeholder"""
@@ -223,6 +258,7 @@ class Stakeholder(BaseModel):
                 created_at=datetime.utcnow(),
             )
             db.session.execute(insert_stmt)
+            self._record_role_write()
             db.session.commit()
 
     def remove_meddpicc_role(self, role_name):
@@ -232,8 +268,26 @@ class Stakeholder(BaseModel):
             & (stakeholder_meddpicc_roles.c.meddpicc_role == role_name)
         )
         db.session.execute(delete_stmt)
+        self._record_role_write()
         db.session.commit()
 
+    def clear_meddpicc_roles(self):
+        """Remove all MEDDPICC roles from this stakeholder (caller commits)"""
+        delete_stmt = stakeholder_meddpicc_roles.delete().where(
+            stakeholder_meddpicc_roles.c.stakeholder_id == self.id
+        )
+        db.session.execute(delete_stmt)
+        self._record_role_write()
+
+    def _record_role_write(self):
+        """Log this stakeholder and refresh its card after a direct role table write"""
+        from app.services.change_log_service import ChangeLogService
+        from app.services.projection_service import ProjectionService
+        from .projections import StakeholderCard
+
+        ChangeLogService.record_link_write(db.session, {"stakeholders": [self.id]})
+        ProjectionService.refresh(db.session.connection(), StakeholderCard, [self.id])
+
     def get_relationship_owners(self):
         """Get all users who own relationships with this stakeholder"""
         return [
@@ -250,15 +304,6 @@ class Stakeholder(BaseModel):
             self.relationship_owners.append(user)
             db.session.commit()
 
-    def to_dict(self):
-        """Convert stakeholder to dictionary for JSON serialization"""
-        result = super().to_dict()
-
-        # Add computed company name
-        result["company_name"] = self.company.name if self.company else None
-
-        return result
-
     def to_display_dict(self):
         """Convert stakeholder to dictionary with pre-formatted display fields"""
         # For now, just return the base dictionary
@@ -286,3 +331,9 @@ class Stakeholder(BaseModel):
 
 
 # MeddpiccRole class removed - roles are stored as strings in junction table for simplicity
+
+
+@event.listens_for(Stakeholder.job_title, "set")
+def classify_job_title(target, value, oldvalue, initiator):
+    """Keep the stored seniority in step with the job title."""
+    target.seniority = classify_seniority(value)
@@ -32,6 +32,7 @@ class Task(BaseModel):
     __tablename__ = "tasks"
     __display_name__ = "Task"
     __display_field__ = "description"
+    __counted_columns__ = ("status",)
     __search_config__ = {
         "title_field": "description",
         "subtitle_fields": ["due_date", "priority", "status"],
@@ -146,7 +147,7 @@ class Task(BaseModel):
             },
         },
     )
-    parent_task_id = db.Column(db.Integer, db.ForeignKey("tasks.id"))
+    parent_task_id = db.Column(db.Integer, db.ForeignKey("tasks.id"), index=True)
     sequence_order = db.Column(db.Integer, default=0)
     dependency_type = db.Column(
         db.String(20),
@@ -178,6 +179,12 @@ class Task(BaseModel):
         order_by="Task.sequence_order",
         lazy="select",
     )
+    card = db.relationship(
+        "TaskCard",
+        primaryjoin="Task.id == foreign(TaskCard.entity_id)",
+        uselist=False,
+        viewonly=True,
+    )  # Read-model projection maintained by ProjectionService
 
     # Properties using utility functions
     is_overdue = property(
@@ -1,6 +1,7 @@
 from datetime import datetime, date
+from sqlalchemy import event
 from . import db
-from .base import BaseModel
+from .base import BaseModel, log_link_owners, mark_projection_rows
 
 
 class User(BaseModel):
@@ -17,6 +18,7 @@ class User(BaseModel):
         email: Unique email address.
         job_title: Professional title/role (single source of truth).
         created_at: User creation timestamp.
+        updated_at: Last modification timestamp.
     """
 
     __tablename__ = "users"
@@ -71,6 +73,19 @@ class User(BaseModel):
     created_at = db.Column(
         db.DateTime, default=datetime.utcnow, info={"display_label": "Created At"}
     )
+    updated_at = db.Column(
+        db.DateTime,
+        default=datetime.utcnow,
+        onupdate=datetime.utcnow,
+        info={"display_label": "Updated At"},
+    )
+
+    card = db.relationship(
+        "UserCard",
+        primaryjoin="User.id == foreign(UserCard.entity_id)",
+        uselist=False,
+        viewonly=True,
+    )  # Read-model projection maintained by ProjectionService
 
     def get_company_assignments(self):
         """Get all companies this user is assigned to"""
@@ -121,7 +136,10 @@ class CompanyAccountTeam(db.Model):
         db.Integer, db.ForeignKey("users.id", ondelete="CASCADE"), primary_key=True
     )
     company_id = db.Column(
-        db.Integer, db.ForeignKey("companies.id", ondelete="CASCADE"), primary_key=True
+        db.Integer,
+        db.ForeignKey("companies.id", ondelete="CASCADE"),
+        primary_key=True,
+        index=True,
     )
     created_at = db.Column(db.DateTime, default=datetime.utcnow)
 
@@ -169,6 +187,7 @@ class OpportunityAccountTeam(db.Model):
         db.Integer,
         db.ForeignKey("opportunities.id", ondelete="CASCADE"),
         primary_key=True,
+        index=True,
     )
     created_at = db.Column(db.DateTime, default=datetime.utcnow)
 
@@ -200,3 +219,12 @@ class OpportunityAccountTeam(db.Model):
     def __repr__(self) -> str:
         """Return string representation of the opportunity account team assignment."""
         return f"<OpportunityAccountTeam {self.user.name if self.user else 'Unknown'} → {self.opportunity.name if self.opportunity else 'Unknown'}>"
+
+
+# Assignment rows feed company and user card projections
+for assignment_model in (CompanyAccountTeam, OpportunityAccountTeam):
+    for event_name in ("after_insert", "after_update", "before_delete"):
+        event.listen(assignment_model, event_name, mark_projection_rows)
+    # ...and the serialized forms (change log) of the entities they join
+    for event_name in ("after_insert", "after_update", "after_delete"):
+        event.listen(assignment_model, event_name, log_link_owners)
@@ -3,6 +3,7 @@ from .entities import api_entities_bp
 from .notes import api_notes_bp
 from .tasks import tasks_api_bp
 from .forms import forms_api
+from .pipeline import api_pipeline_bp
 
 
 def register_api_blueprints(app):
@@ -12,3 +13,4 @@ def register_api_blueprints(app):
     app.register_blueprint(api_notes_bp)
     app.register_blueprint(tasks_api_bp)
     app.register_blueprint(forms_api)
+    app.register_blueprint(api_pipeline_bp)
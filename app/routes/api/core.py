@@ -4,9 +4,126 @@ Core API routes for the CRM application.
 This module provides core API endpoints for the CRM system.
 """
 
-from flask import Blueprint
+from typing import Any, Dict, Optional
+from urllib.parse import urlsplit
+
+from flask import Blueprint, Response, current_app, jsonify, request
+from sqlalchemy import event
+from werkzeug.exceptions import HTTPException
+
+from app import config
+from app.models import db
+from app.services import Cache
+from app.utils.logging_config import get_crm_logger
 
 api_core_bp = Blueprint("api_core", __name__, url_prefix="/api")
 
+logger = get_crm_logger(__name__)
+
+# Methods a batch sub-request may use
+BATCH_METHODS = ("GET", "POST", "PUT", "DELETE")
+
+
+@api_core_bp.route("/batch", methods=["POST"])
+def batch():
+    """Run several API requests in one round trip.
+
+    The body is ``{"requests": [{"method", "path", "body", "headers"}, ...]}``
+    where only ``path`` is required. Sub-requests run in order, in-process,
+    on this request's database session, so an entity loaded by one is served
+    from the identity map to the next. Responds 200 with one
+    ``{"status", "headers", "body"}`` per sub-request.
+    """
+    data = request.get_json(silent=True)
+    items = data.get("requests") if isinstance(data, dict) else None
+    if not isinstance(items, list):
+        return jsonify({"error": "Request body must be an object with a requests array"}), 400
+    if len(items) > config.BATCH_MAX_REQUESTS:
+        return jsonify({"error": f"At most {config.BATCH_MAX_REQUESTS} requests per batch"}), 413
+
+    # The identity map holds entities weakly; pin them as they load so later
+    # sub-requests find them there instead of selecting them again
+    session = db.session()
+    loaded = set()
+
+    def pin(session, instance):
+        loaded.add(instance)
+
+    event.listen(session, "loaded_as_persistent", pin)
+    try:
+        responses = [_dispatch(item) for item in items]
+    finally:
+        event.remove(session, "loaded_as_persistent", pin)
+
+    return jsonify({"responses": responses})
+
+
+@api_core_bp.route("/cache/stats", methods=["GET"])
+def cache_stats():
+    """Report hit/miss metrics and sizes of every cache namespace."""
+    return jsonify(Cache.all_stats())
+
+
+def _invalid(item: Any) -> Optional[str]:
+    """Describe what is wrong with a sub-request, or None if it can run."""
+    if not isinstance(item, dict) or not isinstance(item.get("path"), str):
+        return "Each request must be an object with a path"
+    path = urlsplit(item["path"]).path
+    if not path.startswith("/api/") or path.rstrip("/") == "/api/batch":
+        return "path must be an API path other than /api/batch"
+    if str(item.get("method", "GET")).upper() not in BATCH_METHODS:
+        return f"method must be one of {', '.join(BATCH_METHODS)}"
+    if not isinstance(item.get("headers", {}), dict):
+        return "headers must be an object"
+    return None
+
+
+def _dispatch(item: Any) -> Dict[str, Any]:
+    """Run one sub-request through the URL map and its view function.
+
+    The request context shares the batch's app context and with it the
+    scoped session. Request hooks (logging) run once for the whole batch.
+    """
+    error = _invalid(item)
+    if error:
+        return {"status": 400, "headers": {}, "body": {"error": error}}
+
+    app = current_app._get_current_object()
+    with app.test_request_context(
+        item["path"],
+        method=str(item.get("method", "GET")).upper(),
+        json=item.get("body"),
+        headers=item.get("headers") or {},
+    ):
+        try:
+            try:
+                rv = app.dispatch_request()
+            except Exception as e:
+                rv = app.handle_user_exception(e)
+            if isinstance(rv, HTTPException):
+                return {"status": rv.code, "headers": {}, "body": {"error": rv.description}}
+            return _payload(app.make_response(rv))
+        except Exception as e:
+            db.session.rollback()
+            logger.error(
+                "Batch sub-request failed",
+                extra={
+                    "custom_fields": {
+                        "operation": "batch",
+                        "path": item["path"],
+                        "error": str(e),
+                    }
+                },
+                exc_info=True,
+            )
+            return {"status": 500, "headers": {}, "body": {"error": "Internal server error"}}
+
 
-# Placeholder for future core API endpoints
+def _payload(response: Response) -> Dict[str, Any]:
+    """Represent a sub-request response inside the batch body."""
+    headers = {key: value for key, value in response.headers.items() if key != "Content-Length"}
+    if response.is_json:
+        body = response.get_json(silent=True)
+    else:
+        body = response.get_data(as_text=True) or None
+    return {"status": response.status_code, "headers": headers, "body": body}
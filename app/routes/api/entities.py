@@ -7,6 +7,11 @@ from app.utils.entity_crud import (
     create_entity,
     update_entity,
     delete_entity,
+    bulk_write_entities,
+    get_entity_changes,
+    export_entities,
+    start_import,
+    get_import_progress,
 )
 from app.utils.task_crud import create_single_task, create_multi_task
 
@@ -21,6 +26,38 @@ def create_route_handlers():
 
         table_name = model_class.__tablename__
 
+        # Bulk endpoint - before the Task skip, tasks have no custom bulk form
+        api_entities_bp.add_url_rule(
+            f"/{table_name}/bulk",
+            endpoint=f"bulk_{table_name}",
+            view_func=lambda m=model_class: bulk_write_entities(m, request.get_json()),
+            methods=["POST"],
+        )
+
+        # Delta sync endpoint - shared by tasks as well
+        api_entities_bp.add_url_rule(
+            f"/{table_name}/changes",
+            endpoint=f"changes_{table_name}",
+            view_func=lambda m=model_class: get_entity_changes(m),
+            methods=["GET"],
+        )
+
+        # Columnar export endpoint - shared by tasks as well
+        api_entities_bp.add_url_rule(
+            f"/{table_name}/export",
+            endpoint=f"export_{table_name}",
+            view_func=lambda m=model_class: export_entities(m),
+            methods=["GET"],
+        )
+
+        # File import endpoint - shared by tasks as well
+        api_entities_bp.add_url_rule(
+            f"/{table_name}/import",
+            endpoint=f"import_{table_name}",
+            view_func=lambda m=model_class: start_import(m),
+            methods=["POST"],
+        )
+
         # Skip Task - has custom handlers
         if table_name == "tasks":
             continue
@@ -118,6 +155,12 @@ def delete_task(entity_id):
     return jsonify(delete_entity(Task, entity_id))
 
 
+@api_entities_bp.route("/imports/<job_id>", methods=["GET"])
+def get_import(job_id):
+    """Get import job progress."""
+    return get_import_progress(job_id)
+
+
 @api_entities_bp.route("/validate/<entity_type>/<field_name>", methods=["POST"])
 def validate_field(entity_type, field_name):
     """Validate a specific field value - useful for form validation."""
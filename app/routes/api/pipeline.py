@@ -0,0 +1,75 @@
+"""
+Pipeline trend and forecast API routes.
+
+Serves the daily pipeline snapshot series written by the
+``snapshot-pipeline`` command and the vectorized pipeline forecast.
+"""
+
+from datetime import date, timedelta
+from flask import Blueprint, request, jsonify
+from app.services import ForecastService, PipelineSnapshotService
+from app.services.pipeline_snapshot_service import DIMENSIONS
+
+api_pipeline_bp = Blueprint("api_pipeline", __name__, url_prefix="/api/pipeline")
+
+# Default trend window when no start date is given
+DEFAULT_DAYS = 90
+
+# Forecast request bounds
+MAX_FORECAST_MONTHS = 36
+MAX_SIMULATIONS = 100000
+
+
+@api_pipeline_bp.route("/snapshots")
+def get_snapshots():
+    """Get the daily pipeline series for one dimension.
+
+    Query args: dimension (stage, industry or owner; default stage),
+    start and end (ISO dates; default the last 90 days) and key
+    (comma-separated bucket keys).
+    """
+    dimension = request.args.get("dimension", "stage")
+    if dimension not in DIMENSIONS:
+        return jsonify({"error": f"dimension must be one of {', '.join(DIMENSIONS)}"}), 400
+
+    try:
+        end = date.fromisoformat(request.args.get("end", date.today().isoformat()))
+        start = date.fromisoformat(
+            request.args.get("start", (end - timedelta(days=DEFAULT_DAYS)).isoformat())
+        )
+    except ValueError:
+        return jsonify({"error": "start and end must be ISO dates (YYYY-MM-DD)"}), 400
+
+    keys = [key for key in request.args.get("key", "").split(",") if key]
+    series = PipelineSnapshotService.get_series(dimension, start, end, keys)
+
+    return jsonify(
+        {
+            "dimension": dimension,
+            "start": start.isoformat(),
+            "end": end.isoformat(),
+            "series": series,
+        }
+    )
+
+
+@api_pipeline_bp.route("/forecast")
+def get_forecast():
+    """Get the weighted pipeline by close month, stage conversion and scenarios.
+
+    Query args: months (close months to forecast; default 6), simulations
+    (Monte Carlo scenarios; default 1000) and seed (for reproducible
+    scenarios).
+    """
+    months = request.args.get("months", 6, type=int)
+    simulations = request.args.get("simulations", 1000, type=int)
+    seed = request.args.get("seed", type=int)
+
+    if not 1 <= months <= MAX_FORECAST_MONTHS:
+        return jsonify({"error": f"months must be between 1 and {MAX_FORECAST_MONTHS}"}), 400
+    if not 1 <= simulations <= MAX_SIMULATIONS:
+        return jsonify({"error": f"simulations must be between 1 and {MAX_SIMULATIONS}"}), 400
+    if seed is not None and seed < 0:
+        return jsonify({"error": "seed must be a non-negative integer"}), 400
+
+    return jsonify(ForecastService.forecast(months, simulations, seed))
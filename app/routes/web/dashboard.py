@@ -1,10 +1,13 @@
 from datetime import datetime, date, timedelta
 import logging
-from flask import Blueprint, render_template, request, jsonify
+import time
+from flask import Blueprint, render_template, request, jsonify, abort, make_response
 from app.models import db, Task
+from app.utils.logging_config import get_crm_logger
 from .dashboard_service import DashboardService
 
 dashboard_bp = Blueprint("dashboard", __name__)
+logger = get_crm_logger(__name__)
 
 
 @dashboard_bp.route("/")
@@ -12,13 +15,49 @@ def index():
     """
     Dashboard index page showing pipeline overview and recent activity.
 
-    Uses DashboardService to aggregate all dashboard data in a clean,
-    maintainable way.
+    Renders only the page shell; every section is loaded in parallel from
+    its own endpoint so the slowest section never delays the first paint.
     """
-    context = DashboardService.get_dashboard_data()
+    context = {
+        "sections": DashboardService.get_sections(),
+        "entity_types": DashboardService.get_entity_buttons(),
+    }
     return render_template("dashboard/index.html", **context)
 
 
+@dashboard_bp.route("/dashboard/sections/<key>")
+def section(key):
+    """
+    Render one dashboard section from its own cache.
+
+    Data is cached per day and shared by all users. Build time and cache
+    status are reported in the Server-Timing header and the request log.
+    """
+    dashboard_section = DashboardService.get_section(key)
+    if dashboard_section is None:
+        abort(404)
+
+    started = time.perf_counter()
+    context, cache_status = DashboardService.get_section_data(dashboard_section)
+    response = make_response(render_template(dashboard_section.template, **context))
+    duration_ms = (time.perf_counter() - started) * 1000
+
+    response.headers["Server-Timing"] = (
+        f'section;desc="{key}";dur={duration_ms:.1f}, cache;desc="{cache_status}"'
+    )
+    logger.info(
+        f"Dashboard section {key} rendered",
+        extra={
+            "custom_fields": {
+                "dashboard_section": key,
+                "cache_status": cache_status,
+                "duration_ms": round(duration_ms, 1),
+            }
+        },
+    )
+    return response
+
+
 @dashboard_bp.route("/tasks/<int:task_id>/complete", methods=["POST"])
 def complete_task(task_id):
     """Mark a task as complete."""
@@ -5,26 +5,75 @@ Service layer for dashboard-specific business logic and aggregations.
 Centralizes dashboard data fetching and processing to keep routes clean.
 """
 
-from typing import Dict, Any, List
+from typing import Dict, Any, List, Optional, Callable, Tuple
+from dataclasses import dataclass, field
 from datetime import date
-from app.models import Task, Opportunity, Note
+from app import config
+from app.models import Task, Opportunity, MODEL_REGISTRY
+from app.services import DataVersions, ForecastService, ProjectionService, SWRCache
+
+
+@dataclass
+class DashboardSection:
+    """
+    Independently loaded and cached dashboard section.
+
+    Attributes:
+        key: URL slug of the section endpoint
+        title: Card title
+        template: Partial template rendering the section
+        build: Callable returning the cacheable section payload
+        tables: Tables whose writes invalidate the cached payload
+        entity_type: Entity type of payload entity_ids, for entity list sections
+        ttl: Seconds the payload is served without revalidation
+        stale_ttl: Extra seconds a stale payload is served while refreshing
+        wide: Render full width above the section grid
+    """
+
+    key: str
+    title: str
+    template: str
+    build: Callable[[], Dict[str, Any]]
+    tables: Tuple[str, ...]
+    entity_type: Optional[str] = None
+    ttl: int = config.DASHBOARD_CACHE_TTL
+    stale_ttl: int = config.DASHBOARD_CACHE_STALE_TTL
+    wide: bool = False
+    cache: SWRCache = field(init=False, repr=False)
+
+    def __post_init__(self) -> None:
+        """Give every section its own cache with its own policy."""
+        self.cache = SWRCache(f"dashboard-{self.key}", self.ttl, self.stale_ttl)
+
+
+def entity_ids_section(model_class: type, method_name: str, limit: int) -> Callable:
+    """Build a section payload function listing entity ids from a model helper."""
+
+    def build() -> Dict[str, Any]:
+        return {"entity_ids": [entity.id for entity in getattr(model_class, method_name)(limit)]}
+
+    return build
 
 
 class DashboardService:
     """Service for dashboard-specific aggregations and queries."""
 
     @staticmethod
-    def get_pipeline_stats() -> Dict[str, Any]:
+    def get_pipeline_stats(breakdown: Optional[Dict[str, float]] = None) -> Dict[str, Any]:
         """
         Get formatted pipeline statistics for dashboard.
 
         Returns pipeline breakdown by stage with formatted currency values
         and metadata for display.
 
+        Args:
+            breakdown: Precomputed pipeline breakdown, queried when omitted
+
         Returns:
             Dictionary with title and formatted stats array
         """
-        breakdown = Opportunity.get_pipeline_breakdown()
+        if breakdown is None:
+            breakdown = Opportunity.get_pipeline_breakdown()
 
         # Get first 4 stages for dashboard display
         # Get stage choices and convert to list of tuples
@@ -46,123 +95,177 @@ class DashboardService:
         return {"title": "Sales Pipeline", "stats": stats}
 
     @staticmethod
-    def get_recent_activity() -> Dict[str, List]:
+    def get_entity_buttons() -> List[str]:
         """
-        Get recent activity items for dashboard.
+        Get dashboard entity buttons dynamically.
 
-        Fetches recent tasks, notes, and opportunities with display formatting.
+        Returns list of entity endpoints that should show dashboard buttons
+        based on their configuration.
 
         Returns:
-            Dictionary with recent_tasks, recent_notes, recent_opportunities
+            List of endpoint names for dashboard buttons
         """
-        # Get recent items using direct queries
-        recent_tasks = (
-            Task.query.filter(Task.status != "complete")
-            .order_by(Task.created_at.desc())
-            .limit(5)
-            .all()
-        )
-        recent_notes = Note.query.order_by(Note.created_at.desc()).limit(3).all()
-        recent_opportunities = (
-            Opportunity.query.order_by(Opportunity.created_at.desc()).limit(3).all()
-        )
+        # Return singular entity types for modal routes
+        return ["company", "task", "opportunity", "stakeholder", "user"]
 
+    @staticmethod
+    def get_pipeline_section() -> Dict[str, Any]:
+        """
+        Build the pipeline section payload from one grouped breakdown query.
+
+        Returns:
+            Dashboard stats plus totals kept for compatibility
+        """
+        breakdown = Opportunity.get_pipeline_breakdown()
         return {
-            "recent_tasks": recent_tasks,  # Pass raw objects, let templates handle formatting
-            "recent_notes": recent_notes,
-            "recent_opportunities": recent_opportunities,
+            "dashboard_stats": DashboardService.get_pipeline_stats(breakdown),
+            "pipeline_stats": {
+                "prospect": breakdown.get("prospect", 0),
+                "qualified": breakdown.get("qualified", 0),
+                "proposal": breakdown.get("proposal", 0),
+                "negotiation": breakdown.get("negotiation", 0),
+                "total_value": breakdown.get("total", 0),
+                "total_count": Opportunity.query.count(),
+            },
         }
 
     @staticmethod
-    def get_critical_alerts() -> Dict[str, List]:
+    def get_sections() -> List[DashboardSection]:
         """
-        Get critical alerts for dashboard.
+        Get the dashboard sections in display order.
 
-        Identifies overdue tasks and opportunities closing soon.
+        Pipeline and closing-soon figures move slowly and tolerate a longer
+        stale window; entity lists follow the default dashboard policy.
 
         Returns:
-            Dictionary with overdue_tasks and closing_soon opportunities
+            Registered dashboard sections
         """
+        return DASHBOARD_SECTIONS
 
-        # Get overdue tasks
-        overdue_tasks = (
-            Task.query.filter(Task.due_date < date.today(), Task.status != "complete")
-            .limit(5)
-            .all()
-        )
+    @staticmethod
+    def get_section(key: str) -> Optional[DashboardSection]:
+        """
+        Look up a dashboard section by its URL slug.
 
-        # Get opportunities closing soon
-        closing_soon = Opportunity.get_closing_soon()
+        Args:
+            key: Section slug
 
-        return {
-            "overdue_tasks": overdue_tasks,  # Pass raw objects
-            "closing_soon": closing_soon,
-        }
+        Returns:
+            Matching section, or None
+        """
+        return next((section for section in DASHBOARD_SECTIONS if section.key == key), None)
 
     @staticmethod
-    def get_entity_buttons() -> List[str]:
+    def load_entities(entity_type: str, entity_ids: List[int]) -> List[Any]:
         """
-        Get dashboard entity buttons dynamically.
+        Load cached section entities in one query, keeping their order.
 
-        Returns list of entity endpoints that should show dashboard buttons
-        based on their configuration.
+        Entities deleted since the payload was cached are dropped.
+
+        Args:
+            entity_type: Entity type key in MODEL_REGISTRY
+            entity_ids: Ids in display order
 
         Returns:
-            List of endpoint names for dashboard buttons
+            Entities with card projections loaded
         """
-        # Return singular entity types for modal routes
-        return ["company", "task", "opportunity", "stakeholder", "user"]
+        if not entity_ids:
+            return []
+
+        model_class = MODEL_REGISTRY[entity_type]
+        query = ProjectionService.with_cards(model_class.query, model_class)
+        loaded = {entity.id: entity for entity in query.filter(model_class.id.in_(entity_ids))}
+        return [loaded[entity_id] for entity_id in entity_ids if entity_id in loaded]
 
     @staticmethod
-    def get_dashboard_data() -> Dict[str, Any]:
+    def get_section_data(section: DashboardSection) -> Tuple[Dict[str, Any], str]:
         """
-        Get all dashboard data in one call.
+        Get a section's template context from its cache.
+
+        Payloads do not depend on the viewer, so one copy is cached per day
+        and data version. They hold ids rather than ORM instances, so they
+        outlive the session that built them. Writes to
+        the section's tables invalidate the payload, and a stale payload
+        keeps being served while one background refresh rebuilds it.
 
-        Aggregates all dashboard statistics, recent activity, and alerts
-        for rendering the dashboard page.
+        Args:
+            section: Dashboard section
 
         Returns:
-            Complete dashboard context dictionary
+            Tuple of template context and cache status (hit, stale or miss)
         """
-        from app.models import MODEL_REGISTRY
-
-        dashboard_sections = [
-            {
-                "title": f"{prefix} {model_class.get_display_name_plural()}",
-                "entities": entities,
-                "entity_type": entity_type,
-                "display_config": model_class.get_display_config(),
-            }
-            for entity_type, model_class in sorted(MODEL_REGISTRY.items())
-            for method_name, prefix in [
-                ("get_overdue", "Overdue"),
-                ("get_recent", "Recent"),
-            ]
-            if hasattr(model_class, method_name)
-            if (
-                entities := getattr(model_class, method_name)(
-                    3 if entity_type in {"note", "opportunity"} else 5
-                )
+        today = date.today()
+        payload, status = section.cache.get_with_status(
+            today.isoformat(),
+            section.build,
+            version=DataVersions.get(section.tables),
+        )
+
+        context = {**payload, "section": section, "today": today}
+        if section.entity_type:
+            context["entities"] = DashboardService.load_entities(
+                section.entity_type, payload["entity_ids"]
             )
-        ]
-
-        # Combine all dashboard data
-        data = {
-            "dashboard_sections": dashboard_sections,
-            "dashboard_stats": DashboardService.get_pipeline_stats(),
-            "entity_types": DashboardService.get_entity_buttons(),
-            "today": date.today(),
-        }
+        return context, status
+
+
+def build_sections() -> List[DashboardSection]:
+    """Build the section registry - pipeline, alerts, then recent per entity type."""
+    sections = [
+        DashboardSection(
+            key="pipeline",
+            title="Sales Pipeline",
+            template="dashboard/sections/pipeline.html",
+            build=DashboardService.get_pipeline_section,
+            tables=("opportunities",),
+            ttl=config.DASHBOARD_CACHE_TTL * 5,
+            stale_ttl=config.DASHBOARD_CACHE_STALE_TTL * 3,
+            wide=True,
+        ),
+        DashboardSection(
+            key="forecast",
+            title="Pipeline Forecast",
+            template="dashboard/sections/forecast.html",
+            build=lambda: {"forecast": ForecastService.forecast(months=6, seed=0)},
+            tables=("opportunities",),
+            ttl=config.DASHBOARD_CACHE_TTL * 5,
+            stale_ttl=config.DASHBOARD_CACHE_STALE_TTL * 3,
+            wide=True,
+        ),
+        DashboardSection(
+            key="overdue-tasks",
+            title=f"Overdue {Task.get_display_name_plural()}",
+            template="dashboard/sections/entities.html",
+            build=entity_ids_section(Task, "get_overdue", 5),
+            tables=("tasks",),
+            entity_type="task",
+        ),
+        DashboardSection(
+            key="closing-soon",
+            title="Closing Soon",
+            template="dashboard/sections/entities.html",
+            build=lambda: {"entity_ids": [opp.id for opp in Opportunity.get_closing_soon()]},
+            tables=("opportunities",),
+            entity_type="opportunity",
+            ttl=config.DASHBOARD_CACHE_TTL * 5,
+        ),
+    ]
+
+    for entity_type, model_class in sorted(MODEL_REGISTRY.items()):
+        sections.append(
+            DashboardSection(
+                key=f"recent-{model_class.__tablename__}",
+                title=f"Recent {model_class.get_display_name_plural()}",
+                template="dashboard/sections/entities.html",
+                build=entity_ids_section(
+                    model_class, "get_recent", 3 if entity_type in {"note", "opportunity"} else 5
+                ),
+                tables=(model_class.__tablename__,),
+                entity_type=entity_type,
+            )
+        )
+
+    return sections
 
-        # Add pipeline stats for compatibility
-        breakdown = Opportunity.get_pipeline_breakdown()
-        data["pipeline_stats"] = {
-            "prospect": breakdown.get("prospect", 0),
-            "qualified": breakdown.get("qualified", 0),
-            "proposal": breakdown.get("proposal", 0),
-            "negotiation": breakdown.get("negotiation", 0),
-            "total_value": breakdown.get("total", 0),
-            "total_count": Opportunity.query.count(),
-        }
 
-        return data
+DASHBOARD_SECTIONS = build_sections()
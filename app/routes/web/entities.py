@@ -1,15 +1,37 @@
 """Web routes for CRM entities - Ultra DRY, zero duplication."""
 
-from flask import Blueprint, render_template, request
+import hashlib
+from typing import Any, Callable, Dict, List, Optional, Tuple, Union
+from datetime import date
+from itertools import groupby
+from flask import (
+    Blueprint,
+    Response,
+    current_app,
+    render_template,
+    request,
+    stream_with_context,
+    url_for,
+)
+from markupsafe import Markup
 from collections import defaultdict
+from app import config
 from app.models import MODEL_REGISTRY
 from app.core.stats import StatsGenerator
 from app.core.dropdowns import DropdownBuilder
-from app.services import QueryService
+from app.services import DataVersions, ProjectionService, QueryService, SWRCache
+from app.utils.formatters import format_currency, format_number
 
 
 entities_web_bp = Blueprint("entities", __name__)
 
+# Rendered stats headers and filter bars per model, data version and args
+fragment_cache = SWRCache(
+    "entity-fragments",
+    ttl=config.FRAGMENT_CACHE_TTL,
+    stale_ttl=config.FRAGMENT_CACHE_STALE_TTL,
+)
+
 
 def get_plural_name(model_name: str) -> str:
     """Get proper plural form of model name."""
@@ -23,6 +45,13 @@ def get_plural_name(model_name: str) -> str:
         return model_name + "s"
 
 
+# Request args that control rendering rather than filtering
+CONTROL_ARGS = ("group_by", "sort_", "page", "per_page", "defer_count")
+
+# Rows fetched per round trip, and template events buffered per chunk, when streaming
+STREAM_CHUNK_SIZE = 100
+
+
 def create_routes() -> None:
     """Dynamically create all routes based on MODEL_REGISTRY."""
     for entity_type, model in MODEL_REGISTRY.items():
@@ -32,40 +61,96 @@ def create_routes() -> None:
         table_name = model.__tablename__
 
         # Create closures to capture model and table_name
-        def make_index(model, table_name):
+        def make_view(view, model, table_name, suffix):
             def handler():
-                return entity_index(model, table_name)
+                return view(model, table_name)
 
-            handler.__name__ = f"{table_name}_index"
+            handler.__name__ = f"{table_name}_{suffix}"
             return handler
 
-        def make_content(model, table_name):
-            def handler():
-                return entity_content(model, table_name)
-
-            handler.__name__ = f"{table_name}_content"
-            return handler
+        views = [
+            ("", "index", entity_index),
+            ("/content", "content", entity_content),
+            ("/content/count", "count", entity_count),
+            ("/stats", "stats", entity_stats),
+        ]
 
         # Register routes
-        entities_web_bp.add_url_rule(
-            f"/{table_name}", f"{table_name}_index", make_index(model, table_name)
-        )
-
-        entities_web_bp.add_url_rule(
-            f"/{table_name}/content",
-            f"{table_name}_content",
-            make_content(model, table_name),
-        )
-
-        # Add alternate routes for users -> teams
-        if entity_type == "user":
+        for path, suffix, view in views:
             entities_web_bp.add_url_rule(
-                "/teams", "teams_index", make_index(model, "users")
-            )
-            entities_web_bp.add_url_rule(
-                "/teams/content", "teams_content", make_content(model, "users")
+                f"/{table_name}{path}",
+                f"{table_name}_{suffix}",
+                make_view(view, model, table_name, suffix),
             )
 
+            # Add alternate routes for users -> teams
+            if entity_type == "user":
+                entities_web_bp.add_url_rule(
+                    f"/teams{path}",
+                    f"teams_{suffix}",
+                    make_view(view, model, "users", suffix),
+                )
+
+
+def parse_filters() -> Dict[str, Any]:
+    """Extract filter args from the request, ignoring rendering controls."""
+    return {k: v for k, v in request.args.items() if not k.startswith(CONTROL_ARGS)}
+
+
+def defer_count_requested(model: type) -> bool:
+    """Check whether totals should be loaded by a separate HTMX request."""
+    return request.args.get(
+        "defer_count", default=model.__defer_count__, type=lambda v: v in ("1", "true")
+    )
+
+
+def cached_fragment(
+    key: Tuple[Any, ...], tables: Tuple[str, ...], render: Callable[[], str]
+) -> Markup:
+    """Render an HTML fragment through the stale-while-revalidate cache.
+
+    A fragment is rebuilt once its tables' data version moves; until the
+    rebuild finishes the previous HTML is served, so index pages never wait
+    on stats or dropdown queries after the first render.
+
+    Args:
+        key: Cache key identifying the fragment and its inputs.
+        tables: Tables the fragment is built from.
+        render: Callable returning the HTML; may run in a background thread
+            with only an app context, so it must not read ``request``.
+
+    Returns:
+        Rendered HTML, safe for direct inclusion in a template.
+    """
+    version = DataVersions.get(tables)
+    return Markup(fragment_cache.get_or_compute(key, render, version))
+
+
+def render_stats_fragment(model: type, table_name: str) -> Markup:
+    """Render the stats header for a model from the fragment cache."""
+    generator = StatsGenerator(model, table_name)
+    return cached_fragment(
+        ("stats", table_name, date.today()),  # Due-date stats roll over daily
+        generator.tables,
+        lambda: render_template(
+            "shared/entity_stats.html", entity_stats=generator.generate()
+        ),
+    )
+
+
+def render_filter_fragment(model: type, table_name: str) -> Markup:
+    """Render the filter bar controls for a model from the fragment cache."""
+    args = request.args.copy()  # Detached from the request for background refreshes
+    return cached_fragment(
+        ("filters", table_name, tuple(sorted(args.items(multi=True)))),
+        DropdownBuilder.source_tables(model),
+        lambda: render_template(
+            "shared/entity_filter_controls.html",
+            dropdown_configs=DropdownBuilder.build_all(model, args),
+            entity_type=model.__name__.lower(),
+        ),
+    )
+
 
 def entity_index(model: type, table_name: str) -> str:
     """Render the index page for an entity type.
@@ -77,12 +162,10 @@ def entity_index(model: type, table_name: str) -> str:
     Returns:
         Rendered template with entity stats, dropdowns, and configuration.
     """
-    # Generate dropdowns
-    dropdown_configs = DropdownBuilder.build_all(model, request.args)
-
-    # Generate stats
-    stats_generator = StatsGenerator(model, table_name)
-    stats_list = stats_generator.generate()
+    # Stats header and filter bar come pre-rendered from the fragment cache
+    filter_controls_html = render_filter_fragment(model, table_name)
+    defer_count = defer_count_requested(model)
+    stats_html = None if defer_count else render_stats_fragment(model, table_name)
 
     # Build context
     context = {
@@ -98,9 +181,11 @@ def entity_index(model: type, table_name: str) -> str:
                 }
             ],
             "content_endpoint": f"entities.{table_name}_content",
+            "stats_endpoint": f"entities.{table_name}_stats",
         },
-        "entity_stats": stats_list,
-        "dropdown_configs": dropdown_configs,
+        "stats_html": stats_html,
+        "defer_count": defer_count,
+        "filter_controls_html": filter_controls_html,
         "model": model,
         "table_name": table_name,
     }
@@ -108,8 +193,226 @@ def entity_index(model: type, table_name: str) -> str:
     return render_template("base/entity_index.html", **context)
 
 
-def entity_content(model: type, table_name: str) -> str:
-    """Render entity content with data based on filters, grouping, and sorting.
+def entity_stats(model: type, table_name: str) -> str:
+    """Render the stats cards on their own for lazily loaded index pages.
+
+    Args:
+        model: SQLAlchemy model class for the entity.
+        table_name: Database table name for entity-specific stat generation.
+
+    Returns:
+        Rendered stats partial.
+    """
+    return render_stats_fragment(model, table_name)
+
+
+def entity_count(model: type, table_name: str) -> str:
+    """Return the filtered total for a list view as a text fragment.
+
+    Args:
+        model: SQLAlchemy model class for the entity.
+        table_name: Database table name (for context).
+
+    Returns:
+        Formatted COUNT(*) of the rows matching the current filters.
+    """
+    query = QueryService.build_filtered_query(model, parse_filters())
+    return format_number(QueryService.count_rows(query))
+
+
+def to_group_list(
+    grouped_entities: Dict[str, List[Any]], counts: Dict[str, int]
+) -> List[Dict[str, Any]]:
+    """Convert grouped entities to the list format expected by the template.
+
+    Args:
+        grouped_entities: Entities of the current page by group label.
+        counts: Rows per group label across all pages.
+
+    Returns:
+        List of group dictionaries. ``dom_id`` is the same on every page,
+        so a continuation page can append to a group rendered earlier.
+    """
+    return [
+        {
+            "key": key,
+            "label": key,
+            "dom_id": "group-" + hashlib.sha1(key.encode()).hexdigest()[:12],
+            "entities": entities,
+            "count": counts.get(key, len(entities)),
+        }
+        for key, entities in grouped_entities.items()
+    ]
+
+
+def group_label(model: type, group_by: str, value: Any) -> str:
+    """Get the group label of a column value in the grouped list view.
+
+    Args:
+        model: SQLAlchemy model class for the entity.
+        group_by: Column name to group by.
+        value: The entity's value of the column.
+
+    Returns:
+        Display label of the group.
+    """
+    # Special handling for probability field - use ranges
+    if group_by == "probability" and hasattr(model, "probability_range"):
+        return model.probability_range(value)
+
+    key = value or "No Group"
+    if hasattr(key, "label"):
+        key = key.label
+    # Format value fields with currency
+    elif group_by == "value" and isinstance(key, (int, float)):
+        key = format_currency(key)
+    return str(key)
+
+
+def group_key(entity: Any, group_by: str) -> str:
+    """Get the group label for an entity in the grouped list view.
+
+    Args:
+        entity: Entity being grouped.
+        group_by: Column name to group by.
+
+    Returns:
+        Display label of the entity's group.
+    """
+    # Special handling for company_id - show company name
+    if group_by == "company_id":
+        # Prefer the card projection so grouping doesn't lazy load each company
+        card = entity.__dict__.get("card")
+        if card is not None:
+            return card.company_name or "No Company"
+        return entity.company.name if entity.company else "No Company"
+    return group_label(type(entity), group_by, getattr(entity, group_by))
+
+
+def group_counts(query: Any, model: type, group_by: str) -> Dict[str, int]:
+    """Count the filtered rows of every group, keyed by group label.
+
+    One GROUP BY over the filtered query, so group headers show the size
+    of the whole group rather than of the rows on the current page.
+
+    Args:
+        query: Filtered query, before grouping and sorting.
+        model: SQLAlchemy model class for the entity.
+        group_by: Column or relationship group to group by.
+
+    Returns:
+        Dictionary of group label to row count.
+    """
+    rows = QueryService.group_counts(query, model, group_by)
+    relationship_groups = model.__relationship_filters__
+
+    if group_by in relationship_groups:
+        empty_label = relationship_groups[group_by].get("empty_label", "No Group")
+        labels = {value: value or empty_label for value, _ in rows}
+    elif group_by == "company_id":
+        company = model.company.property.mapper.class_
+        names = dict(
+            company.query.with_entities(company.id, company.name).filter(
+                company.id.in_([value for value, _ in rows if value is not None])
+            )
+        )
+        labels = {value: names.get(value) or "No Company" for value, _ in rows}
+    else:
+        labels = {value: group_label(model, group_by, value) for value, _ in rows}
+
+    counts: Dict[str, int] = defaultdict(int)
+    for value, count in rows:
+        counts[labels[value]] += count
+    return counts
+
+
+def group_entities(
+    entities: List[Any], group_by: str, counts: Dict[str, int]
+) -> List[Dict[str, Any]]:
+    """Group a page of entities by a column for the grouped list view.
+
+    Args:
+        entities: Entities on the current page, already sorted.
+        group_by: Column name to group by.
+        counts: Rows per group label across all pages.
+
+    Returns:
+        List of group dictionaries in first-seen order.
+    """
+    grouped_entities = defaultdict(list)
+    for entity in entities:
+        grouped_entities[group_key(entity, group_by)].append(entity)
+
+    return to_group_list(grouped_entities, counts)
+
+
+def group_pairs(
+    rows: List[Any], empty_label: str, counts: Dict[str, int]
+) -> List[Dict[str, Any]]:
+    """Group ``(entity, label)`` rows from a relationship join by label.
+
+    Args:
+        rows: Rows from QueryService.pair_with_relationship, ordered by label.
+        empty_label: Group label for entities without related entities.
+        counts: Rows per group label across all pages.
+
+    Returns:
+        List of group dictionaries in label order.
+    """
+    grouped_entities = defaultdict(list)
+    for entity, label in rows:
+        grouped_entities[label or empty_label].append(entity)
+
+    return to_group_list(grouped_entities, counts)
+
+
+def stream_entity_content(
+    query: Any, model: type, group_by: Optional[str], context: Dict[str, Any]
+) -> Response:
+    """Stream every matching entity as chunked HTML.
+
+    Rows are iterated with ``yield_per`` and groups are formed lazily from
+    the already ordered query, so server memory stays flat and the browser
+    can paint the first cards while later ones are still being rendered.
+
+    Args:
+        query: Filtered and sorted query (pairs for relationship groups).
+        model: SQLAlchemy model class for the entity.
+        group_by: Optional column or relationship group; the query must be
+            ordered by it, as ``entity_content`` does, or groups would repeat.
+        context: Template context shared with the paged view.
+
+    Returns:
+        Streamed HTML response.
+    """
+    rows = query.yield_per(STREAM_CHUNK_SIZE)
+    relationship_groups = model.__relationship_filters__
+
+    if group_by in relationship_groups:
+        empty_label = relationship_groups[group_by].get("empty_label", "No Group")
+        groups = (
+            (label or empty_label, (entity for entity, _ in pairs))
+            for label, pairs in groupby(rows, key=lambda row: row[1])
+        )
+    elif group_by:
+        groups = groupby(rows, key=lambda entity: group_key(entity, group_by))
+    else:
+        groups = iter([(f"All {get_plural_name(model.__name__)}", rows)])
+
+    current_app.update_template_context(context)
+    template = current_app.jinja_env.get_template("shared/entity_content_stream.html")
+    stream = template.stream(groups=groups, **context)
+    stream.enable_buffering(STREAM_CHUNK_SIZE)
+
+    return Response(stream_with_context(stream), mimetype="text/html")
+
+
+def entity_content(model: type, table_name: str) -> Union[str, Response]:
+    """Render one page of entity content based on filters, grouping, and sorting.
+
+    Only the requested page is loaded. The total is a COUNT(*) over the
+    filtered query, or is deferred to the count endpoint when requested.
+    ``per_page=all`` streams every row instead of paging.
 
     Args:
         model: SQLAlchemy model class for the entity.
@@ -122,83 +425,91 @@ def entity_content(model: type, table_name: str) -> str:
     group_by = request.args.get("group_by")
     sort_by = request.args.get("sort_by", "id")
     sort_direction = request.args.get("sort_direction", "asc")
-    filters = {
-        k: v for k, v in request.args.items() if not k.startswith(("group_by", "sort_"))
-    }
-
-    # Build and execute query
-    query = QueryService.build_filtered_query(model, filters)
+    page = max(request.args.get("page", 1, type=int), 1)
+    per_page = max(request.args.get("per_page", model.__page_size__, type=int), 1)
+    stream_all = request.args.get("per_page") == "all"
+    filters = parse_filters()
+
+    # Only columns and relationship filters can be grouped: both have an SQL
+    # expression to order by, which paging and streaming rely on to keep
+    # each group contiguous. Anything else is listed ungrouped.
+    relationship_groups = model.__relationship_filters__
+    is_grouped = bool(
+        group_by
+        and (group_by in relationship_groups or group_by in model.__table__.columns)
+    )
+
+    # Build query - grouped views order by the group first so that groups
+    # stay contiguous across pages. Relationship groups page over
+    # (entity, owner) pairs from a single join instead of lazy loading.
+    filtered_query = QueryService.build_filtered_query(model, filters)
+    query = filtered_query
+    if is_grouped and group_by in relationship_groups:
+        query = QueryService.pair_with_relationship(query, model, group_by)
+    elif is_grouped:
+        query = query.order_by(getattr(model, group_by))
     query = QueryService.apply_sorting(query, model, sort_by, sort_direction)
+    query = ProjectionService.with_cards(query, model)
 
-    if group_by and (hasattr(model, group_by) or group_by == "relationship_owners"):
-        # Group entities
-        grouped_entities = defaultdict(list)
-        entities_list = query.all()
-        for entity in entities_list:
-            # Special handling for probability field - use ranges
-            if group_by == "probability" and hasattr(entity, "get_probability_range"):
-                group_key = entity.get_probability_range()
-            # Special handling for company_id - show company name
-            elif group_by == "company_id" and hasattr(entity, "company"):
-                group_key = entity.company.name if entity.company else "No Company"
-            # Special handling for relationship_owners - group by each owner
-            elif group_by == "relationship_owners" and hasattr(entity, "relationship_owners"):
-                # A stakeholder can have multiple owners, so add to multiple groups
-                if entity.relationship_owners:
-                    for owner in entity.relationship_owners:
-                        owner_name = owner.name if owner else "No Owner"
-                        grouped_entities[str(owner_name)].append(entity)
-                    continue  # Skip the default append at the end
-                else:
-                    group_key = "No Owner"
-            else:
-                group_key = getattr(entity, group_by) or "No Group"
-                if hasattr(group_key, "label"):
-                    group_key = group_key.label
-                # Format value fields with currency
-                elif group_by == "value" and isinstance(group_key, (int, float)):
-                    from app.utils.formatters import format_currency
-                    group_key = format_currency(group_key)
-            grouped_entities[str(group_key)].append(entity)
-
-        # Convert to list format expected by template
-        grouped_list = [
-            {"key": key, "label": key, "entities": entities, "count": len(entities)}
-            for key, entities in grouped_entities.items()
-        ]
+    endpoint = request.endpoint
+    args = request.args.to_dict()
+    count_url = url_for(endpoint.replace("_content", "_count"), **args)
 
+    if stream_all:
         context = {
-            "grouped_entities": grouped_list,
             "entity_type": model.__name__.lower(),
             "entity_name": model.__name__,
-            "entity_name_singular": model.__name__,
             "entity_name_plural": get_plural_name(model.__name__),
-            "total_count": len(entities_list),
-            "is_grouped": True,
+            "count_url": count_url,
         }
-        return render_template("shared/entity_content.html", **context)
-
-    # Regular list view
-    entities = query.all()
+        return stream_entity_content(
+            query, model, group_by if is_grouped else None, context
+        )
 
-    # Convert entities to grouped format for template consistency
-    grouped_entities = [
-        {
-            "key": "all",
-            "label": f"All {get_plural_name(model.__name__)}",
-            "entities": entities,
-            "count": len(entities),
-        }
-    ]
+    entities, has_more = QueryService.paginate(query, page, per_page)
+
+    # Totals only appear on the first page
+    is_continuation = page > 1
+    defer_count = defer_count_requested(model)
+    total_count = None
+    if not is_continuation and not defer_count:
+        total_count = QueryService.count_rows(filtered_query)
+
+    if is_grouped and group_by in relationship_groups:
+        empty_label = relationship_groups[group_by].get("empty_label", "No Group")
+        counts = group_counts(filtered_query, model, group_by)
+        grouped_list = group_pairs(entities, empty_label, counts)
+    elif is_grouped:
+        counts = group_counts(filtered_query, model, group_by)
+        grouped_list = group_entities(entities, group_by, counts)
+    else:
+        # Convert entities to grouped format for template consistency; the
+        # count is the total, unknown on later pages and when deferred
+        label = f"All {get_plural_name(model.__name__)}"
+        grouped_list = to_group_list({label: entities}, {label: total_count})
+
+    # A group cut off by the previous page continues in place: its rows are
+    # appended to the group already on screen instead of under a new header
+    after_group = request.args.get("after_group")
+    if is_continuation and grouped_list and grouped_list[0]["label"] == after_group:
+        grouped_list[0]["continued"] = True
+
+    next_page_url = None
+    if has_more:
+        next_args = {**args, "page": page + 1, "after_group": grouped_list[-1]["label"]}
+        next_page_url = url_for(endpoint, **next_args)
 
     context = {
-        "grouped_entities": grouped_entities,
+        "grouped_entities": grouped_list,
         "entity_type": model.__name__.lower(),
         "entity_name": model.__name__,
         "entity_name_singular": model.__name__,
         "entity_name_plural": get_plural_name(model.__name__),
-        "total_count": len(entities),
-        "is_grouped": False,
+        "total_count": total_count,
+        "count_url": count_url,
+        "next_page_url": next_page_url,
+        "is_continuation": is_continuation,
+        "is_grouped": is_grouped,
     }
     return render_template("shared/entity_content.html", **context)
 
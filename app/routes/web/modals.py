@@ -198,8 +198,6 @@ def handle_stakeholder_meddpic_roles(entity, form, is_new):
         if not is_new:
             db.session.flush()  # Ensure entity has ID
             # Remove all existing roles
-            from app.models.stakeholder import stakeholder_meddpicc_roles
-
             meddpicc_logger.log_role_database_operation(
                 stakeholder_id=entity.id,
                 operation="delete_existing",
@@ -207,10 +205,7 @@ def handle_stakeholder_meddpic_roles(entity, form, is_new):
                 success=True
             )
 
-            delete_stmt = stakeholder_meddpicc_roles.delete().where(
-                stakeholder_meddpicc_roles.c.stakeholder_id == entity.id
-            )
-            db.session.execute(delete_stmt)
+            entity.clear_meddpicc_roles()
 
         # Add new roles
         db.session.flush()  # Ensure entity has ID for new entities
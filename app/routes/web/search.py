@@ -5,10 +5,34 @@ Clean, maintainable search using BaseModel search capabilities.
 """
 
 from flask import Blueprint, request, jsonify, render_template
+from app import config
 from app.models import MODEL_REGISTRY
+from app.services import Cache, DataVersions
 
 search_bp = Blueprint("search", __name__)
 
+# Search and autocomplete results per query, versioned by the searched tables
+search_cache = Cache("search", ttl=config.SEARCH_CACHE_TTL, shared=True)
+
+
+def cached_search(endpoint, models, query, limit, build):
+    """Get search results from the cache, building them on a miss.
+
+    Args:
+        endpoint: Name of the endpoint the results are shaped for.
+        models: Model classes searched.
+        query: Search text.
+        limit: Result limit.
+        build: Callable returning the JSON-ready results.
+
+    Returns:
+        Cached or freshly built results.
+    """
+    # Results show company names, so company writes invalidate them too
+    tables = tuple(dict.fromkeys([*(model.__tablename__ for model in models), "companies"]))
+    key = (endpoint, tables, query.lower(), limit)
+    return search_cache.get_or_compute(key, build, version=DataVersions.get(tables))
+
 
 @search_bp.route("/api/search")
 def search():
@@ -28,23 +52,25 @@ def search():
         ]
         models_to_search = [m for m in models_to_search if m]  # Filter None
 
-    # Collect results from all models
-    results = []
-    for model in models_to_search:
-        try:
-            entities = model.search(query, limit)
-            results.extend([e.to_search_result() for e in entities])
-        except Exception:
-            # If a model doesn't support search, skip it
-            continue
+    def build():
+        # Collect results from all models
+        results = []
+        for model in models_to_search:
+            try:
+                entities = model.search(query, limit)
+                results.extend([e.to_search_result() for e in entities])
+            except Exception:
+                # If a model doesn't support search, skip it
+                continue
 
-    # Sort by type order and title
-    type_order = {name: i for i, name in enumerate(MODEL_REGISTRY.keys())}
-    results.sort(
-        key=lambda x: (type_order.get(x["type"], 99), x.get("title", "").lower())
-    )
+        # Sort by type order and title
+        type_order = {name: i for i, name in enumerate(MODEL_REGISTRY.keys())}
+        results.sort(
+            key=lambda x: (type_order.get(x["type"], 99), x.get("title", "").lower())
+        )
+        return results[:limit]
 
-    return jsonify(results[:limit])
+    return jsonify(cached_search("search", models_to_search, query, limit, build))
 
 
 @search_bp.route("/api/search/entity-types")
@@ -74,25 +100,27 @@ def autocomplete():
     if not model:
         return jsonify([])
 
-    # Search the model
-    entities = model.search(query, limit)
-
-    # Build autocomplete results
-    suggestions = []
-    for entity in entities:
-        result = {
-            "id": entity.id,
-            "name": entity._get_search_title(),
-            "type": entity_type,
-        }
+    def build():
+        # Search the model
+        entities = model.search(query, limit)
+
+        # Build autocomplete results
+        suggestions = []
+        for entity in entities:
+            result = {
+                "id": entity.id,
+                "name": entity._get_search_title(),
+                "type": entity_type,
+            }
 
-        # Add company name for entities that have it
-        if hasattr(entity, "company") and entity.company:
-            result["company"] = entity.company.name
+            # Add company name for entities that have it
+            if hasattr(entity, "company") and entity.company:
+                result["company"] = entity.company.name
 
-        suggestions.append(result)
+            suggestions.append(result)
+        return suggestions
 
-    return jsonify(suggestions)
+    return jsonify(cached_search("autocomplete", [model], query, limit, build))
 
 
 def get_task_field_options(field_type, query=""):
@@ -10,6 +10,16 @@ Services:
 - SerializationService: Handle model serialization and transformations
 - MetadataService: Handle field metadata and choices
 - EntityRelationshipService: Handle entity linking and relationships
+- ProjectionService: Maintain card projection tables (list view read models)
+- DataVersions / SWRCache / Cache: Write-invalidated, stale-while-revalidate and tiered caching
+- PipelineSnapshotService: Daily pipeline snapshots and trend series
+- CounterService: Entity counters maintained in the writing transaction
+- ForecastService: Vectorized weighted pipeline, conversion and Monte Carlo forecasts
+- BulkService: Single-transaction bulk creates, updates and deletes
+- ChangeLogService: Entity change log and tombstones for delta sync
+- ExportService: Streamed Arrow IPC and Parquet table exports
+- ImportService: Background CSV/XLSX imports in chunked bulk inserts
+- IncludeService: Batched ?include= relationship expansion for API responses
 """
 
 from .display_service import DisplayService
@@ -17,6 +27,16 @@ from .search_service import SearchService
 from .serialization_service import SerializationService
 from .metadata_service import MetadataService
 from .query_service import QueryService
+from .projection_service import ProjectionService
+from .cache_service import Cache, DataVersions, SWRCache
+from .pipeline_snapshot_service import PipelineSnapshotService
+from .counter_service import CounterService
+from .forecast_service import ForecastService
+from .bulk_service import BulkService
+from .change_log_service import ChangeLogService
+from .export_service import ExportService
+from .import_service import ImportService
+from .include_service import IncludeService
 
 __all__ = [
     "DisplayService",
@@ -24,4 +44,16 @@ __all__ = [
     "SerializationService",
     "MetadataService",
     "QueryService",
+    "ProjectionService",
+    "Cache",
+    "DataVersions",
+    "SWRCache",
+    "PipelineSnapshotService",
+    "CounterService",
+    "ForecastService",
+    "BulkService",
+    "ChangeLogService",
+    "ExportService",
+    "ImportService",
+    "IncludeService",
 ]
@@ -0,0 +1,500 @@
+"""
+Bulk Service
+
+Applies arrays of creates, updates (by id) and deletes to one entity table
+in a single transaction. Each operation kind runs as executemany Core
+statements, one per distinct set of submitted fields, inside a savepoint;
+when a statement fails its items are retried one by one so the failing
+items are reported and the rest still apply.
+
+Core statements bypass the ORM write listeners, so the side effects they
+maintain - entity counters, card projections, the change log and data
+versions - are applied here from the row values read before and after the
+writes.
+"""
+
+from collections import defaultdict
+from dataclasses import dataclass, field
+from datetime import date, datetime
+from typing import Any, Dict, List, Mapping, Optional, Sequence, Set, Tuple
+
+from sqlalchemy import bindparam, inspect, select
+from sqlalchemy.exc import DBAPIError, StatementError
+
+from app.models import db
+from app.services.change_log_service import ChangeLogService
+from app.services.counter_service import CounterService
+from app.services.projection_service import PARENT_COLUMNS, ProjectionService
+from app.utils.logging_config import get_crm_logger
+from app.utils.model_utils import blocking_relationships
+
+logger = get_crm_logger(__name__)
+
+OPERATIONS = ("create", "update", "delete")
+
+
+class BulkItemError(ValueError):
+    """A single bulk item that cannot be applied."""
+
+
+@dataclass
+class BulkResult:
+    """Per-item outcomes of a bulk request.
+
+    Attributes:
+        results: Operation to one result dictionary per submitted item.
+        rolled_back: True when an atomic request failed and nothing was written.
+    """
+
+    results: Dict[str, List[Dict[str, Any]]] = field(
+        default_factory=lambda: {operation: [] for operation in OPERATIONS}
+    )
+    rolled_back: bool = False
+
+    @property
+    def failed(self) -> int:
+        """Number of items that were not applied."""
+        return sum(
+            1
+            for items in self.results.values()
+            for item in items
+            if item["status"] == "failed"
+        )
+
+    def summary(self) -> Dict[str, int]:
+        """Count items per outcome."""
+        counts = defaultdict(int)
+        for items in self.results.values():
+            for item in items:
+                counts[item["status"]] += 1
+        return {"created": 0, "updated": 0, "deleted": 0, "failed": 0, **counts}
+
+    def to_dict(self) -> Dict[str, Any]:
+        """Convert to the bulk endpoint response body."""
+        return {
+            "results": self.results,
+            "summary": self.summary(),
+            "rolled_back": self.rolled_back,
+        }
+
+
+def _begin(connection: Any) -> None:
+    """Open the DBAPI transaction so savepoints nest inside it.
+
+    pysqlite only emits BEGIN before DML, so a SAVEPOINT issued first would
+    start a transaction of its own - and releasing it would commit.
+    """
+    driver_connection = connection.connection.driver_connection
+    if connection.dialect.name == "sqlite" and not driver_connection.in_transaction:
+        connection.exec_driver_sql("BEGIN")
+
+
+def _error_message(error: Exception) -> str:
+    """Short message for a failed statement, without the SQL."""
+    return str(getattr(error, "orig", None) or error)
+
+
+class BulkService:
+    """Service for single-transaction bulk writes to an entity table."""
+
+    @staticmethod
+    def column_map(model: type) -> Dict[str, Any]:
+        """Get writable attribute names mapped to their table columns."""
+        return {
+            prop.key: prop.columns[0]
+            for prop in inspect(model).column_attrs
+            if not prop.columns[0].primary_key
+        }
+
+    @staticmethod
+    def _coerce(column: Any, value: Any) -> Any:
+        """Convert ISO date strings for date columns; Core does not parse them."""
+        if not isinstance(value, str):
+            return value
+        try:
+            python_type = column.type.python_type
+        except NotImplementedError:
+            return value
+        try:
+            if python_type is datetime:
+                return datetime.fromisoformat(value)
+            if python_type is date:
+                return date.fromisoformat(value)
+        except ValueError:
+            raise BulkItemError(f"{column.key} must be an ISO date")
+        return value
+
+    @classmethod
+    def prepare(cls, model: type, data: Any, required: bool) -> Dict[str, Any]:
+        """Validate one item and build its column values.
+
+        The values are set on a transient instance so attribute events that
+        derive columns (e.g. stakeholder seniority from job title) still run.
+
+        Args:
+            model: Entity model class.
+            data: Submitted field values.
+            required: Check non-nullable columns without defaults (creates).
+
+        Returns:
+            Dictionary of column name to value.
+
+        Raises:
+            BulkItemError: If the item is invalid.
+        """
+        if not isinstance(data, dict):
+            raise BulkItemError("Item must be an object")
+
+        columns = cls.column_map(model)
+        unknown = sorted(set(data) - set(columns))
+        if unknown:
+            raise BulkItemError(f"Unknown field(s): {', '.join(unknown)}")
+
+        if required:
+            missing = sorted(
+                key
+                for key, column in columns.items()
+                if not column.nullable
+                and column.default is None
+                and column.server_default is None
+                and data.get(key) is None
+            )
+            if missing:
+                raise BulkItemError(f"Missing required field(s): {', '.join(missing)}")
+
+        entity = model(
+            **{key: cls._coerce(columns[key], value) for key, value in data.items()}
+        )
+        return {
+            column.key: entity.__dict__[key]
+            for key, column in columns.items()
+            if key in entity.__dict__
+        }
+
+    @staticmethod
+    def _run_grouped(
+        items: Sequence[Tuple[int, Dict[str, Any]]],
+        execute,
+        atomic: bool,
+    ) -> Dict[int, Any]:
+        """Run items grouped by field set, isolating failures with savepoints.
+
+        Args:
+            items: (index, parameters) pairs.
+            execute: Callable running one statement for a list of parameters
+                and returning one outcome per parameter set.
+            atomic: Raise on the first failure instead of isolating it.
+
+        Returns:
+            Dictionary of item index to outcome or exception.
+        """
+        connection = db.session.connection()
+        groups = defaultdict(list)
+        for index, parameters in items:
+            groups[frozenset(parameters)].append((index, parameters))
+
+        outcomes = {}
+        for group in groups.values():
+            indexes = [index for index, _ in group]
+            try:
+                with connection.begin_nested():
+                    results = execute([parameters for _, parameters in group])
+                outcomes.update(zip(indexes, results))
+                continue
+            except (DBAPIError, StatementError):
+                if atomic:
+                    raise
+
+            # Find the failing items of the group one at a time
+            for index, parameters in group:
+                try:
+                    with connection.begin_nested():
+                        outcomes[index] = execute([parameters])[0]
+                except (DBAPIError, StatementError) as error:
+                    outcomes[index] = error
+
+        return outcomes
+
+    @classmethod
+    def execute(
+        cls,
+        model: type,
+        creates: Sequence[Any] = (),
+        updates: Sequence[Any] = (),
+        deletes: Sequence[Any] = (),
+        atomic: bool = False,
+    ) -> BulkResult:
+        """Apply bulk writes in one transaction and commit it.
+
+        Args:
+            model: Entity model class.
+            creates: Field dictionaries of rows to insert.
+            updates: Field dictionaries with the ``id`` of rows to change.
+            deletes: Ids of rows to delete.
+            atomic: Roll back everything if any item fails.
+
+        Returns:
+            BulkResult with one outcome per item, in submission order.
+        """
+        result = BulkResult()
+        effects = _SideEffects(model)
+        _begin(db.session.connection())
+        try:
+            cls._create(model, result.results["create"], creates, atomic, effects)
+            cls._update(model, result.results["update"], updates, atomic, effects)
+            cls._delete(model, result.results["delete"], deletes, atomic, effects)
+            if atomic and result.failed:
+                raise BulkItemError("Atomic bulk request had failed items")
+        except (BulkItemError, DBAPIError, StatementError) as error:
+            db.session.rollback()
+            result.rolled_back = True
+            for items in result.results.values():
+                for item in items:
+                    if item["status"] != "failed":
+                        item.update(status="failed", error="Rolled back")
+            if not isinstance(error, BulkItemError):
+                logger.warning(
+                    f"Atomic bulk write to {model.__tablename__} rolled back",
+                    extra={"custom_fields": {"error": _error_message(error)}},
+                )
+            return result
+
+        effects.apply()
+        db.session.commit()
+
+        logger.info(
+            f"Bulk write to {model.__tablename__}",
+            extra={
+                "custom_fields": {
+                    "operation": "bulk_write",
+                    "table_name": model.__tablename__,
+                    **result.summary(),
+                }
+            },
+        )
+        return result
+
+    @classmethod
+    def _create(cls, model, results, creates, atomic, effects) -> None:
+        """Insert rows with executemany INSERT ... RETURNING."""
+        table = model.__table__
+        statement = table.insert().returning(
+            *_tracked_columns(model), sort_by_parameter_order=True
+        )
+        connection = db.session.connection()
+
+        items = []
+        for index, data in enumerate(creates):
+            results.append({"index": index, "status": "created"})
+            try:
+                items.append((index, cls.prepare(model, data, required=True)))
+            except (BulkItemError, TypeError) as error:
+                results[index].update(status="failed", error=str(error))
+
+        def insert(parameters):
+            return [dict(row._mapping) for row in connection.execute(statement, parameters)]
+
+        created = []
+        for index, outcome in cls._run_grouped(items, insert, atomic).items():
+            if isinstance(outcome, Exception):
+                results[index].update(status="failed", error=_error_message(outcome))
+            else:
+                results[index]["id"] = outcome["id"]
+                created.append(outcome)
+
+        effects.track(None, created)
+
+    @classmethod
+    def _update(cls, model, results, updates, atomic, effects) -> None:
+        """Update rows by id with executemany UPDATE statements."""
+        table = model.__table__
+        statement = table.update().where(table.c.id == bindparam("_id"))
+        connection = db.session.connection()
+
+        items, seen = [], set()
+        for index, data in enumerate(updates):
+            entity_id = data.get("id") if isinstance(data, dict) else None
+            results.append({"index": index, "id": entity_id, "status": "updated"})
+            try:
+                if not isinstance(entity_id, int):
+                    raise BulkItemError("Item must have an integer id")
+                if entity_id in seen:
+                    raise BulkItemError("Duplicate id")
+                seen.add(entity_id)
+                changes = {key: value for key, value in data.items() if key != "id"}
+                items.append((index, cls.prepare(model, changes, required=False)))
+            except (BulkItemError, TypeError) as error:
+                results[index].update(status="failed", error=str(error))
+
+        existing = _load_rows(model, {results[index]["id"] for index, _ in items})
+        runnable = []
+        for index, values in items:
+            if results[index]["id"] not in existing:
+                results[index].update(status="failed", error="Not found")
+            elif values:
+                runnable.append((index, {"_id": results[index]["id"], **values}))
+
+        def update(parameters):
+            connection.execute(statement, parameters)
+            return [None] * len(parameters)
+
+        for index, outcome in cls._run_grouped(runnable, update, atomic).items():
+            if isinstance(outcome, Exception):
+                results[index].update(status="failed", error=_error_message(outcome))
+
+        previous, current = [], []
+        for index, values in runnable:
+            if results[index]["status"] == "updated":
+                row = existing[values["_id"]]
+                previous.append(row)
+                current.append({key: values.get(key, value) for key, value in row.items()})
+        effects.track(previous, current)
+
+    @staticmethod
+    def dependent_ids(model: type, ids: Set[int]) -> Set[int]:
+        """Get the ids that related rows still block, one query per relationship.
+
+        Applies the single-entity delete's rule (``blocking_relationships``):
+        parents, children and many-to-many links block deletion, while
+        read-model (viewonly) and cascading relationships do not.
+
+        Args:
+            model: Entity model class.
+            ids: Candidate ids.
+
+        Returns:
+            Ids with blocking related rows.
+        """
+        blocked = set()
+        if not ids:
+            return blocked
+
+        connection = db.session.connection()
+        for relationship in blocking_relationships(model).values():
+            if relationship.direction.name == "MANYTOONE":
+                # The parent is referenced from the row's own foreign key
+                queries = [
+                    select(model.id).where(model.id.in_(ids), column.isnot(None))
+                    for column in relationship.local_columns
+                ]
+            else:
+                queries = [
+                    select(column).where(column.in_(ids)).distinct()
+                    for _, column in relationship.synchronize_pairs
+                ]
+            for query in queries:
+                blocked |= {row[0] for row in connection.execute(query)}
+        return blocked
+
+    @classmethod
+    def _delete(cls, model, results, deletes, atomic, effects) -> None:
+        """Delete rows by id with one DELETE ... IN statement."""
+        table = model.__table__
+
+        candidates = {}
+        for index, entity_id in enumerate(deletes):
+            results.append({"index": index, "id": entity_id, "status": "deleted"})
+            if not isinstance(entity_id, int):
+                results[index].update(status="failed", error="Id must be an integer")
+            elif entity_id in candidates:
+                results[index].update(status="failed", error="Duplicate id")
+            else:
+                candidates[entity_id] = index
+
+        existing = _load_rows(model, set(candidates))
+        blocked = cls.dependent_ids(model, set(existing))
+        for entity_id, index in candidates.items():
+            if entity_id not in existing:
+                results[index].update(status="failed", error="Not found")
+            elif entity_id in blocked:
+                results[index].update(
+                    status="failed", error="Cannot delete entity with dependencies"
+                )
+
+        deleted = [
+            existing[entity_id]
+            for entity_id, index in candidates.items()
+            if results[index]["status"] == "deleted"
+        ]
+        if not deleted:
+            return
+
+        # Cards linked through other tables must be found before the rows go
+        effects.track(deleted, None)
+        db.session.connection().execute(
+            table.delete().where(table.c.id.in_([row["id"] for row in deleted]))
+        )
+
+
+def _tracked_columns(model: type) -> List[Any]:
+    """Columns whose values drive counters and card projections."""
+    table = model.__table__
+    names = (*model.__counted_columns__, *PARENT_COLUMNS.get(model.__tablename__, ()))
+    return [table.c.id, *(table.c[name] for name in dict.fromkeys(names))]
+
+
+def _load_rows(model: type, ids: Set[int]) -> Dict[int, Dict[str, Any]]:
+    """Read the tracked column values of existing rows."""
+    if not ids:
+        return {}
+    rows = db.session.connection().execute(
+        select(*_tracked_columns(model)).where(model.__table__.c.id.in_(ids))
+    )
+    return {row.id: dict(row._mapping) for row in rows}
+
+
+class _SideEffects:
+    """Counter deltas, card rows and change log entries owed by bulk Core statements."""
+
+    def __init__(self, model: type) -> None:
+        """Start with no pending side effects for a model's table."""
+        self.model = model
+        self.deltas: Dict[Tuple[str, str], int] = defaultdict(int)
+        self.cards: Dict[type, Set[int]] = defaultdict(set)
+        self.changes: Dict[Tuple[str, int], bool] = {}
+
+    def track(
+        self,
+        previous: Optional[Sequence[Mapping[str, Any]]],
+        current: Optional[Sequence[Mapping[str, Any]]],
+    ) -> None:
+        """Record the effects of written rows.
+
+        Args:
+            previous: Tracked row values before the write, None for inserts.
+            current: Tracked row values after the write, None for deletes.
+        """
+        rows = [*(previous or ()), *(current or ())]
+        if not rows:
+            return
+
+        table = self.model.__tablename__
+        columns = self.model.__counted_columns__
+        count = len(previous if previous is not None else current)
+        for before, after in zip(previous or [None] * count, current or [None] * count):
+            for key, delta in CounterService.row_deltas(table, columns, before, after).items():
+                self.deltas[key] += delta
+        for row in current if current is not None else previous:
+            self.changes[(table, row["id"])] = current is None
+
+        parents = {
+            key: {row[key] for row in rows if row[key] is not None}
+            for key in PARENT_COLUMNS.get(table, ())
+        }
+        affected = ProjectionService.affected_by(
+            db.session.connection(), table, {row["id"] for row in rows}, parents
+        )
+        for card_model, ids in affected.items():
+            self.cards[card_model] |= ids
+
+    def apply(self) -> None:
+        """Apply counters, refresh cards and log changes in the open transaction."""
+        if not self.deltas and not self.cards and not self.changes:
+            return
+
+        connection = db.session.connection()
+        CounterService.apply(connection, self.deltas)
+        for card_model, ids in self.cards.items():
+            if ids:
+                ProjectionService.refresh(connection, card_model, ids)
+        ChangeLogService.record(connection, self.changes)
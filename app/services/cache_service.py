@@ -0,0 +1,691 @@
+"""
+Cache Service - Multi-tier caching for read-heavy views and services.
+
+Provides the building blocks every cache in the app goes through:
+- DataVersions: per-table data versions, read from the change log that
+  the BaseModel write listeners maintain
+- Cache: a namespaced cache with an in-process LRU/TTL tier, entry and
+  byte limits, single-flight computes (stampede protection) and hit/miss
+  metrics, optionally backed by a shared tier
+- SQLiteTier / RedisTier: shared tiers (an on-disk SQLite file or a
+  Redis-compatible server) that let worker processes reuse each other's
+  values; picked by ``CACHE_SHARED_BACKEND``
+- SWRCache: TTL cache that serves a stale entry while a single background
+  refresh recomputes it (stale-while-revalidate), stored in a Cache
+
+Entries can be validated against the data version of the tables they were
+built from, so writes invalidate them without the writer knowing which
+caches exist. Data versions are stored in the database and agree across
+processes, so versioned namespaces can use the shared tier too. SWRCache
+entries stay in-process: their age is measured on the process's clock.
+"""
+
+import hashlib
+import pickle
+import sqlite3
+import sys
+import threading
+import time
+from collections import Counter, OrderedDict
+from contextlib import contextmanager
+from dataclasses import dataclass
+from typing import Any, Callable, Dict, Hashable, Iterable, Iterator, List, Optional, Set, Tuple
+
+try:
+    import redis
+except ImportError:  # Optional - only needed for the Redis shared tier
+    redis = None
+
+from flask import current_app
+from sqlalchemy import select
+from app import config
+from app.utils.logging_config import get_crm_logger
+
+logger = get_crm_logger(__name__)
+
+# Returned by cache lookups that found nothing usable
+MISSING = object()
+
+
+class DataVersions:
+    """Per-table data versions for cache invalidation, read from the change log.
+
+    A table's version is its latest change sequence in ``entity_changes``,
+    which every committed entity write moves, and every link write too
+    through the entities that read the link. Versions live in the database,
+    so every worker process reads the same version for the same data.
+    """
+
+    @staticmethod
+    def get(table_names: Iterable[str]) -> Tuple[Optional[int], ...]:
+        """Get the combined data version of a set of tables.
+
+        Link tables are skipped: their writes move the versions of the
+        entity tables they join.
+
+        Args:
+            table_names: Tables a cached value was built from.
+
+        Returns:
+            Tuple of latest change sequences (None for a table without
+            changes) in the given order of the entity tables.
+        """
+        from app.models import db, MODEL_REGISTRY
+        from app.services.change_log_service import ChangeLogService
+
+        entity_tables = {model.__tablename__ for model in MODEL_REGISTRY.values()}
+        tables = [table_name for table_name in table_names if table_name in entity_tables]
+        if not tables:
+            return ()
+        latest = [ChangeLogService.latest(table_name)[0] for table_name in tables]
+        return tuple(db.session.execute(select(*latest)).one())
+
+
+def _size(value: Any) -> int:
+    """Estimate the bytes a value holds, from its pickled form where possible."""
+    try:
+        return len(pickle.dumps(value, pickle.HIGHEST_PROTOCOL))
+    except Exception:
+        return sys.getsizeof(value)
+
+
+@dataclass
+class TierEntry:
+    """Value held by the in-process tier, with its version and limits."""
+
+    value: Any
+    version: Hashable
+    expires_at: Optional[float]
+    size: int
+
+
+class MemoryTier:
+    """In-process LRU store with per-entry expiry and entry and byte limits.
+
+    Attributes:
+        max_entries: Most entries kept, None for no limit.
+        max_bytes: Most estimated bytes kept, None for no limit (sizes are
+            then not computed at all).
+    """
+
+    def __init__(
+        self, metrics: Counter, max_entries: Optional[int], max_bytes: Optional[int]
+    ) -> None:
+        """Initialize an empty tier.
+
+        Args:
+            metrics: Counter receiving eviction and expiry counts.
+            max_entries: Most entries kept, None for no limit.
+            max_bytes: Most estimated bytes kept, None for no limit.
+        """
+        self.max_entries = max_entries
+        self.max_bytes = max_bytes
+        self.bytes = 0
+        self._metrics = metrics
+        self._entries: "OrderedDict[Hashable, TierEntry]" = OrderedDict()
+        self._lock = threading.Lock()
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def get(self, key: Hashable) -> Optional[TierEntry]:
+        """Get a live entry and mark it most recently used."""
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is None:
+                return None
+            if entry.expires_at is not None and entry.expires_at <= time.monotonic():
+                self._remove(key)
+                self._metrics["expirations"] += 1
+                return None
+            self._entries.move_to_end(key)
+            return entry
+
+    def set(self, key: Hashable, value: Any, version: Hashable, ttl: Optional[float]) -> None:
+        """Store an entry, evicting least recently used ones past the limits."""
+        size = _size(value) if self.max_bytes is not None else 0
+        if self.max_bytes is not None and size > self.max_bytes:
+            self._metrics["oversize"] += 1
+            self.delete(key)
+            return
+
+        expires_at = time.monotonic() + ttl if ttl is not None else None
+        with self._lock:
+            self._remove(key)
+            self._entries[key] = TierEntry(value, version, expires_at, size)
+            self.bytes += size
+            while self._entries and (
+                (self.max_entries is not None and len(self._entries) > self.max_entries)
+                or (self.max_bytes is not None and self.bytes > self.max_bytes)
+            ):
+                self._remove(next(iter(self._entries)))
+                self._metrics["evictions"] += 1
+
+    def delete(self, key: Hashable) -> None:
+        """Drop an entry if present."""
+        with self._lock:
+            self._remove(key)
+
+    def clear(self) -> None:
+        """Drop every entry."""
+        with self._lock:
+            self._entries.clear()
+            self.bytes = 0
+
+    def _remove(self, key: Hashable) -> None:
+        """Drop an entry; the caller holds the lock."""
+        entry = self._entries.pop(key, None)
+        if entry is not None:
+            self.bytes -= entry.size
+
+
+class SQLiteTier:
+    """Shared tier in an on-disk SQLite file, for workers on one host.
+
+    Values are pickled with their expiry time. The file keeps a running
+    total of value bytes next to the entries; once a write takes it past
+    ``max_bytes``, the least recently written entries are deleted down to
+    ``TRIM_TO`` of the limit, so trims are rare rather than on every write.
+    """
+
+    # Fraction of max_bytes kept after a trim
+    TRIM_TO = 0.9
+
+    def __init__(self, path: str, max_bytes: int) -> None:
+        """Open (creating if needed) the cache file.
+
+        Args:
+            path: SQLite file path.
+            max_bytes: Most value bytes kept in the file.
+        """
+        self.max_bytes = max_bytes
+        self._lock = threading.Lock()
+        self._connection = sqlite3.connect(path, check_same_thread=False, timeout=5)
+        self._connection.execute("PRAGMA journal_mode=WAL")
+        with self._connection:
+            self._connection.execute(
+                "CREATE TABLE IF NOT EXISTS cache_entries ("
+                "key TEXT PRIMARY KEY, value BLOB NOT NULL, size INTEGER NOT NULL, "
+                "expires_at REAL, stored_at REAL NOT NULL)"
+            )
+            self._connection.execute(
+                "CREATE TABLE IF NOT EXISTS cache_size (bytes INTEGER NOT NULL)"
+            )
+            self._connection.execute(
+                "INSERT INTO cache_size SELECT COALESCE(SUM(size), 0) FROM cache_entries "
+                "WHERE NOT EXISTS (SELECT 1 FROM cache_size)"
+            )
+
+    def get(self, key: str) -> Optional[bytes]:
+        """Get a live value's bytes."""
+        with self._lock:
+            row = self._connection.execute(
+                "SELECT value FROM cache_entries WHERE key = ? "
+                "AND (expires_at IS NULL OR expires_at > ?)",
+                (key, time.time()),
+            ).fetchone()
+        return row[0] if row else None
+
+    def set(self, key: str, data: bytes, ttl: Optional[float]) -> None:
+        """Store a value's bytes, trimming the oldest entries past the byte limit."""
+        now = time.time()
+        with self._lock, self._connection:
+            replaced = self._delete("key = ?", (key,))
+            self._connection.execute(
+                "INSERT INTO cache_entries VALUES (?, ?, ?, ?, ?)",
+                (key, data, len(data), now + ttl if ttl is not None else None, now),
+            )
+            if self._add(len(data) - replaced) > self.max_bytes:
+                self._trim()
+
+    def delete(self, key: str) -> None:
+        """Drop a value."""
+        with self._lock, self._connection:
+            self._add(-self._delete("key = ?", (key,)))
+
+    def clear(self, prefix: str) -> None:
+        """Drop every value whose key starts with a namespace prefix."""
+        with self._lock, self._connection:
+            self._add(-self._delete("substr(key, 1, ?) = ?", (len(prefix), prefix)))
+
+    def _delete(self, where: str, parameters: Tuple[Any, ...]) -> int:
+        """Delete the matching entries, returning their value bytes.
+
+        Deleting first takes the write lock, so the sizes read are the ones removed.
+        """
+        rows = self._connection.execute(
+            f"DELETE FROM cache_entries WHERE {where} RETURNING size", parameters
+        ).fetchall()
+        return sum(size for (size,) in rows)
+
+    def _trim(self) -> None:
+        """Delete the least recently written entries down to TRIM_TO of the limit."""
+        removed = self._delete(
+            "key IN (SELECT key FROM (SELECT key, SUM(size) OVER "
+            "(ORDER BY stored_at DESC, key) AS total FROM cache_entries) WHERE total > ?)",
+            (int(self.max_bytes * self.TRIM_TO),),
+        )
+        self._add(-removed)
+
+    def _add(self, delta: int) -> int:
+        """Adjust the running byte total, returning the new total."""
+        (total,) = self._connection.execute(
+            "UPDATE cache_size SET bytes = bytes + ? RETURNING bytes", (delta,)
+        ).fetchone()
+        return total
+
+
+class RedisTier:
+    """Shared tier on a Redis-compatible server, for workers on any host.
+
+    Expiry is left to the server; values over ``max_bytes`` are not stored.
+    """
+
+    def __init__(self, url: str, max_bytes: int) -> None:
+        """Connect to the server.
+
+        Args:
+            url: ``redis://`` URL.
+            max_bytes: Largest value stored.
+        """
+        self.max_bytes = max_bytes
+        self._client = redis.Redis.from_url(url)
+
+    def get(self, key: str) -> Optional[bytes]:
+        """Get a live value's bytes."""
+        return self._client.get(key)
+
+    def set(self, key: str, data: bytes, ttl: Optional[float]) -> None:
+        """Store a value's bytes unless it is over the size limit."""
+        if len(data) <= self.max_bytes:
+            self._client.set(key, data, px=int(ttl * 1000) if ttl is not None else None)
+
+    def delete(self, key: str) -> None:
+        """Drop a value."""
+        self._client.delete(key)
+
+    def clear(self, prefix: str) -> None:
+        """Drop every value whose key starts with a namespace prefix."""
+        keys = list(self._client.scan_iter(match=f"{prefix}*"))
+        if keys:
+            self._client.delete(*keys)
+
+
+_shared_tier: Any = MISSING
+
+
+def shared_tier() -> Any:
+    """Get the shared tier configured by ``CACHE_SHARED_BACKEND``, or None.
+
+    Built on first use; a tier that cannot be opened is logged and left
+    out so caches keep working in-process.
+    """
+    global _shared_tier
+    if _shared_tier is not MISSING:
+        return _shared_tier
+
+    backend = config.CACHE_SHARED_BACKEND
+    _shared_tier = None
+    try:
+        if backend == "sqlite":
+            _shared_tier = SQLiteTier(config.CACHE_SHARED_URL, config.CACHE_SHARED_MAX_BYTES)
+        elif backend == "redis":
+            if redis is None:
+                raise RuntimeError("the redis package is not installed")
+            _shared_tier = RedisTier(config.CACHE_SHARED_URL, config.CACHE_SHARED_MAX_BYTES)
+    except Exception as e:
+        logger.warning(
+            f"Shared cache tier unavailable, caching in-process only: {e}",
+            extra={"custom_fields": {"backend": backend}},
+        )
+    return _shared_tier
+
+
+class Cache:
+    """Namespaced cache with an in-process tier and an optional shared tier.
+
+    Lookups try the in-process LRU tier, then the shared tier (filling the
+    in-process tier on a hit). A value stored with a version is only served
+    to lookups passing the same version. ``get_or_compute`` lets one thread
+    per key compute a missing value while the others wait for it.
+
+    Attributes:
+        namespace: Name prefixed to shared keys and reported in metrics.
+        ttl: Default seconds an entry lives, None for no expiry.
+        shared: Whether values also go to the shared tier.
+        metrics: Hit, miss, store, eviction and error counts.
+    """
+
+    # Every cache by namespace, for metrics
+    registry: Dict[str, "Cache"] = {}
+
+    def __init__(
+        self,
+        namespace: str,
+        ttl: Optional[float] = None,
+        max_entries: Optional[int] = 1024,
+        max_bytes: Optional[int] = config.CACHE_MAX_BYTES,
+        shared: bool = False,
+    ) -> None:
+        """Initialize an empty cache and register its namespace.
+
+        Args:
+            namespace: Unique cache name.
+            ttl: Default seconds an entry lives, None for no expiry.
+            max_entries: Most in-process entries, None for no limit.
+            max_bytes: Most in-process bytes, None for no limit.
+            shared: Also store values in the configured shared tier.
+        """
+        self.namespace = namespace
+        self.ttl = ttl
+        self.shared = shared
+        self.metrics: Counter = Counter()
+        self._local = MemoryTier(self.metrics, max_entries, max_bytes)
+        self._inflight: Dict[Hashable, List[Any]] = {}
+        self._lock = threading.Lock()
+        Cache.registry[namespace] = self
+
+    def get(self, key: Hashable, version: Hashable = None) -> Any:
+        """Get a value stored with the given version.
+
+        Args:
+            key: Cache key.
+            version: Version the value must have been stored with.
+
+        Returns:
+            The value, or MISSING.
+        """
+        value = self._lookup(key, version)
+        self.metrics["misses" if value is MISSING else "hits"] += 1
+        return value
+
+    def set(
+        self, key: Hashable, value: Any, version: Hashable = None, ttl: Optional[float] = None
+    ) -> None:
+        """Store a value in every tier.
+
+        Args:
+            key: Cache key.
+            value: Value to store.
+            version: Version lookups must pass to get the value.
+            ttl: Seconds the entry lives, defaults to the cache's ttl.
+        """
+        ttl = self.ttl if ttl is None else ttl
+        self._local.set(key, value, version, ttl)
+        self.metrics["stores"] += 1
+        tier = self._shared_tier()
+        if tier is not None:
+            try:
+                data = pickle.dumps((version, value), pickle.HIGHEST_PROTOCOL)
+                tier.set(self._shared_key(key), data, ttl)
+            except Exception:
+                self._shared_error("write")
+
+    def get_or_compute(
+        self, key: Hashable, compute: Callable[[], Any], version: Hashable = None
+    ) -> Any:
+        """Get a value, computing and storing it on a miss.
+
+        Concurrent misses for one key run ``compute`` once; the other
+        callers wait and get its result.
+
+        Args:
+            key: Cache key.
+            compute: Callable building the value.
+            version: Data version the value must match. Read it before
+                computing so a concurrent write is never masked.
+
+        Returns:
+            Cached or freshly computed value.
+        """
+        value = self.get(key, version)
+        if value is not MISSING:
+            return value
+        return self.fill(key, compute, version)
+
+    def fill(self, key: Hashable, compute: Callable[[], Any], version: Hashable = None) -> Any:
+        """Compute and store a value after a miss, once per key.
+
+        Callers arriving while the key is being computed wait and get the
+        stored result instead of computing it again.
+
+        Args:
+            key: Cache key.
+            compute: Callable building the value.
+            version: Data version to store the value with.
+
+        Returns:
+            The stored value.
+        """
+        with self._single_flight(key):
+            value = self._lookup(key, version)
+            if value is not MISSING:
+                self.metrics["coalesced"] += 1
+                return value
+            started = time.perf_counter()
+            value = compute()
+            self.metrics["compute_ms"] += round((time.perf_counter() - started) * 1000)
+            self.set(key, value, version)
+            return value
+
+    def invalidate(self, key: Hashable = None) -> None:
+        """Drop one entry, or every entry of the namespace when no key is given.
+
+        Args:
+            key: Cache key to drop.
+        """
+        tier = self._shared_tier()
+        if key is None:
+            self._local.clear()
+        else:
+            self._local.delete(key)
+        if tier is not None:
+            try:
+                if key is None:
+                    tier.clear(f"{self.namespace}:")
+                else:
+                    tier.delete(self._shared_key(key))
+            except Exception:
+                self._shared_error("delete")
+
+    def stats(self) -> Dict[str, Any]:
+        """Get the cache's metrics and current size."""
+        lookups = self.metrics["hits"] + self.metrics["misses"]
+        return {
+            **self.metrics,
+            "entries": len(self._local),
+            "bytes": self._local.bytes,
+            "hit_rate": round(self.metrics["hits"] / lookups, 3) if lookups else None,
+            "shared": self._shared_tier() is not None,
+        }
+
+    @classmethod
+    def all_stats(cls) -> Dict[str, Dict[str, Any]]:
+        """Get the metrics of every cache by namespace."""
+        return {namespace: cache.stats() for namespace, cache in sorted(cls.registry.items())}
+
+    def _lookup(self, key: Hashable, version: Hashable) -> Any:
+        """Find a value in the tiers without counting the lookup."""
+        entry = self._local.get(key)
+        if entry is not None:
+            return entry.value if entry.version == version else MISSING
+
+        tier = self._shared_tier()
+        if tier is None:
+            return MISSING
+        try:
+            data = tier.get(self._shared_key(key))
+            if data is None:
+                return MISSING
+            stored_version, value = pickle.loads(data)
+        except Exception:
+            self._shared_error("read")
+            return MISSING
+        if stored_version != version:
+            return MISSING
+        self.metrics["shared_hits"] += 1
+        self._local.set(key, value, version, self.ttl)
+        return value
+
+    @contextmanager
+    def _single_flight(self, key: Hashable) -> Iterator[None]:
+        """Hold the key's compute lock, shared by every waiter on the key."""
+        with self._lock:
+            slot = self._inflight.setdefault(key, [threading.Lock(), 0])
+            slot[1] += 1
+        try:
+            with slot[0]:
+                yield
+        finally:
+            with self._lock:
+                slot[1] -= 1
+                if not slot[1]:
+                    del self._inflight[key]
+
+    def _shared_tier(self) -> Any:
+        """Get the shared tier when this namespace uses one."""
+        return shared_tier() if self.shared else None
+
+    def _shared_key(self, key: Hashable) -> str:
+        """Build the namespaced key of a value in the shared tier."""
+        return f"{self.namespace}:{hashlib.sha1(repr(key).encode()).hexdigest()}"
+
+    def _shared_error(self, operation: str) -> None:
+        """Count and log a failed shared tier call; callers fall back to in-process."""
+        self.metrics["shared_errors"] += 1
+        logger.warning(
+            f"Shared cache {operation} failed for {self.namespace}",
+            exc_info=True,
+            extra={"custom_fields": {"cache": self.namespace, "operation": operation}},
+        )
+
+
+@dataclass
+class CacheEntry:
+    """Cached value with the data version and time it was built at."""
+
+    value: Any
+    version: Hashable
+    stored_at: float
+
+
+class SWRCache:
+    """TTL cache with stale-while-revalidate refreshes.
+
+    An entry is fresh while younger than ``ttl`` and built from the current
+    data version. Past that, it is still served for up to ``stale_ttl`` more
+    seconds while one background thread rebuilds it. Older or missing
+    entries are built synchronously, once per key however many requests
+    are waiting. Entries live in an in-process Cache namespace, which drops
+    them once they can no longer be served and reports their metrics.
+
+    Attributes:
+        name: Cache name used in logs and metrics.
+        ttl: Seconds an entry is served without revalidation.
+        stale_ttl: Extra seconds a stale entry may be served while refreshing.
+    """
+
+    def __init__(
+        self, name: str, ttl: float, stale_ttl: float, max_entries: Optional[int] = 1024
+    ) -> None:
+        """Initialize an empty cache.
+
+        Args:
+            name: Cache name used in logs and metrics.
+            ttl: Seconds an entry is served without revalidation.
+            stale_ttl: Extra seconds a stale entry may be served while refreshing.
+            max_entries: Most entries kept, least recently used dropped first.
+        """
+        self.name = name
+        self.ttl = ttl
+        self.stale_ttl = stale_ttl
+        self._cache = Cache(name, ttl=ttl + stale_ttl, max_entries=max_entries, max_bytes=None)
+        self._refreshing: Set[Hashable] = set()
+        self._lock = threading.Lock()
+
+    def get_or_compute(
+        self, key: Hashable, compute: Callable[[], Any], version: Hashable = None
+    ) -> Any:
+        """Get a cached value, computing or refreshing it as needed.
+
+        Args:
+            key: Cache key.
+            compute: Callable building the value; runs inside an app context.
+            version: Data version the value must match to be fresh. Read it
+                before computing so a concurrent write is never masked.
+
+        Returns:
+            Cached, stale or freshly computed value.
+        """
+        return self.get_with_status(key, compute, version)[0]
+
+    def get_with_status(
+        self, key: Hashable, compute: Callable[[], Any], version: Hashable = None
+    ) -> Tuple[Any, str]:
+        """Get a value like get_or_compute and report how it was served.
+
+        Args:
+            key: Cache key.
+            compute: Callable building the value; runs inside an app context.
+            version: Data version the value must match to be fresh.
+
+        Returns:
+            Tuple of value and status: "hit", "stale" or "miss".
+        """
+        entry = self._cache.get(key)
+        if entry is not MISSING:
+            if entry.version == version and time.monotonic() - entry.stored_at < self.ttl:
+                return entry.value, "hit"
+            self._cache.metrics["stale"] += 1
+            self._refresh_in_background(key, compute, version)
+            return entry.value, "stale"
+
+        entry = self._cache.fill(key, lambda: self._build(compute, version))
+        return entry.value, "miss"
+
+    def invalidate(self, key: Hashable = None) -> None:
+        """Drop one entry, or every entry when no key is given.
+
+        Args:
+            key: Cache key to drop.
+        """
+        self._cache.invalidate(key)
+
+    @staticmethod
+    def _build(compute: Callable[[], Any], version: Hashable) -> CacheEntry:
+        """Compute a value into a timestamped entry."""
+        return CacheEntry(compute(), version, time.monotonic())
+
+    def _refresh_in_background(
+        self, key: Hashable, compute: Callable[[], Any], version: Hashable
+    ) -> None:
+        """Start a refresh thread unless one is already running for the key."""
+        with self._lock:
+            if key in self._refreshing:
+                return
+            self._refreshing.add(key)
+
+        app = current_app._get_current_object()
+        thread = threading.Thread(
+            target=self._refresh,
+            args=(app, key, compute, version),
+            name=f"{self.name}-cache-refresh",
+            daemon=True,
+        )
+        thread.start()
+
+    def _refresh(
+        self, app: Any, key: Hashable, compute: Callable[[], Any], version: Hashable
+    ) -> None:
+        """Recompute an entry in its own app context (and database session)."""
+        try:
+            with app.app_context():
+                self._cache.set(key, self._build(compute, version))
+        except Exception:
+            logger.exception(
+                f"Background refresh failed for {self.name} cache",
+                extra={"custom_fields": {"cache": self.name, "key": str(key)}},
+            )
+        finally:
+            with self._lock:
+                self._refreshing.discard(key)
@@ -0,0 +1,302 @@
+"""
+Change Log Service
+
+Maintains the entity_changes log and entity_tombstones table behind delta
+sync. Write listeners queue the ids of inserted, updated and deleted
+entities during a flush; before the transaction commits each entity's log
+row is moved to a new sequence number and deletes leave a tombstone.
+Clients page through ``/api/<table>/changes?since=<cursor>`` and receive
+each changed entity once, as an upsert with its current data or a delete.
+
+Only an entity's own writes are logged; data embedded from related rows
+(e.g. a stakeholder's company name) is refreshed when the entity changes.
+Writes to link tables (task links, MEDDPICC roles, account teams) log the
+entities that read those links, so a relink is a change of its owner.
+"""
+
+from datetime import datetime
+from typing import Any, Dict, Iterable, Mapping, Tuple
+
+from sqlalchemy import func, literal, select
+from sqlalchemy.orm import object_session
+
+from app.models import db, EntityChange, EntityTombstone, MODEL_REGISTRY
+from app.utils.logging_config import get_crm_logger
+
+logger = get_crm_logger(__name__)
+
+# (table name, entity id) to whether the entity was deleted
+ChangeSet = Mapping[Tuple[str, int], bool]
+
+
+class ChangeLogService:
+    """Service for recording and reading entity changes."""
+
+    PENDING_KEY = "pending_entity_changes"
+
+    @classmethod
+    def track(cls, target: Any, deleted: bool) -> None:
+        """Queue a written entity for the change log; the last write wins.
+
+        Args:
+            target: Entity being inserted, updated or deleted.
+            deleted: True when the entity is being deleted.
+        """
+        session = object_session(target)
+        if session is None:
+            return
+
+        pending = session.info.setdefault(cls.PENDING_KEY, {})
+        pending[(target.__tablename__, target.id)] = deleted
+
+    @classmethod
+    def track_ids(cls, session: Any, table_name: str, ids: Iterable[int]) -> None:
+        """Queue entities by id as updated, e.g. the owners of a written link row.
+
+        Args:
+            session: Session performing the write.
+            table_name: Entity table name.
+            ids: Ids of the entities to log.
+        """
+        pending = session.info.setdefault(cls.PENDING_KEY, {})
+        for entity_id in ids:
+            pending.setdefault((table_name, entity_id), False)
+
+    @classmethod
+    def record_link_write(cls, session: Any, owners: Mapping[str, Iterable[int]]) -> None:
+        """Log the owners of link rows written with Core statements.
+
+        Core statements skip the write listeners and may not flush, so the
+        log rows are written at once in the session's transaction.
+
+        Args:
+            session: Session whose transaction wrote the link rows.
+            owners: Entity table name to ids of the entities that read the links.
+        """
+        cls.record(
+            session.connection(),
+            {
+                (table_name, entity_id): False
+                for table_name, ids in owners.items()
+                for entity_id in ids
+            },
+        )
+
+    @classmethod
+    def apply_pending(cls, session: Any) -> None:
+        """Record queued changes inside the session's transaction.
+
+        Args:
+            session: Session that has just flushed.
+        """
+        pending = session.info.pop(cls.PENDING_KEY, None)
+        if pending:
+            cls.record(session.connection(), pending)
+
+    @classmethod
+    def discard(cls, session: Any) -> None:
+        """Forget changes queued by a flush that was rolled back.
+
+        Args:
+            session: Session that has just rolled back.
+        """
+        session.info.pop(cls.PENDING_KEY, None)
+
+    @staticmethod
+    def record(connection: Any, changes: ChangeSet) -> None:
+        """Move changed entities to new sequence numbers and update tombstones.
+
+        Args:
+            connection: Connection to execute on (joins the caller's transaction).
+            changes: Changed entities and whether each was deleted.
+        """
+        log = EntityChange.__table__
+        tombstones = EntityTombstone.__table__
+        now = datetime.utcnow()
+
+        by_table: Dict[str, Dict[int, bool]] = {}
+        for (table_name, entity_id), deleted in changes.items():
+            by_table.setdefault(table_name, {})[entity_id] = deleted
+
+        for table_name, entities in by_table.items():
+            ids = list(entities)
+            connection.execute(
+                log.delete().where(log.c.table_name == table_name, log.c.entity_id.in_(ids))
+            )
+            connection.execute(
+                tombstones.delete().where(
+                    tombstones.c.table_name == table_name, tombstones.c.entity_id.in_(ids)
+                )
+            )
+            connection.execute(
+                log.insert(),
+                [
+                    {"table_name": table_name, "entity_id": entity_id, "changed_at": now}
+                    for entity_id in ids
+                ],
+            )
+            deleted = [entity_id for entity_id, gone in entities.items() if gone]
+            if deleted:
+                connection.execute(
+                    tombstones.insert(),
+                    [
+                        {"table_name": table_name, "entity_id": entity_id, "deleted_at": now}
+                        for entity_id in deleted
+                    ],
+                )
+
+    @staticmethod
+    def changes_since(model: type, since: int, limit: int) -> Dict[str, Any]:
+        """Read the changes to a table after a cursor, oldest first.
+
+        Args:
+            model: Entity model class.
+            since: Sequence number the client has synced up to (0 for all).
+            limit: Maximum number of changes to return.
+
+        Returns:
+            Dictionary with the changes, the cursor to pass next and whether
+            more changes are waiting.
+        """
+        from app.services import SerializationService
+
+        table_name = model.__tablename__
+        rows = db.session.execute(
+            select(EntityChange.seq, EntityChange.entity_id, EntityChange.changed_at)
+            .where(EntityChange.table_name == table_name, EntityChange.seq > since)
+            .order_by(EntityChange.seq)
+            .limit(limit + 1)
+        ).all()
+        has_more = len(rows) > limit
+        rows = rows[:limit]
+
+        ids = [row.entity_id for row in rows]
+        entities = {entity.id: entity for entity in model.query.filter(model.id.in_(ids))}
+        deleted_at = dict(
+            db.session.execute(
+                select(EntityTombstone.entity_id, EntityTombstone.deleted_at).where(
+                    EntityTombstone.table_name == table_name,
+                    EntityTombstone.entity_id.in_(set(ids) - set(entities)),
+                )
+            ).all()
+        )
+
+        serializer = SerializationService.get_serializer(model, native=True)
+        changes = []
+        for row in rows:
+            entity = entities.get(row.entity_id)
+            if entity is None:
+                changes.append(
+                    {
+                        "seq": row.seq,
+                        "op": "delete",
+                        "id": row.entity_id,
+                        "deleted_at": deleted_at.get(row.entity_id, row.changed_at),
+                    }
+                )
+            else:
+                changes.append(
+                    {"seq": row.seq, "op": "upsert", "id": row.entity_id, "data": serializer(entity)}
+                )
+
+        return {
+            "changes": changes,
+            "cursor": rows[-1].seq if rows else since,
+            "has_more": has_more,
+        }
+
+    @staticmethod
+    def latest(table_name: str) -> Tuple[Any, Any]:
+        """Scalar subqueries for a table's latest change sequence and time.
+
+        Args:
+            table_name: Entity table name.
+
+        Returns:
+            Tuple of (sequence, changed_at) expressions, NULL for no changes.
+        """
+        latest = (
+            select(EntityChange.seq, EntityChange.changed_at)
+            .where(EntityChange.table_name == table_name)
+            .order_by(EntityChange.seq.desc())
+            .limit(1)
+        )
+        return (
+            latest.with_only_columns(EntityChange.seq).scalar_subquery(),
+            latest.with_only_columns(EntityChange.changed_at).scalar_subquery(),
+        )
+
+    @classmethod
+    def ensure_built(cls) -> None:
+        """Build the change log when it is empty (called at startup).
+
+        Covers databases created before the change log existed, so a first
+        sync from cursor 0 returns the full collection. Writes missed by
+        bulk statements are repaired by ``flask reconcile-change-log``.
+        """
+        if not db.session.query(select(EntityChange.seq).exists()).scalar():
+            cls.reconcile()
+
+    @classmethod
+    def reconcile(cls) -> Dict[str, int]:
+        """Log entity writes the listeners missed.
+
+        Covers bulk statements (``Query.delete()``, raw SQL) that skip the
+        listeners: unlogged rows are logged as upserts, and logged rows that
+        no longer exist are logged as deletes with a tombstone.
+
+        Returns:
+            Dictionary of table name to number of changes logged, for the
+            tables that had any.
+        """
+        logged_changes = {}
+        log = EntityChange.__table__
+        tombstones = EntityTombstone.__table__
+        for model in MODEL_REGISTRY.values():
+            table_name = model.__tablename__
+            logged = select(log.c.entity_id).where(log.c.table_name == table_name)
+
+            source = (
+                select(
+                    literal(table_name),
+                    model.id,
+                    func.coalesce(model.updated_at, literal(datetime.utcnow())),
+                )
+                .where(model.id.notin_(logged))
+                .order_by(model.id)
+            )
+            inserted = db.session.execute(
+                log.insert().from_select(["table_name", "entity_id", "changed_at"], source)
+            ).rowcount
+
+            gone = db.session.scalars(
+                logged.where(
+                    log.c.entity_id.notin_(select(model.id)),
+                    log.c.entity_id.notin_(
+                        select(tombstones.c.entity_id).where(
+                            tombstones.c.table_name == table_name
+                        )
+                    ),
+                )
+            ).all()
+            if gone:
+                cls.record(
+                    db.session.connection(), {(table_name, entity_id): True for entity_id in gone}
+                )
+            db.session.commit()
+
+            if inserted or gone:
+                logged_changes[table_name] = inserted + len(gone)
+                logger.info(
+                    "Reconciled change log",
+                    extra={
+                        "custom_fields": {
+                            "operation": "reconcile_change_log",
+                            "table_name": table_name,
+                            "logged": inserted,
+                            "deleted": len(gone),
+                        }
+                    },
+                )
+
+        return logged_changes
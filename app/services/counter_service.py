@@ -0,0 +1,297 @@
+"""
+Counter Service
+
+Maintains the entity_counters table: a running total per entity table and
+a count per value of each model's ``__counted_columns__`` (opportunity
+stage, task status). Write listeners queue +1/-1 deltas during a flush,
+including value transitions on update, and the deltas are applied before
+the transaction commits so counters move atomically with the rows.
+"""
+
+from collections import defaultdict
+from typing import Any, Dict, Iterable, List, Mapping, Optional, Tuple
+
+from sqlalchemy import func, inspect, select
+from sqlalchemy.dialects.sqlite import insert
+from sqlalchemy.orm import object_session
+
+from app.models import db, EntityCounter, MODEL_REGISTRY
+from app.utils.logging_config import get_crm_logger
+
+logger = get_crm_logger(__name__)
+
+TOTAL = "total"
+
+# Counter name for rows whose counted column is NULL
+NO_VALUE = "none"
+
+CounterKey = Tuple[str, str]
+
+
+def counter_name(column: str, value: Any) -> str:
+    """Build the counter name for one value of a counted column."""
+    value = getattr(value, "value", value)  # Enum members count by value
+    return f"{column}:{NO_VALUE if value is None else value}"
+
+
+def _column_value(target: Any, column: str, previous: bool) -> Any:
+    """Get a column's value before or after the current flush."""
+    history = inspect(target).attrs[column].history
+    if previous:
+        values = history.deleted or history.unchanged
+    else:
+        values = history.added or history.unchanged
+    return values[0] if values else getattr(target, column)
+
+
+class CounterService:
+    """Service for maintaining and reading entity counters."""
+
+    PENDING_KEY = "pending_counter_deltas"
+
+    @staticmethod
+    def deltas(target: Any, operation: str) -> Dict[CounterKey, int]:
+        """Get the counter changes caused by writing an entity.
+
+        Args:
+            target: Entity being inserted, updated or deleted.
+            operation: "insert", "update" or "delete".
+
+        Returns:
+            Dictionary of (table, counter name) to delta.
+        """
+        columns = target.__counted_columns__
+        if operation == "update":
+            state = inspect(target)
+            columns = [c for c in columns if state.attrs[c].history.has_changes()]
+
+        previous = current = None
+        if operation in ("update", "delete"):
+            previous = {c: _column_value(target, c, previous=True) for c in columns}
+        if operation in ("insert", "update"):
+            current = {c: _column_value(target, c, previous=False) for c in columns}
+
+        return CounterService.row_deltas(target.__tablename__, columns, previous, current)
+
+    @staticmethod
+    def row_deltas(
+        table_name: str,
+        columns: Iterable[str],
+        previous: Optional[Mapping[str, Any]],
+        current: Optional[Mapping[str, Any]],
+    ) -> Dict[CounterKey, int]:
+        """Get the counter changes of a row moving between column values.
+
+        Used directly by writers that bypass the ORM (bulk statements).
+
+        Args:
+            table_name: Table of the written row.
+            columns: Counted columns to compare.
+            previous: Counted column values before the write, None for an insert.
+            current: Counted column values after the write, None for a delete.
+
+        Returns:
+            Dictionary of (table, counter name) to delta.
+        """
+        changes = defaultdict(int)
+
+        if previous is None:
+            changes[(table_name, TOTAL)] += 1
+        if current is None:
+            changes[(table_name, TOTAL)] -= 1
+
+        for column in columns:
+            if previous is not None and current is not None:
+                if previous[column] == current[column]:
+                    continue
+            if previous is not None:
+                changes[(table_name, counter_name(column, previous[column]))] -= 1
+            if current is not None:
+                changes[(table_name, counter_name(column, current[column]))] += 1
+
+        return changes
+
+    @classmethod
+    def track(cls, target: Any, operation: str) -> None:
+        """Queue the counter changes of a write for the end of the flush.
+
+        Args:
+            target: Entity being inserted, updated or deleted.
+            operation: "insert", "update" or "delete".
+        """
+        session = object_session(target)
+        if session is None:
+            return
+
+        pending = session.info.setdefault(cls.PENDING_KEY, defaultdict(int))
+        for key, delta in cls.deltas(target, operation).items():
+            pending[key] += delta
+
+    @classmethod
+    def apply_pending(cls, session: Any) -> None:
+        """Apply queued counter deltas inside the session's transaction.
+
+        Args:
+            session: Session that has just flushed.
+        """
+        pending = session.info.pop(cls.PENDING_KEY, None)
+        if pending:
+            cls.apply(session.connection(), pending)
+
+    @classmethod
+    def discard(cls, session: Any) -> None:
+        """Forget deltas queued by a flush that was rolled back.
+
+        Args:
+            session: Session that has just rolled back.
+        """
+        session.info.pop(cls.PENDING_KEY, None)
+
+    @staticmethod
+    def apply(connection: Any, deltas: Dict[CounterKey, int]) -> None:
+        """Add deltas to stored counters, creating missing counter rows.
+
+        A single upsert covers every counter, instead of an UPDATE followed
+        by an INSERT whenever no row matched.
+
+        Args:
+            connection: Connection to execute on (joins the caller's transaction).
+            deltas: Dictionary of (table, counter name) to delta.
+        """
+        rows = [
+            {"table_name": table_name, "name": name, "value": delta}
+            for (table_name, name), delta in deltas.items()
+            if delta
+        ]
+        if not rows:
+            return
+
+        table = EntityCounter.__table__
+        upsert = insert(table)
+        connection.execute(
+            upsert.on_conflict_do_update(
+                index_elements=[table.c.table_name, table.c.name],
+                set_={"value": table.c.value + upsert.excluded.value},
+            ),
+            rows,
+        )
+
+    @staticmethod
+    def counter(table_name: str, name: str = TOTAL) -> Any:
+        """Get a stored counter as a scalar subquery for aggregate SELECTs.
+
+        Args:
+            table_name: Entity table the counter belongs to.
+            name: Counter name, see counter_name().
+
+        Returns:
+            SQL expression evaluating to the counter value (0 when missing).
+        """
+        return func.coalesce(
+            select(EntityCounter.value)
+            .where(EntityCounter.table_name == table_name, EntityCounter.name == name)
+            .scalar_subquery(),
+            0,
+        )
+
+    @staticmethod
+    def compute() -> Dict[CounterKey, int]:
+        """Count every counter from scratch with one GROUP BY per column.
+
+        Returns:
+            Dictionary of (table, counter name) to actual count.
+        """
+        counts = {}
+        for model in MODEL_REGISTRY.values():
+            table = model.__tablename__
+            counts[(table, TOTAL)] = db.session.query(func.count(model.id)).scalar()
+            for column in model.__counted_columns__:
+                attribute = getattr(model, column)
+                rows = db.session.query(attribute, func.count(model.id)).group_by(attribute)
+                for value, count in rows:
+                    counts[(table, counter_name(column, value))] = count
+        return counts
+
+    @staticmethod
+    def stored() -> Dict[CounterKey, int]:
+        """Read every stored counter.
+
+        Returns:
+            Dictionary of (table, counter name) to stored count.
+        """
+        return {
+            (row.table_name, row.name): row.value
+            for row in EntityCounter.query.all()
+        }
+
+    @classmethod
+    def reconcile(cls, fix: bool = False) -> List[Dict[str, Any]]:
+        """Compare stored counters with a full recount.
+
+        Args:
+            fix: Rebuild the counters when any have drifted.
+
+        Returns:
+            One dictionary per drifted counter with stored and actual values.
+        """
+        actual = cls.compute()
+        stored = cls.stored()
+        drift = [
+            {
+                "table": table_name,
+                "name": name,
+                "stored": stored.get((table_name, name), 0),
+                "actual": actual.get((table_name, name), 0),
+            }
+            for table_name, name in sorted(actual.keys() | stored.keys())
+            if stored.get((table_name, name), 0) != actual.get((table_name, name), 0)
+        ]
+
+        if drift:
+            logger.warning(
+                "Entity counters drifted",
+                extra={"custom_fields": {"operation": "reconcile_counters", "drift": drift}},
+            )
+            if fix:
+                cls.rebuild(actual)
+
+        return drift
+
+    @classmethod
+    def rebuild(cls, counts: Optional[Dict[CounterKey, int]] = None) -> int:
+        """Replace every stored counter with a full recount in one transaction.
+
+        Args:
+            counts: Precomputed counts, recounted when omitted.
+
+        Returns:
+            Number of counter rows written.
+        """
+        counts = cls.compute() if counts is None else counts
+        table = EntityCounter.__table__
+        rows = [
+            {"table_name": table_name, "name": name, "value": value}
+            for (table_name, name), value in counts.items()
+        ]
+
+        db.session.execute(table.delete())
+        if rows:
+            db.session.execute(table.insert(), rows)
+        db.session.commit()
+
+        logger.info(
+            "Rebuilt entity counters",
+            extra={"custom_fields": {"operation": "rebuild_counters", "rows": len(rows)}},
+        )
+        return len(rows)
+
+    @classmethod
+    def ensure_built(cls) -> None:
+        """Build the counters when the table is empty (called at startup).
+
+        Covers databases created before the table existed. Drift from bulk
+        statements (``Query.delete()``, raw SQL) that skip the listeners is
+        repaired by ``flask reconcile-counters --fix``, not on every start.
+        """
+        if not db.session.query(select(EntityCounter.table_name).exists()).scalar():
+            cls.rebuild()
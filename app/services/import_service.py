@@ -0,0 +1,483 @@
+"""
+Import Service
+
+Streaming CSV and XLSX imports of entity tables, run as background jobs.
+Rows are read one at a time, converted and validated against the model's
+column types and ``info`` metadata (required, choices, min/max values),
+and inserted through BulkService in chunks of IMPORT_CHUNK_SIZE - one
+transaction per chunk - so memory stays flat for files of any length.
+
+Foreign keys may be given by id or by name: ``company`` or ``Company``
+resolves against a name to id map of the referenced table loaded once per
+import, instead of one query per row.
+
+openpyxl is optional; without it only CSV files can be imported.
+"""
+
+import csv
+import io
+import os
+import tempfile
+import threading
+import time
+import uuid
+from dataclasses import dataclass, field
+from datetime import date, datetime
+from typing import Any, Callable, Dict, Iterator, List, Optional, Sequence, Tuple
+
+from flask import current_app
+from sqlalchemy import select
+
+try:
+    import openpyxl
+except ImportError:  # Optional - XLSX imports need openpyxl
+    openpyxl = None
+
+from app import config
+from app.models import db
+from app.services.bulk_service import BulkItemError, BulkService
+from app.utils.logging_config import get_crm_logger
+
+logger = get_crm_logger(__name__)
+
+# Row errors kept on a job for the progress report (all are counted)
+MAX_REPORTED_ERRORS = 100
+
+# Seconds a finished job stays available to the progress endpoint
+JOB_RETENTION = 3600
+
+TRUE_VALUES = ("true", "yes", "y", "1")
+FALSE_VALUES = ("false", "no", "n", "0")
+
+
+@dataclass
+class ImportJob:
+    """Progress of one import.
+
+    Attributes:
+        id: Job id used by the progress endpoint.
+        table_name: Entity table being imported into.
+        filename: Name of the uploaded file.
+        status: queued, running, completed or failed.
+        progress: Fraction of the file read, 0 to 1.
+        rows: Data rows read so far.
+        created: Rows inserted so far.
+        failed: Rows rejected so far.
+        errors: First MAX_REPORTED_ERRORS row errors as ``{"row", "error"}``.
+        error: Reason the whole job failed, if it did.
+    """
+
+    id: str
+    table_name: str
+    filename: str
+    status: str = "queued"
+    progress: float = 0.0
+    rows: int = 0
+    created: int = 0
+    failed: int = 0
+    errors: List[Dict[str, Any]] = field(default_factory=list)
+    error: Optional[str] = None
+    started_at: Optional[datetime] = None
+    finished_at: Optional[datetime] = None
+
+    def reject(self, row: int, message: str) -> None:
+        """Count a rejected row and keep its error while there is room."""
+        self.failed += 1
+        if len(self.errors) < MAX_REPORTED_ERRORS:
+            self.errors.append({"row": row, "error": message})
+
+    def to_dict(self) -> Dict[str, Any]:
+        """Convert to the progress endpoint response body."""
+        return {
+            "id": self.id,
+            "table": self.table_name,
+            "filename": self.filename,
+            "status": self.status,
+            "progress": round(self.progress, 4),
+            "rows": self.rows,
+            "created": self.created,
+            "failed": self.failed,
+            "errors": self.errors,
+            "error": self.error,
+            "started_at": self.started_at.isoformat() if self.started_at else None,
+            "finished_at": self.finished_at.isoformat() if self.finished_at else None,
+        }
+
+
+class ImportService:
+    """Service for streaming file imports into entity tables."""
+
+    _jobs: Dict[str, ImportJob] = {}
+    _finished: Dict[str, float] = {}
+    _lock = threading.Lock()
+
+    @staticmethod
+    def formats() -> Tuple[str, ...]:
+        """File formats that can be imported with the installed packages."""
+        return ("csv", "xlsx") if openpyxl is not None else ("csv",)
+
+    @classmethod
+    def start(cls, model: type, upload: Any, file_format: str) -> ImportJob:
+        """Save an upload and import it in a background thread.
+
+        Args:
+            model: Entity model class.
+            upload: Uploaded file (werkzeug FileStorage).
+            file_format: ``csv`` or ``xlsx``.
+
+        Returns:
+            The queued job.
+        """
+        fd, path = tempfile.mkstemp(suffix=f".{file_format}")
+        os.close(fd)
+        upload.save(path)
+
+        job = ImportJob(uuid.uuid4().hex, model.__tablename__, upload.filename or "")
+        with cls._lock:
+            cls._prune()
+            cls._jobs[job.id] = job
+
+        app = current_app._get_current_object()
+        thread = threading.Thread(
+            target=cls._run_in_background,
+            args=(app, model, job, path, file_format),
+            name="entity-import",
+            daemon=True,
+        )
+        thread.start()
+        return job
+
+    @classmethod
+    def get_job(cls, job_id: str) -> Optional[ImportJob]:
+        """Get a queued, running or recently finished job."""
+        with cls._lock:
+            return cls._jobs.get(job_id)
+
+    @classmethod
+    def _prune(cls) -> None:
+        """Forget jobs finished more than JOB_RETENTION seconds ago."""
+        cutoff = time.monotonic() - JOB_RETENTION
+        for job_id in [key for key, finished in cls._finished.items() if finished < cutoff]:
+            cls._jobs.pop(job_id, None)
+            del cls._finished[job_id]
+
+    @classmethod
+    def _run_in_background(
+        cls, app: Any, model: type, job: ImportJob, path: str, file_format: str
+    ) -> None:
+        """Run an import in its own app context (and database session)."""
+        try:
+            with app.app_context():
+                cls.run(model, job, path, file_format)
+        except Exception as e:
+            job.status = "failed"
+            job.error = str(e)
+            logger.exception(
+                "Import failed",
+                extra={"custom_fields": {"operation": "import", "job_id": job.id}},
+            )
+        finally:
+            os.remove(path)
+            job.finished_at = job.finished_at or datetime.utcnow()
+            with cls._lock:
+                cls._finished[job.id] = time.monotonic()
+
+    @classmethod
+    def run(cls, model: type, job: ImportJob, path: str, file_format: str) -> ImportJob:
+        """Import a file, updating the job as chunks are written.
+
+        Args:
+            model: Entity model class.
+            job: Job to report progress on.
+            path: Path of the file.
+            file_format: ``csv`` or ``xlsx``.
+
+        Returns:
+            The finished job.
+        """
+        job.status = "running"
+        job.started_at = datetime.utcnow()
+
+        rows = cls.read_rows(path, file_format)
+        header = next(rows, None)
+        if header is None:
+            job.status, job.error = "failed", "File is empty"
+            return job
+
+        try:
+            converters = cls.converters(model, header[0])
+        except BulkItemError as e:
+            job.status, job.error = "failed", str(e)
+            return job
+
+        chunk: List[Tuple[int, Dict[str, Any]]] = []
+        for row_number, (cells, progress) in enumerate(rows, start=2):
+            job.progress = progress
+            if all(cell is None or str(cell).strip() == "" for cell in cells):
+                continue
+
+            job.rows += 1
+            try:
+                chunk.append((row_number, cls.convert_row(converters, cells)))
+            except BulkItemError as e:
+                job.reject(row_number, str(e))
+
+            if len(chunk) >= config.IMPORT_CHUNK_SIZE:
+                cls._insert(model, job, chunk)
+                chunk = []
+        if chunk:
+            cls._insert(model, job, chunk)
+
+        job.status = "completed"
+        job.progress = 1.0
+        job.finished_at = datetime.utcnow()
+        logger.info(
+            "Import completed",
+            extra={
+                "custom_fields": {
+                    "operation": "import",
+                    "job_id": job.id,
+                    "table_name": job.table_name,
+                    "rows": job.rows,
+                    "created": job.created,
+                    "failed": job.failed,
+                }
+            },
+        )
+        return job
+
+    @staticmethod
+    def _insert(model: type, job: ImportJob, chunk: Sequence[Tuple[int, Dict[str, Any]]]) -> None:
+        """Insert one chunk of converted rows and record their outcomes."""
+        result = BulkService.execute(model, creates=[data for _, data in chunk])
+        for (row_number, _), item in zip(chunk, result.results["create"]):
+            if item["status"] == "failed":
+                job.reject(row_number, item["error"])
+            else:
+                job.created += 1
+
+    @staticmethod
+    def read_rows(path: str, file_format: str) -> Iterator[Tuple[Sequence[Any], float]]:
+        """Stream a file's rows, header first, with the fraction read so far.
+
+        Args:
+            path: Path of the file.
+            file_format: ``csv`` or ``xlsx``.
+
+        Yields:
+            Tuples of (cells, progress).
+        """
+        if file_format == "xlsx":
+            workbook = openpyxl.load_workbook(path, read_only=True, data_only=True)
+            try:
+                sheet = workbook.active
+                total = sheet.max_row or 0
+                for number, cells in enumerate(sheet.iter_rows(values_only=True), start=1):
+                    yield cells, min(number / total, 1.0) if total else 0.0
+            finally:
+                workbook.close()
+            return
+
+        size = os.path.getsize(path) or 1
+        with open(path, "rb") as raw:
+            text = io.TextIOWrapper(raw, encoding="utf-8-sig", newline="")
+            for cells in csv.reader(text):
+                yield cells, raw.tell() / size
+
+    @classmethod
+    def converters(
+        cls, model: type, header: Sequence[Any]
+    ) -> List[Tuple[Optional[str], Any]]:
+        """Match header cells to columns and build a converter for each.
+
+        Headers match a column name, its display label, or for foreign keys
+        the name without ``_id`` (``company`` for ``company_id``), ignoring
+        case, spaces and underscores. Blank header cells are skipped.
+
+        Args:
+            model: Entity model class.
+            header: Header row cells.
+
+        Returns:
+            One (column key, converter) pair per header cell; the key is
+            None for skipped cells.
+
+        Raises:
+            BulkItemError: If a header matches no column or repeats one.
+        """
+        columns = BulkService.column_map(model)
+        aliases = {}
+        for key, column in columns.items():
+            names = [key, column.info.get("display_label", key)]
+            if column.foreign_keys and key.endswith("_id"):
+                names.append(key[: -len("_id")])
+            for name in names:
+                aliases.setdefault(_normalize(name), key)
+
+        named = [cell is not None and str(cell).strip() != "" for cell in header]
+        keys = [
+            aliases.get(_normalize(cell)) if name else None for cell, name in zip(header, named)
+        ]
+        unknown = [str(cell) for cell, key, name in zip(header, keys, named) if name and not key]
+        if unknown:
+            raise BulkItemError(f"Unknown column(s): {', '.join(unknown)}")
+        repeated = sorted({key for key in keys if key and keys.count(key) > 1})
+        if repeated:
+            raise BulkItemError(f"Repeated column(s): {', '.join(repeated)}")
+
+        return [(key, cls._converter(columns[key]) if key else None) for key in keys]
+
+    @classmethod
+    def _converter(cls, column: Any) -> Callable[[Any], Any]:
+        """Build the function converting one cell for a column."""
+        info = column.info
+        label = info.get("display_label", column.key)
+        # Blank cells of columns with a default take the default
+        required = info.get("required", False) and column.default is None
+
+        if column.foreign_keys:
+            names = cls._name_lookup(column)
+
+            def convert_reference(value: Any) -> Any:
+                if value is None:
+                    return None
+                if isinstance(value, int) or str(value).isdigit():
+                    return int(value)
+                if names is None or _normalize(value) not in names:
+                    raise BulkItemError(f"{label}: unknown '{value}'")
+                return names[_normalize(value)]
+
+            return _checked(convert_reference, label, required)
+
+        convert = _typed(column, label)
+        choices = info.get("choices") if info.get("filter_type") != "range" else None
+        if choices:
+            keys = {_normalize(key): key for key in choices}
+            keys.update(
+                (_normalize(choice.get("label", key)), key) for key, choice in choices.items()
+            )
+            allowed = ", ".join(choices)
+
+            def convert_choice(value: Any) -> Any:
+                value = convert(value)
+                if value is None:
+                    return None
+                if _normalize(value) not in keys:
+                    raise BulkItemError(f"{label}: must be one of {allowed}")
+                return keys[_normalize(value)]
+
+            return _checked(convert_choice, label, required)
+
+        low, high = info.get("min_value"), info.get("max_value")
+        if low is not None or high is not None:
+
+            def convert_bounded(value: Any) -> Any:
+                value = convert(value)
+                if value is not None and (
+                    (low is not None and value < low) or (high is not None and value > high)
+                ):
+                    raise BulkItemError(f"{label}: must be between {low} and {high}")
+                return value
+
+            return _checked(convert_bounded, label, required)
+
+        return _checked(convert, label, required)
+
+    @staticmethod
+    def _name_lookup(column: Any) -> Optional[Dict[str, int]]:
+        """Load the name to id map of the table a foreign key references.
+
+        Returns None when the referenced table has no ``name`` column. The
+        first (lowest id) row wins when names repeat.
+        """
+        target = next(iter(column.foreign_keys)).column.table
+        if "name" not in target.c:
+            return None
+        names: Dict[str, int] = {}
+        rows = db.session.execute(
+            select(target.c.id, target.c.name).order_by(target.c.id)
+        )
+        for row_id, name in rows:
+            if name:
+                names.setdefault(_normalize(name), row_id)
+        return names
+
+    @staticmethod
+    def convert_row(
+        converters: Sequence[Tuple[Optional[str], Any]], cells: Sequence[Any]
+    ) -> Dict[str, Any]:
+        """Convert one row's cells, leaving blank cells to column defaults.
+
+        Raises:
+            BulkItemError: If a cell is invalid or a required cell is blank.
+        """
+        data = {}
+        for index, (key, convert) in enumerate(converters):
+            if key is None:
+                continue
+            value = convert(cells[index] if index < len(cells) else None)
+            if value is not None:
+                data[key] = value
+        return data
+
+
+def _normalize(value: Any) -> str:
+    """Compare header and choice names ignoring case, spaces and underscores."""
+    return str(value).strip().lower().replace("_", "").replace(" ", "")
+
+
+def _checked(convert: Callable[[Any], Any], label: str, required: bool) -> Callable[[Any], Any]:
+    """Treat blank cells as missing and reject them for required columns."""
+
+    def convert_cell(value: Any) -> Any:
+        if isinstance(value, str):
+            value = value.strip()
+        if value is None or value == "":
+            if required:
+                raise BulkItemError(f"{label}: required")
+            return None
+        return convert(value)
+
+    return convert_cell
+
+
+def _typed(column: Any, label: str) -> Callable[[Any], Any]:
+    """Build the converter from a cell to the column's Python type."""
+    try:
+        python_type = column.type.python_type
+    except NotImplementedError:
+        python_type = str
+    length = getattr(column.type, "length", None)
+
+    def convert(value: Any) -> Any:
+        if value is None:
+            return None
+        try:
+            # bool before int and datetime before date: each subclasses the other
+            if python_type is bool:
+                text = str(value).lower()
+                if text not in TRUE_VALUES + FALSE_VALUES:
+                    raise ValueError
+                return text in TRUE_VALUES
+            if python_type is int:
+                number = float(value)
+                if not number.is_integer():
+                    raise ValueError
+                return int(number)
+            if python_type is float:
+                return float(value)
+            if python_type is datetime:
+                return value if isinstance(value, datetime) else datetime.fromisoformat(value)
+            if python_type is date:
+                if isinstance(value, datetime):
+                    return value.date()
+                return value if isinstance(value, date) else date.fromisoformat(value)
+        except (TypeError, ValueError):
+            raise BulkItemError(f"{label}: invalid {python_type.__name__} '{value}'")
+
+        text = str(value)
+        if length and len(text) > length:
+            raise BulkItemError(f"{label}: longer than {length} characters")
+        return text
+
+    return convert
@@ -0,0 +1,215 @@
+"""
+Include Service
+
+Relationship expansion for the entity API (``?include=company,tasks``).
+Related entities are loaded dataloader-style: each requested relationship
+is resolved with one query over every entity id of the response, never
+one query per row. The query selects the owning id next to the related
+entity's columns, so no model instances are hydrated; each related entity
+is serialized once into ``included`` under its table name and rows
+reference it by id in their ``relationships``.
+
+Includable names are a model's relationships to other entity models, the
+polymorphic task links (``tasks`` on linked entities; ``companies``,
+``stakeholders`` and ``opportunities`` on tasks) and attached ``notes``.
+Included entities carry their columns; computed properties stay on the
+entity's own endpoint.
+"""
+
+from dataclasses import dataclass
+from typing import Any, Callable, Dict, Iterable, List, Sequence, Tuple
+
+from sqlalchemy import inspect, select
+from sqlalchemy.orm import aliased
+
+from app.models import db, MODEL_REGISTRY, Note, Task, User
+from app.models.task import task_entities
+
+# Entity types task_entities links tasks to
+TASK_LINK_TYPES = ("company", "stakeholder", "opportunity")
+
+
+@dataclass(frozen=True)
+class Include:
+    """One includable relationship of a model.
+
+    ``statement`` builds a SELECT of ``(owner id, *target columns)`` for
+    the owner ids it is given (a list or an id subquery).
+    """
+
+    name: str
+    model: type
+    many: bool
+    tables: Tuple[str, ...]
+    statement: Callable[[Any], Any]
+
+
+class IncludeService:
+    """Service for batched relationship expansion of API responses."""
+
+    # Includable relationships keyed by model class
+    _includes: Dict[type, Dict[str, Include]] = {}
+
+    @classmethod
+    def includes(cls, model: type) -> Dict[str, Include]:
+        """Get a model's includable relationships, building them on first use."""
+        includes = cls._includes.get(model)
+        if includes is None:
+            includes = cls._includes[model] = cls._build(model)
+        return includes
+
+    @classmethod
+    def parse(cls, model: type, value: str) -> List[Include]:
+        """Resolve a comma-separated ``include`` argument.
+
+        Args:
+            model: Entity model class of the response.
+            value: Requested names, e.g. ``company,stakeholders``.
+
+        Returns:
+            Includes in request order, without repeats.
+
+        Raises:
+            ValueError: If a name is not includable for the model.
+        """
+        available = cls.includes(model)
+        names = list(dict.fromkeys(name.strip() for name in value.split(",") if name.strip()))
+        unknown = [name for name in names if name not in available]
+        if unknown:
+            raise ValueError(
+                f"Unknown include(s): {', '.join(unknown)}. "
+                f"Available: {', '.join(sorted(available)) or 'none'}"
+            )
+        return [available[name] for name in names]
+
+    @staticmethod
+    def tables(includes: Iterable[Include]) -> Tuple[str, ...]:
+        """Tables read by a set of includes, for response validators."""
+        return tuple(dict.fromkeys(table for include in includes for table in include.tables))
+
+    @classmethod
+    def resolve(
+        cls, includes: Sequence[Include], rows: List[Dict[str, Any]], ids: Any
+    ) -> Dict[str, List[Dict[str, Any]]]:
+        """Load the included entities of a response.
+
+        Runs one query per include. Each row gains a ``relationships`` map
+        of include name to the related id (to-one) or ids (to-many).
+
+        Args:
+            includes: Includes from ``parse``.
+            rows: Serialized response rows, each with its ``id``.
+            ids: Ids of the rows: a list or an id subquery.
+
+        Returns:
+            Included entities keyed by table name, each entity once.
+        """
+        for row in rows:
+            row["relationships"] = {
+                include.name: [] if include.many else None for include in includes
+            }
+        by_id = {row["id"]: row for row in rows}
+        included: Dict[str, Dict[int, Dict[str, Any]]] = {}
+
+        for include in includes:
+            names = [column.name for column in include.model.__table__.columns]
+            entities = included.setdefault(include.model.__tablename__, {})
+            for owner_id, *values in db.session.execute(include.statement(ids)):
+                row = by_id.get(owner_id)
+                if row is None:
+                    continue
+                entity = dict(zip(names, values))
+                entities.setdefault(entity["id"], entity)
+                if include.many:
+                    row["relationships"][include.name].append(entity["id"])
+                else:
+                    row["relationships"][include.name] = entity["id"]
+
+        return {table: list(entities.values()) for table, entities in included.items()}
+
+    @classmethod
+    def _build(cls, model: type) -> Dict[str, Include]:
+        """Collect the includable relationships of a model."""
+        entity_models = set(MODEL_REGISTRY.values())
+        includes = {}
+        for name, relationship in inspect(model).relationships.items():
+            target = relationship.mapper.class_
+            if relationship.viewonly or target not in entity_models:
+                continue
+            tables = (target.__tablename__,)
+            if relationship.secondary is not None:
+                tables += (relationship.secondary.name,)
+            includes[name] = Include(
+                name, target, relationship.uselist, tables, cls._relationship_statement(model, name)
+            )
+
+        entity_type = next(key for key, value in MODEL_REGISTRY.items() if value is model)
+        if entity_type in TASK_LINK_TYPES:
+            includes["tasks"] = Include(
+                "tasks",
+                Task,
+                True,
+                ("tasks", "task_entities"),
+                cls._task_link_statement(Task, entity_type, owner=task_entities.c.entity_id),
+            )
+        if model is Task:
+            for link_type in TASK_LINK_TYPES:
+                target = MODEL_REGISTRY[link_type]
+                includes[target.__tablename__] = Include(
+                    target.__tablename__,
+                    target,
+                    True,
+                    (target.__tablename__, "task_entities"),
+                    cls._task_link_statement(target, link_type, owner=task_entities.c.task_id),
+                )
+        if model not in (Note, User):
+            includes["notes"] = Include(
+                "notes", Note, True, ("notes",), cls._note_statement(entity_type)
+            )
+        return includes
+
+    @staticmethod
+    def _relationship_statement(model: type, name: str) -> Callable[[Any], Any]:
+        """Build the query of a mapped relationship, joined through any secondary."""
+        target = aliased(inspect(model).relationships[name].mapper.class_)
+        columns = list(inspect(target).selectable.c)
+
+        def statement(ids):
+            return (
+                select(model.id, *columns)
+                .join(getattr(model, name).of_type(target))
+                .where(model.id.in_(ids))
+                .order_by(model.id, inspect(target).selectable.c.id)
+            )
+
+        return statement
+
+    @staticmethod
+    def _task_link_statement(target: type, link_type: str, owner: Any) -> Callable[[Any], Any]:
+        """Build the query of a task_entities link, from either side."""
+        table = target.__table__
+        linked = task_entities.c.task_id if target is Task else task_entities.c.entity_id
+
+        def statement(ids):
+            return (
+                select(owner, *table.c)
+                .join(table, table.c.id == linked)
+                .where(task_entities.c.entity_type == link_type, owner.in_(ids))
+                .order_by(owner, table.c.id)
+            )
+
+        return statement
+
+    @staticmethod
+    def _note_statement(entity_type: str) -> Callable[[Any], Any]:
+        """Build the query of the notes attached to entities of a type."""
+        table = Note.__table__
+
+        def statement(ids):
+            return (
+                select(table.c.entity_id.label("owner_id"), *table.c)
+                .where(table.c.entity_type == entity_type, table.c.entity_id.in_(ids))
+                .order_by(table.c.entity_id, table.c.id)
+            )
+
+        return statement
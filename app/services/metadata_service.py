@@ -8,6 +8,8 @@ rules without abusing LRU cache.
 
 from typing import Dict, Any, List, Tuple
 
+from app.services.cache_service import Cache
+
 
 class MetadataService:
     """
@@ -17,8 +19,8 @@ class MetadataService:
     separation of concerns for field configuration and choices.
     """
 
-    # Class-level cache for metadata (better than LRU cache abuse)
-    _metadata_cache: Dict[str, Dict[str, Any]] = {}
+    # Metadata per model name; built from class definitions, so never expires
+    _metadata_cache = Cache("metadata", max_entries=None, max_bytes=None)
 
     @classmethod
     def get_field_metadata(cls, model_class) -> Dict[str, Any]:
@@ -31,13 +33,9 @@ class MetadataService:
         Returns:
             Dictionary with field names as keys and metadata as values
         """
-        cache_key = model_class.__name__
-
-        # Use simple class-level cache instead of LRU cache abuse
-        if cache_key not in cls._metadata_cache:
-            cls._metadata_cache[cache_key] = cls._build_field_metadata(model_class)
-
-        return cls._metadata_cache[cache_key]
+        return cls._metadata_cache.get_or_compute(
+            model_class.__name__, lambda: cls._build_field_metadata(model_class)
+        )
 
     @classmethod
     def _build_field_metadata(cls, model_class) -> Dict[str, Any]:
@@ -79,16 +77,16 @@ class MetadataService:
                 "icon": column_info.get("icon"),
             }
 
-        # Add filterable relationships for specific models
-        if model_class.__name__ == "Stakeholder":
-            # Add relationship_owners as a filterable and groupable relationship field
-            metadata["relationship_owners"] = {
+        # Add filterable and groupable many-to-many relationships
+        relationship_filters = getattr(model_class, "__relationship_filters__", {})
+        for name, config in relationship_filters.items():
+            metadata[name] = {
                 "type": "relationship",
-                "label": "Relationship Owner",
+                "label": config["label"],
                 "filterable": True,
                 "sortable": False,
-                "groupable": True,  # Allow grouping by relationship owners
-                "choices_source": "users",
+                "groupable": True,
+                "choices_source": config.get("choices_source"),
                 "relationship_field": True,  # Mark as relationship, not a column
                 "required": False,
                 "contact_field": False,
@@ -197,8 +195,4 @@ class MetadataService:
         Args:
             model_class: Specific model class to clear, or None for all
         """
-        if model_class:
-            cache_key = model_class.__name__
-            cls._metadata_cache.pop(cache_key, None)
-        else:
-            cls._metadata_cache.clear()
+        cls._metadata_cache.invalidate(model_class.__name__ if model_class else None)
@@ -0,0 +1,172 @@
+"""
+Pipeline Snapshot Service
+
+Writes and reads the daily pipeline time series. A snapshot stores, per
+day, opportunity count, value and probability-weighted value broken down
+by stage (all opportunities) and by industry and owner (open pipeline).
+"""
+
+from collections import OrderedDict
+from datetime import date
+from typing import Any, Dict, List, Optional
+
+from sqlalchemy import func
+
+from app.models import db, Company, Opportunity, OpportunityAccountTeam, User
+from app.models import PipelineSnapshot
+from app.services.projection_service import CLOSED_STAGES
+from app.utils.logging_config import get_crm_logger
+
+logger = get_crm_logger(__name__)
+
+DIMENSIONS = ("stage", "industry", "owner")
+
+# Bucket key for opportunities with no stage, industry or owner
+NO_KEY = "none"
+
+
+class PipelineSnapshotService:
+    """Service for daily pipeline snapshots and their trend series."""
+
+    @staticmethod
+    def _aggregates() -> List[Any]:
+        """Count, value and weighted value columns for a grouped query."""
+        weighted = Opportunity.value * func.coalesce(Opportunity.probability, 0) / 100.0
+        return [
+            func.count(Opportunity.id),
+            func.coalesce(func.sum(Opportunity.value), 0),
+            func.coalesce(func.sum(weighted), 0),
+        ]
+
+    @classmethod
+    def compute(cls) -> Dict[str, List[tuple]]:
+        """Aggregate the live pipeline for every dimension.
+
+        Returns:
+            Dictionary of dimension to (key, label, count, value, weighted) rows.
+        """
+        is_open = db.or_(
+            Opportunity.stage.is_(None), Opportunity.stage.notin_(CLOSED_STAGES)
+        )
+        stage_labels = {
+            key: choice["label"] for key, choice in Opportunity.get_stage_choices().items()
+        }
+        industry_labels = {
+            key: choice["label"] for key, choice in Company.get_industry_choices().items()
+        }
+
+        by_stage = (
+            db.session.query(Opportunity.stage, *cls._aggregates())
+            .group_by(Opportunity.stage)
+            .all()
+        )
+        by_industry = (
+            db.session.query(Company.industry, *cls._aggregates())
+            .select_from(Opportunity)
+            .outerjoin(Company, Company.id == Opportunity.company_id)
+            .filter(is_open)
+            .group_by(Company.industry)
+            .all()
+        )
+        by_owner = (
+            db.session.query(User.id, User.name, *cls._aggregates())
+            .select_from(Opportunity)
+            .outerjoin(
+                OpportunityAccountTeam,
+                OpportunityAccountTeam.opportunity_id == Opportunity.id,
+            )
+            .outerjoin(User, User.id == OpportunityAccountTeam.user_id)
+            .filter(is_open)
+            .group_by(User.id, User.name)
+            .all()
+        )
+
+        return {
+            "stage": [
+                (key or NO_KEY, stage_labels.get(key, "No Stage"), *figures)
+                for key, *figures in by_stage
+            ],
+            "industry": [
+                (key or NO_KEY, industry_labels.get(key, "No Industry"), *figures)
+                for key, *figures in by_industry
+            ],
+            "owner": [
+                (str(user_id) if user_id else NO_KEY, name or "Unassigned", *figures)
+                for user_id, name, *figures in by_owner
+            ],
+        }
+
+    @classmethod
+    def take_snapshot(cls, snapshot_date: Optional[date] = None) -> int:
+        """Write the snapshot for a day, replacing any earlier one.
+
+        Args:
+            snapshot_date: Day to record, defaults to today.
+
+        Returns:
+            Number of snapshot rows written.
+        """
+        snapshot_date = snapshot_date or date.today()
+        rows = [
+            {
+                "snapshot_date": snapshot_date,
+                "dimension": dimension,
+                "key": key,
+                "label": label,
+                "opportunity_count": count,
+                "total_value": value,
+                "weighted_value": weighted,
+            }
+            for dimension, buckets in cls.compute().items()
+            for key, label, count, value, weighted in buckets
+        ]
+
+        PipelineSnapshot.query.filter_by(snapshot_date=snapshot_date).delete()
+        if rows:
+            db.session.execute(PipelineSnapshot.__table__.insert(), rows)
+        db.session.commit()
+
+        logger.info(
+            "Pipeline snapshot written",
+            extra={
+                "custom_fields": {
+                    "operation": "pipeline_snapshot",
+                    "snapshot_date": snapshot_date.isoformat(),
+                    "rows": len(rows),
+                }
+            },
+        )
+        return len(rows)
+
+    @staticmethod
+    def get_series(
+        dimension: str,
+        start: date,
+        end: date,
+        keys: Optional[List[str]] = None,
+    ) -> List[Dict[str, Any]]:
+        """Read the snapshot series for one dimension.
+
+        Args:
+            dimension: One of DIMENSIONS.
+            start: First day to include.
+            end: Last day to include.
+            keys: Optional bucket keys to restrict the series to.
+
+        Returns:
+            One series per bucket with its label and dated points.
+        """
+        query = PipelineSnapshot.query.filter(
+            PipelineSnapshot.dimension == dimension,
+            PipelineSnapshot.snapshot_date.between(start, end),
+        )
+        if keys:
+            query = query.filter(PipelineSnapshot.key.in_(keys))
+
+        series = OrderedDict()
+        for row in query.order_by(PipelineSnapshot.key, PipelineSnapshot.snapshot_date):
+            bucket = series.setdefault(row.key, {"key": row.key, "points": []})
+            bucket["label"] = row.label  # Latest label wins
+            bucket["points"].append(row.to_point())
+
+        return list(series.values())
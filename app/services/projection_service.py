@@ -0,0 +1,474 @@
+"""
+Projection Service
+
+Maintains the card projection tables (read models) that hold the
+denormalized fields list cards need. Write listeners mark affected rows
+during a flush and the rows are recomputed with INSERT ... SELECT before
+the transaction commits, so cards never drift from their source tables.
+Each source table is aggregated once with GROUP BY on its indexed foreign
+key and joined to the cards, limited to the refreshed ids when given.
+"""
+
+from collections import defaultdict
+from datetime import datetime
+from typing import Any, Dict, Iterable, List, Mapping, Optional, Set
+
+from sqlalchemy import case, func, inspect, literal, or_, select
+from sqlalchemy.orm import aliased, object_session, selectinload
+
+from app.models import db, MODEL_REGISTRY
+from app.models.enums import OpportunityStage, TaskStatus
+from app.models.projections import (
+    CompanyCard,
+    OpportunityCard,
+    StakeholderCard,
+    TaskCard,
+    UserCard,
+)
+from app.utils.logging_config import get_crm_logger
+
+logger = get_crm_logger(__name__)
+
+CLOSED_STAGES = (OpportunityStage.CLOSED_WON.value, OpportunityStage.CLOSED_LOST.value)
+
+CARD_MODELS = (CompanyCard, StakeholderCard, OpportunityCard, TaskCard, UserCard)
+
+
+def _open_opportunity() -> Any:
+    """Filter for opportunities that still count towards pipeline."""
+    from app.models import Opportunity
+
+    return or_(Opportunity.stage.is_(None), Opportunity.stage.notin_(CLOSED_STAGES))
+
+
+def _restrict(query: Any, column: Any, ids: Optional[List[int]]) -> Any:
+    """Limit a card query to the given entity ids, or leave it whole."""
+    return query if ids is None else query.where(column.in_(ids))
+
+
+def _by_key(query: Any, key: Any, ids: Optional[List[int]]) -> Any:
+    """Group an aggregate query by the foreign key it is joined on, as a subquery."""
+    return _restrict(query, key, ids).group_by(key).subquery()
+
+
+def _company_cards(ids: Optional[List[int]]) -> Any:
+    """Select company card rows from opportunities, stakeholders and teams."""
+    from app.models import Company, Opportunity, Stakeholder, CompanyAccountTeam
+
+    pipeline = _by_key(
+        select(
+            Opportunity.company_id.label("key"),
+            func.sum(Opportunity.value).label("value"),
+            func.count(Opportunity.id).label("count"),
+        ).where(_open_opportunity()),
+        Opportunity.company_id,
+        ids,
+    )
+    stakeholders = _by_key(
+        select(Stakeholder.company_id.label("key"), func.count().label("count")),
+        Stakeholder.company_id,
+        ids,
+    )
+    team = _by_key(
+        select(CompanyAccountTeam.company_id.label("key"), func.count().label("count")),
+        CompanyAccountTeam.company_id,
+        ids,
+    )
+    query = (
+        select(
+            Company.id.label("entity_id"),
+            func.coalesce(pipeline.c.value, 0).label("pipeline_value"),
+            func.coalesce(pipeline.c.count, 0).label("active_opportunities"),
+            func.coalesce(stakeholders.c.count, 0).label("stakeholders"),
+            func.coalesce(team.c.count, 0).label("account_team"),
+        )
+        .select_from(Company)
+        .outerjoin(pipeline, pipeline.c.key == Company.id)
+        .outerjoin(stakeholders, stakeholders.c.key == Company.id)
+        .outerjoin(team, team.c.key == Company.id)
+    )
+    return _restrict(query, Company.id, ids)
+
+
+def _stakeholder_cards(ids: Optional[List[int]]) -> Any:
+    """Select stakeholder card rows from company, opportunities and roles."""
+    from app.models import Company, Opportunity, Stakeholder
+    from app.models.stakeholder import stakeholder_meddpicc_roles, stakeholder_opportunities
+
+    links, roles = stakeholder_opportunities.c, stakeholder_meddpicc_roles.c
+    opportunities = _by_key(
+        select(links.stakeholder_id.label("key"), func.count(Opportunity.id).label("count"))
+        .join(Opportunity, Opportunity.id == links.opportunity_id)
+        .where(_open_opportunity()),
+        links.stakeholder_id,
+        ids,
+    )
+    role_names = _by_key(
+        select(
+            roles.stakeholder_id.label("key"),
+            func.aggregate_strings(roles.meddpicc_role, ",").label("names"),
+        ),
+        roles.stakeholder_id,
+        ids,
+    )
+    query = (
+        select(
+            Stakeholder.id.label("entity_id"),
+            Company.name.label("company_name"),
+            func.coalesce(opportunities.c.count, 0).label("active_opportunities"),
+            role_names.c.names.label("meddpicc_roles"),
+        )
+        .select_from(Stakeholder)
+        .outerjoin(Company, Company.id == Stakeholder.company_id)
+        .outerjoin(opportunities, opportunities.c.key == Stakeholder.id)
+        .outerjoin(role_names, role_names.c.key == Stakeholder.id)
+    )
+    return _restrict(query, Stakeholder.id, ids)
+
+
+def _opportunity_cards(ids: Optional[List[int]]) -> Any:
+    """Select opportunity card rows with the company name."""
+    from app.models import Company, Opportunity
+
+    query = (
+        select(Opportunity.id.label("entity_id"), Company.name.label("company_name"))
+        .select_from(Opportunity)
+        .outerjoin(Company, Company.id == Opportunity.company_id)
+    )
+    return _restrict(query, Opportunity.id, ids)
+
+
+def _task_cards(ids: Optional[List[int]]) -> Any:
+    """Select task card rows with subtask progress."""
+    from app.models import Task
+
+    child = aliased(Task)
+    children = _by_key(
+        select(
+            child.parent_task_id.label("key"),
+            func.count(child.id).label("count"),
+            func.count(case((child.status == TaskStatus.COMPLETE.value, 1))).label("complete"),
+        ),
+        child.parent_task_id,
+        ids,
+    )
+    query = (
+        select(
+            Task.id.label("entity_id"),
+            func.coalesce(children.c.count, 0).label("child_tasks"),
+            func.coalesce(children.c.complete, 0).label("completed_child_tasks"),
+        )
+        .select_from(Task)
+        .outerjoin(children, children.c.key == Task.id)
+    )
+    return _restrict(query, Task.id, ids)
+
+
+def _user_cards(ids: Optional[List[int]]) -> Any:
+    """Select user card rows from account team assignments."""
+    from app.models import User, Opportunity, Stakeholder
+    from app.models import CompanyAccountTeam, OpportunityAccountTeam
+
+    companies = _by_key(
+        select(CompanyAccountTeam.user_id.label("key"), func.count().label("count")),
+        CompanyAccountTeam.user_id,
+        ids,
+    )
+    opportunities = _by_key(
+        select(
+            OpportunityAccountTeam.user_id.label("key"),
+            func.count().label("count"),
+            func.sum(case((_open_opportunity(), Opportunity.value))).label("pipeline"),
+        ).outerjoin(Opportunity, Opportunity.id == OpportunityAccountTeam.opportunity_id),
+        OpportunityAccountTeam.user_id,
+        ids,
+    )
+    stakeholders = _by_key(
+        select(
+            CompanyAccountTeam.user_id.label("key"),
+            func.count(func.distinct(Stakeholder.id)).label("count"),
+        ).join(Stakeholder, Stakeholder.company_id == CompanyAccountTeam.company_id),
+        CompanyAccountTeam.user_id,
+        ids,
+    )
+    query = (
+        select(
+            User.id.label("entity_id"),
+            func.coalesce(companies.c.count, 0).label("assigned_companies"),
+            func.coalesce(opportunities.c.count, 0).label("assigned_opportunities"),
+            func.coalesce(opportunities.c.pipeline, 0).label("total_pipeline"),
+            func.coalesce(stakeholders.c.count, 0).label("stakeholder_relationships"),
+        )
+        .select_from(User)
+        .outerjoin(companies, companies.c.key == User.id)
+        .outerjoin(opportunities, opportunities.c.key == User.id)
+        .outerjoin(stakeholders, stakeholders.c.key == User.id)
+    )
+    return _restrict(query, User.id, ids)
+
+
+# Foreign keys of each written table whose parents' cards depend on it
+PARENT_COLUMNS = {
+    "stakeholders": ("company_id",),
+    "opportunities": ("company_id",),
+    "tasks": ("parent_task_id",),
+    "company_account_teams": ("company_id", "user_id"),
+    "opportunity_account_teams": ("user_id",),
+}
+
+CARD_SELECTS = {
+    CompanyCard: _company_cards,
+    StakeholderCard: _stakeholder_cards,
+    OpportunityCard: _opportunity_cards,
+    TaskCard: _task_cards,
+    UserCard: _user_cards,
+}
+
+
+def _values(target: Any, key: str) -> Set[Any]:
+    """Get current and pre-flush values of an attribute, without loading it.
+
+    Foreign keys give ids; collections give the loaded related entities.
+    """
+    history = inspect(target).attrs[key].history
+    values = (*history.added, *history.unchanged, *history.deleted)
+    return {value for value in values if value is not None}
+
+
+def _ids(connection: Any, column: Any, where_column: Any, values: Set[int]) -> Set[int]:
+    """Select ids linked to the given values through a join column."""
+    if not values:
+        return set()
+    rows = connection.execute(select(column).where(where_column.in_(values)))
+    return {row[0] for row in rows}
+
+
+class ProjectionService:
+    """Service for maintaining and reading card projection tables."""
+
+    PENDING_KEY = "pending_projection_rows"
+
+    @staticmethod
+    def get_source_model(card_model: type) -> type:
+        """Get the entity model a card projection is built from.
+
+        Args:
+            card_model: Projection model class.
+
+        Returns:
+            Source entity model class.
+        """
+        return next(
+            model
+            for model in MODEL_REGISTRY.values()
+            if model.__tablename__ == card_model.__source__
+        )
+
+    @staticmethod
+    def affected_rows(connection: Any, target: Any) -> Dict[type, Set[int]]:
+        """Find the card rows that depend on a written entity.
+
+        Foreign keys are read from attribute history so both the old and the
+        new parent are refreshed when an entity moves.
+
+        Args:
+            connection: Connection of the current flush.
+            target: Entity being inserted, updated or deleted.
+
+        Returns:
+            Dictionary of card model to affected entity ids.
+        """
+        table = target.__tablename__
+        parents = {key: _values(target, key) for key in PARENT_COLUMNS.get(table, ())}
+        rows = ProjectionService.affected_by(
+            connection, table, {getattr(target, "id", None)} - {None}, parents
+        )
+        if table == "opportunities":
+            # A delete removes the stakeholder_opportunities rows before
+            # before_delete runs, so also take stakeholders from the collection
+            stakeholders = _values(target, "stakeholders")
+            rows[StakeholderCard] |= {stakeholder.id for stakeholder in stakeholders}
+        return rows
+
+    @staticmethod
+    def affected_by(
+        connection: Any,
+        table: str,
+        ids: Set[int],
+        parents: Mapping[str, Set[int]],
+    ) -> Dict[type, Set[int]]:
+        """Find the card rows that depend on a set of written rows.
+
+        Link tables are read on the given connection, so call this before
+        deleting rows and after inserting them.
+
+        Args:
+            connection: Connection of the writing transaction.
+            table: Name of the written table.
+            ids: Ids of the written rows.
+            parents: Old and new values of the table's PARENT_COLUMNS.
+
+        Returns:
+            Dictionary of card model to affected entity ids.
+        """
+        from app.models import Opportunity, Stakeholder, CompanyAccountTeam
+        from app.models import OpportunityAccountTeam
+        from app.models.stakeholder import stakeholder_opportunities
+
+        rows = defaultdict(set)
+
+        if table == "companies":
+            rows[CompanyCard] |= ids
+            rows[StakeholderCard] |= _ids(
+                connection, Stakeholder.id, Stakeholder.company_id, ids
+            )
+            rows[OpportunityCard] |= _ids(
+                connection, Opportunity.id, Opportunity.company_id, ids
+            )
+        elif table == "stakeholders":
+            company_ids = parents["company_id"]
+            rows[StakeholderCard] |= ids
+            rows[CompanyCard] |= company_ids
+            rows[UserCard] |= _ids(
+                connection,
+                CompanyAccountTeam.user_id,
+                CompanyAccountTeam.company_id,
+                company_ids,
+            )
+        elif table == "opportunities":
+            rows[OpportunityCard] |= ids
+            rows[CompanyCard] |= parents["company_id"]
+            rows[StakeholderCard] |= _ids(
+                connection,
+                stakeholder_opportunities.c.stakeholder_id,
+                stakeholder_opportunities.c.opportunity_id,
+                ids,
+            )
+            rows[UserCard] |= _ids(
+                connection,
+                OpportunityAccountTeam.user_id,
+                OpportunityAccountTeam.opportunity_id,
+                ids,
+            )
+        elif table == "tasks":
+            rows[TaskCard] |= ids | parents["parent_task_id"]
+        elif table == "users":
+            rows[UserCard] |= ids
+        elif table == "company_account_teams":
+            rows[CompanyCard] |= parents["company_id"]
+            rows[UserCard] |= parents["user_id"]
+        elif table == "opportunity_account_teams":
+            rows[UserCard] |= parents["user_id"]
+
+        return rows
+
+    @classmethod
+    def mark_affected(cls, connection: Any, target: Any) -> None:
+        """Queue the card rows affected by a write for refresh after the flush.
+
+        Args:
+            connection: Connection of the current flush.
+            target: Entity being inserted, updated or deleted.
+        """
+        session = object_session(target)
+        if session is None:
+            return
+
+        pending = session.info.setdefault(cls.PENDING_KEY, defaultdict(set))
+        for card_model, ids in cls.affected_rows(connection, target).items():
+            pending[card_model] |= ids
+
+    @classmethod
+    def refresh_pending(cls, session: Any) -> None:
+        """Refresh all queued card rows inside the session's transaction.
+
+        Args:
+            session: Session that has just flushed.
+        """
+        pending = session.info.pop(cls.PENDING_KEY, None)
+        if not pending:
+            return
+
+        connection = session.connection()
+        for card_model, ids in pending.items():
+            if ids:
+                cls.refresh(connection, card_model, ids)
+
+    @classmethod
+    def refresh(
+        cls, connection: Any, card_model: type, ids: Optional[Iterable[int]] = None
+    ) -> int:
+        """Recompute card rows from their source tables.
+
+        Args:
+            connection: Connection to execute on (joins the caller's transaction).
+            card_model: Projection model class to refresh.
+            ids: Source entity ids to refresh, or None for the whole table.
+
+        Returns:
+            Number of card rows written.
+        """
+        table = card_model.__table__
+        ids = None if ids is None else list(ids)
+        source = CARD_SELECTS[card_model](ids).add_columns(
+            literal(datetime.utcnow(), db.DateTime).label("refreshed_at")
+        )
+        delete = table.delete()
+        if ids is not None:
+            delete = delete.where(table.c.entity_id.in_(ids))
+
+        connection.execute(delete)
+        columns = [column.name for column in source.selected_columns]
+        result = connection.execute(table.insert().from_select(columns, source))
+        return result.rowcount
+
+    @classmethod
+    def rebuild(cls) -> Dict[str, int]:
+        """Rebuild every card projection from scratch in one transaction.
+
+        Returns:
+            Dictionary of projection table name to rows written.
+        """
+        connection = db.session.connection()
+        counts = {
+            card_model.__tablename__: cls.refresh(connection, card_model)
+            for card_model in CARD_MODELS
+        }
+        db.session.commit()
+
+        logger.info(
+            "Rebuilt card projections",
+            extra={"custom_fields": {"operation": "rebuild_projections", **counts}},
+        )
+        return counts
+
+    @classmethod
+    def ensure_built(cls) -> None:
+        """Build the projections when a card table is empty (called at startup).
+
+        Covers databases created before the projection tables existed.
+        Cards left stale by bulk statements (``Query.delete()``, raw SQL)
+        that skip the listeners are repaired by ``flask rebuild-projections``.
+        """
+        for card_model in CARD_MODELS:
+            source_model = cls.get_source_model(card_model)
+            if not db.session.query(select(card_model.entity_id).exists()).scalar() and (
+                db.session.query(select(source_model.id).exists()).scalar()
+            ):
+                cls.rebuild()
+                return
+
+    @staticmethod
+    def with_cards(query: Any, model: type) -> Any:
+        """Load card projections alongside a list query in one extra SELECT.
+
+        Args:
+            query: Entity list query.
+            model: SQLAlchemy model class being listed.
+
+        Returns:
+            Query with the card relationship eager loaded, when the model has one.
+        """
+        if "card" in inspect(model).relationships:
+            return query.options(selectinload(model.card))
+        return query
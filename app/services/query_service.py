@@ -1,14 +1,153 @@
 """Query service for building and executing database queries."""
 
-from typing import Any, Dict
+from dataclasses import dataclass
+from typing import Any, Callable, Dict, List, Tuple
+from sqlalchemy import and_, bindparam, case, func, select
 from sqlalchemy.orm import Query
 
 
+@dataclass(frozen=True)
+class FilterSpec:
+    """Compiled filter for a single field.
+
+    The clause is built once per model with an expanding bind parameter,
+    so applying a filter per request only binds the parsed values and the
+    statement structure (and its compiled SQL) is reused.
+
+    Attributes:
+        field: Request arg name the filter responds to.
+        param: Name of the expanding bind parameter in the clause.
+        clause: SQL expression filtering on the bound values.
+        coerce: Converts each raw request value before binding.
+    """
+
+    field: str
+    param: str
+    clause: Any
+    coerce: Callable[[Any], Any] = str
+
+    def parse(self, value: Any) -> List[Any]:
+        """Split a raw filter value into the list of values to bind.
+
+        Args:
+            value: Comma-separated string, list, or single value.
+
+        Returns:
+            List of coerced values, empty if nothing was selected.
+        """
+        if isinstance(value, str):
+            values = [v.strip() for v in value.split(",") if v.strip()]
+        elif isinstance(value, list):
+            values = value
+        else:
+            values = [value]
+        return [self.coerce(v) for v in values]
+
+
 class QueryService:
     """Service for building and executing database queries."""
 
+    # Class-level cache of compiled filter specs, keyed by model name
+    _filter_specs: Dict[str, Dict[str, FilterSpec]] = {}
+
+    @classmethod
+    def get_filter_specs(cls, model: type) -> Dict[str, FilterSpec]:
+        """Get compiled filter specs for a model, compiling them on first use.
+
+        Args:
+            model: SQLAlchemy model class.
+
+        Returns:
+            Dictionary of filter specs keyed by request arg name.
+        """
+        cache_key = model.__name__
+        if cache_key not in cls._filter_specs:
+            cls._filter_specs[cache_key] = cls._compile_filter_specs(model)
+        return cls._filter_specs[cache_key]
+
+    @classmethod
+    def _compile_filter_specs(cls, model: type) -> Dict[str, FilterSpec]:
+        """Compile filter specs from column info and relationship filters.
+
+        Columns declaring ``filter_type: "range"`` match on the choice
+        buckets defined by each choice's ``min``/``max``; all other columns
+        match on value. Relationship filters come from the model's
+        ``__relationship_filters__`` declaration.
+
+        Args:
+            model: SQLAlchemy model class.
+
+        Returns:
+            Dictionary of filter specs keyed by request arg name.
+        """
+        specs = {}
+
+        for column in model.__table__.columns:
+            param = f"filter_{column.name}"
+            values = bindparam(param, expanding=True)
+            if column.info.get("filter_type") == "range":
+                clause = cls._range_bucket(column).in_(values)
+            else:
+                clause = column.in_(values)
+            specs[column.name] = FilterSpec(column.name, param, clause)
+
+        # Relationship filters are EXISTS semi-joins so that rows matching
+        # several related entities are never duplicated
+        for field, config in getattr(model, "__relationship_filters__", {}).items():
+            secondary = config["secondary"].alias()
+            param = f"filter_{field}"
+            clause = (
+                select(secondary)
+                .where(
+                    cls._parent_key(model, secondary) == model.id,
+                    secondary.c[config["column"]].in_(bindparam(param, expanding=True)),
+                )
+                .correlate(model.__table__)
+                .exists()
+            )
+            specs[field] = FilterSpec(field, param, clause, coerce=int)
+
+        return specs
+
+    @staticmethod
+    def _parent_key(model: type, secondary: Any) -> Any:
+        """Find the association table column referencing the model's table.
+
+        Args:
+            model: SQLAlchemy model class.
+            secondary: Association table of a many-to-many relationship.
+
+        Returns:
+            Foreign key column pointing at the model.
+        """
+        return next(
+            column
+            for column in secondary.c
+            if any(fk.references(model.__table__) for fk in column.foreign_keys)
+        )
+
     @staticmethod
-    def build_filtered_query(model: type, filters: Dict[str, Any]) -> Query:
+    def _range_bucket(column: Any) -> Any:
+        """Build a CASE expression mapping a numeric column to its choice bucket.
+
+        Args:
+            column: Column whose ``choices`` carry ``min``/``max`` bounds.
+
+        Returns:
+            SQL expression evaluating to the matching choice key.
+        """
+        whens = []
+        for key, choice in column.info["choices"].items():
+            bounds = []
+            if choice.get("min") is not None:
+                bounds.append(column >= choice["min"])
+            if choice.get("max") is not None:
+                bounds.append(column <= choice["max"])
+            whens.append((and_(*bounds), key))
+        return case(*whens)
+
+    @classmethod
+    def build_filtered_query(cls, model: type, filters: Dict[str, Any]) -> Query:
         """Build a filtered query for a model.
 
         Args:
@@ -19,72 +158,91 @@ class QueryService:
         Returns:
             Filtered SQLAlchemy query.
         """
+        specs = cls.get_filter_specs(model)
         query = model.query
+        params = {}
 
         for field, value in filters.items():
-            if not value:
+            spec = specs.get(field)
+            if not value or spec is None:
                 continue
 
-            # Special handling for relationship_owners filter in Stakeholder
-            if field == "relationship_owners" and model.__name__ == "Stakeholder":
-                # Parse user IDs
-                if isinstance(value, str):
-                    user_ids = [int(v.strip()) for v in value.split(",") if v.strip()]
-                elif isinstance(value, list):
-                    user_ids = [int(v) for v in value]
-                else:
-                    user_ids = [int(value)]
-
-                # Filter stakeholders by relationship owners
-                from app.models.stakeholder import stakeholder_relationship_owners
-                query = query.join(stakeholder_relationship_owners).filter(
-                    stakeholder_relationship_owners.c.user_id.in_(user_ids)
-                )
+            values = spec.parse(value)
+            if not values:
                 continue
 
-            if hasattr(model, field):
-                # Special handling for probability field with ranges
-                if field == "probability" and model.__name__ == "Opportunity":
-                    # Parse probability ranges and build filter
-                    if isinstance(value, str):
-                        values = [v.strip() for v in value.split(",") if v.strip()]
-                    elif isinstance(value, list):
-                        values = value
-                    else:
-                        values = [value]
-
-                    # Build OR conditions for each range
-                    from sqlalchemy import or_
-                    conditions = []
-                    for range_val in values:
-                        if range_val == "0-20":
-                            conditions.append(model.probability <= 20)
-                        elif range_val == "21-40":
-                            conditions.append((model.probability > 20) & (model.probability <= 40))
-                        elif range_val == "41-60":
-                            conditions.append((model.probability > 40) & (model.probability <= 60))
-                        elif range_val == "61-80":
-                            conditions.append((model.probability > 60) & (model.probability <= 80))
-                        elif range_val == "81-100":
-                            conditions.append(model.probability > 80)
-
-                    if conditions:
-                        query = query.filter(or_(*conditions))
-
-                # Handle regular fields
-                elif isinstance(value, str) and "," in value:
-                    values = [v.strip() for v in value.split(",") if v.strip()]
-                    if values:
-                        query = query.filter(getattr(model, field).in_(values))
-                elif isinstance(value, list):
-                    # Handle list directly
-                    if value:
-                        query = query.filter(getattr(model, field).in_(value))
-                else:
-                    # Single value
-                    query = query.filter(getattr(model, field) == value)
-
-        return query
+            query = query.filter(spec.clause)
+            params[spec.param] = values
+
+        return query.params(**params)
+
+    @classmethod
+    def pair_with_relationship(cls, query: Query, model: type, field: str) -> Query:
+        """Pair each row with the display name of each related entity.
+
+        Joins through the association table in a single query that yields
+        ``(entity, label)`` rows ordered by label, with ``None`` last for
+        rows without related entities. An entity related to several targets
+        appears once per target.
+
+        Args:
+            query: Filtered SQLAlchemy query.
+            model: SQLAlchemy model class.
+            field: Name of a relationship declared in ``__relationship_filters__``.
+
+        Returns:
+            Query yielding ``(entity, label)`` pairs.
+        """
+        query, label = cls._join_relationship_label(query, model, field)
+        return query.add_columns(label).order_by(label.is_(None), label)
+
+    @classmethod
+    def group_counts(cls, query: Query, model: type, field: str) -> List[Tuple[Any, int]]:
+        """Count the rows of every group of a grouped list with one GROUP BY.
+
+        Relationship groups count ``(entity, related)`` pairs by the related
+        entity's display name, like ``pair_with_relationship``; column groups
+        count rows by column value.
+
+        Args:
+            query: Filtered SQLAlchemy query.
+            model: SQLAlchemy model class.
+            field: Column name or relationship declared in ``__relationship_filters__``.
+
+        Returns:
+            List of (group value, row count) pairs; the value is ``None``
+            for rows without a value or related entity.
+        """
+        query = query.order_by(None)
+        if field in model.__relationship_filters__:
+            query, key = cls._join_relationship_label(query, model, field)
+        else:
+            key = getattr(model, field)
+        return query.with_entities(key, func.count(model.id)).group_by(key).all()
+
+    @classmethod
+    def _join_relationship_label(
+        cls, query: Query, model: type, field: str
+    ) -> Tuple[Query, Any]:
+        """Outer join a relationship's targets and select their display name.
+
+        Args:
+            query: Filtered SQLAlchemy query.
+            model: SQLAlchemy model class.
+            field: Name of a relationship declared in ``__relationship_filters__``.
+
+        Returns:
+            Tuple of (joined query, labelled display name column).
+        """
+        config = model.__relationship_filters__[field]
+        secondary = config["secondary"]
+        target = model.__mapper__.relationships[field].mapper.class_
+        label = getattr(target, target.__display_field__).label("group_label")
+
+        query = query.outerjoin(
+            secondary, cls._parent_key(model, secondary) == model.id
+        ).outerjoin(target, target.id == secondary.c[config["column"]])
+        return query, label
 
     @staticmethod
     def apply_sorting(
@@ -110,3 +268,35 @@ class QueryService:
             return query.order_by(sort_field.desc())
 
         return query.order_by(sort_field)
+
+    @staticmethod
+    def count_rows(query: Query) -> int:
+        """Count the rows matched by a query with a single COUNT(*).
+
+        Ordering is stripped first since it never changes the total.
+
+        Args:
+            query: Filtered SQLAlchemy query.
+
+        Returns:
+            Number of matching rows.
+        """
+        return query.order_by(None).count()
+
+    @staticmethod
+    def paginate(query: Query, page: int, per_page: int) -> Tuple[List[Any], bool]:
+        """Load a single page of results without counting the full set.
+
+        One extra row is fetched to tell whether another page follows, so
+        callers can render "load more" controls without a COUNT(*).
+
+        Args:
+            query: Filtered and sorted SQLAlchemy query.
+            page: 1-based page number.
+            per_page: Maximum number of rows per page.
+
+        Returns:
+            Tuple of (rows on this page, whether more rows exist).
+        """
+        rows = query.limit(per_page + 1).offset((page - 1) * per_page).all()
+        return rows[:per_page], len(rows) > per_page
@@ -4,10 +4,33 @@ Serialization Service - Handle model serialization and transformations.
 This service extracts serialization logic from BaseModel to follow single
 responsibility principle. Handles to_dict conversion, property inclusion,
 and relationship transformations.
+
+Serializers are compiled once per model: column and property names are
+resolved up front into ``operator.itemgetter``/``attrgetter`` tuples and
+date columns are known from the column types, so serializing a row does
+no reflection.
 """
 
-from typing import Dict, Any, List
+from typing import Dict, Any, Callable, List, Tuple
 from datetime import datetime, date
+from operator import attrgetter, itemgetter
+
+from sqlalchemy import Date, DateTime, inspect
+from sqlalchemy.orm import selectinload
+
+Serializer = Callable[[Any], Dict[str, Any]]
+
+
+def _tuple_getter(
+    names: Tuple[str, ...], factory: Callable = attrgetter
+) -> Callable[[Any], Tuple[Any, ...]]:
+    """Build an attrgetter (or itemgetter) that always returns a tuple."""
+    if not names:
+        return lambda obj: ()
+    getter = factory(*names)
+    if len(names) == 1:
+        return lambda obj: (getter(obj),)
+    return getter
 
 
 class SerializationService:
@@ -18,6 +41,9 @@ class SerializationService:
     clean separation of concerns for data transformation operations.
     """
 
+    # Compiled serializers keyed by (model class, native dates)
+    _serializers: Dict[Tuple[type, bool], Serializer] = {}
+
     @classmethod
     def serialize_model(cls, instance) -> Dict[str, Any]:
         """
@@ -29,33 +55,144 @@ class SerializationService:
         Returns:
             Dictionary representation suitable for JSON serialization
         """
-        result = {}
+        return cls.get_serializer(type(instance))(instance)
+
+    @classmethod
+    def get_serializer(cls, model_class, native: bool = False) -> Serializer:
+        """
+        Get the compiled serializer for a model, compiling it on first use.
 
-        # Serialize all database columns
-        for column in instance.__table__.columns:
-            column_name = column.name
-            value = getattr(instance, column_name, None)
-            result[column_name] = cls._serialize_value(value)
+        Args:
+            model_class: The model class
+            native: Keep dates as date objects for encoders that handle
+                them (orjson), instead of ISO strings
 
-        # Add configured properties
-        include_properties = getattr(instance.__class__, "__include_properties__", [])
-        for prop in include_properties:
-            if hasattr(instance, prop):
-                value = getattr(instance, prop)
-                result[prop] = cls._serialize_value(value)
+        Returns:
+            Function converting an instance to a dictionary
+        """
+        key = (model_class, native)
+        serializer = cls._serializers.get(key)
+        if serializer is None:
+            serializer = cls._serializers[key] = cls.compile_serializer(
+                model_class, native
+            )
+        return serializer
 
-        # Apply relationship transforms
-        relationship_transforms = getattr(
-            instance.__class__, "__relationship_transforms__", {}
+    @classmethod
+    def compile_all(cls, model_classes) -> None:
+        """
+        Compile serializers for all models up front (called at startup).
+
+        Args:
+            model_classes: Model classes to compile serializers for
+        """
+        for model_class in model_classes:
+            for native in (False, True):
+                cls.get_serializer(model_class, native)
+
+    @classmethod
+    def compile_serializer(cls, model_class, native: bool = False) -> Serializer:
+        """
+        Build a specialized serializer for a model.
+
+        Produces the same dictionary as the reflective implementation it
+        replaces: every column, the ``__include_properties__`` the class
+        defines and the ``__relationship_transforms__`` (None when a
+        transform fails).
+
+        Args:
+            model_class: The model class
+            native: Keep dates as date objects instead of ISO strings
+
+        Returns:
+            Function converting an instance to a dictionary
+        """
+        mapper = inspect(model_class)
+        columns = tuple(model_class.__table__.columns)
+        column_names = tuple(column.name for column in columns)
+        column_keys = tuple(mapper.get_property_by_column(column).key for column in columns)
+        date_columns = () if native else tuple(
+            column.name for column in columns if isinstance(column.type, (Date, DateTime))
         )
-        for field, transform in relationship_transforms.items():
+        properties = tuple(getattr(model_class, "__include_properties__", []))
+        transforms = tuple(getattr(model_class, "__relationship_transforms__", {}).items())
+
+        # Loaded column values sit in the instance __dict__; reading them there
+        # skips the instrumented descriptors, which dominate per-row cost
+        get_loaded_columns = _tuple_getter(column_keys, itemgetter)
+        get_columns = _tuple_getter(column_keys)
+        serialize_value = (lambda value: value) if native else cls._serialize_value
+
+        def serialize(instance) -> Dict[str, Any]:
             try:
-                result[field] = transform(instance)
-            except Exception:
-                # If transform fails, skip it rather than breaking serialization
-                result[field] = None
+                values = get_loaded_columns(instance.__dict__)
+            except KeyError:  # Expired, deferred or unset columns load via attributes
+                values = get_columns(instance)
 
-        return result
+            result = dict(zip(column_names, values))
+            for name in date_columns:
+                value = result[name]
+                if value is not None:
+                    result[name] = value.isoformat()
+
+            for name in properties:
+                try:
+                    value = getattr(instance, name)
+                except AttributeError:
+                    # Properties that can't be computed for this row are left out
+                    continue
+                result[name] = serialize_value(value)
+
+            for field, transform in transforms:
+                try:
+                    result[field] = transform(instance)
+                except Exception:
+                    # If transform fails, skip it rather than breaking serialization
+                    result[field] = None
+
+            return result
+
+        serialize.__name__ = f"serialize_{model_class.__tablename__}"
+        return serialize
+
+    @staticmethod
+    def load_options(model_class) -> List[Any]:
+        """
+        Get query options that load the relationships serializers read.
+
+        Each relationship in ``__eager_relationships__`` is fetched with one
+        SELECT ... IN per batch of rows instead of a lazy load per row.
+
+        Args:
+            model_class: The model class
+
+        Returns:
+            Loader options for ``Query.options``
+        """
+        return [
+            selectinload(getattr(model_class, name))
+            for name in getattr(model_class, "__eager_relationships__", ())
+        ]
+
+    @classmethod
+    def serialize_many(cls, instances, model_class=None) -> List[Dict[str, Any]]:
+        """
+        Serialize a list of instances of one model for a JSON response.
+
+        Dates stay native, so encode the result with the app's JSON
+        provider (orjson) rather than the stdlib encoder.
+
+        Args:
+            instances: Model instances to serialize
+            model_class: The model class, defaults to the first instance's
+
+        Returns:
+            List of dictionaries
+        """
+        if not instances:
+            return []
+        serializer = cls.get_serializer(model_class or type(instances[0]), native=True)
+        return [serializer(instance) for instance in instances]
 
     @classmethod
     def _serialize_value(cls, value: Any) -> Any:
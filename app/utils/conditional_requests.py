@@ -0,0 +1,157 @@
+"""Conditional GET support for entity API endpoints.
+
+Validators (ETag and Last-Modified) come from one SELECT over the change
+log of the served table and the tables its serializer reads, run before any
+entity is loaded. Link tables need no state of their own: every link write
+logs the entities that read the link (see ChangeLogService). A matching
+``If-None-Match`` or ``If-Modified-Since`` is answered with 304 without
+hydrating or serializing a row.
+"""
+
+import hashlib
+from datetime import date, datetime, time, timezone
+from typing import Any, Iterable, List, Optional, Tuple
+
+from flask import Response, request
+from sqlalchemy import select
+
+from app.models import db, EntityChange, MODEL_REGISTRY
+from app.services import ChangeLogService
+
+# Other entity tables whose rows appear in a model's serialized form
+SERIALIZED_TABLES = {
+    "companies": ("stakeholders", "opportunities", "users"),
+    "stakeholders": ("companies", "opportunities", "users"),
+    "opportunities": ("stakeholders",),
+    "tasks": ("companies", "opportunities", "stakeholders"),
+}
+
+Validators = Tuple[str, Optional[datetime]]
+
+
+def _tables(model: type, extra: Tuple[str, ...] = ()) -> Tuple[str, ...]:
+    """Entity tables a model's serialized form reads, the model's own first.
+
+    ``extra`` adds tables read for the response beyond the serializer,
+    such as those of included relationships. Link tables among them are
+    dropped, their writes being logged as changes of the linked entities.
+    """
+    entity_tables = {entity.__tablename__ for entity in MODEL_REGISTRY.values()}
+    tables = (model.__tablename__, *SERIALIZED_TABLES.get(model.__tablename__, ()), *extra)
+    return tuple(table for table in dict.fromkeys(tables) if table in entity_tables)
+
+
+def _table_state(table_name: str) -> List[Any]:
+    """Latest change sequence and time of an entity table.
+
+    Every insert, update and delete of an entity, and every write to a
+    link it reads, moves the table's latest change sequence.
+    """
+    return list(ChangeLogService.latest(table_name))
+
+
+def _validators(state: Iterable[Any]) -> Validators:
+    """Build a strong ETag and Last-Modified time from validator values.
+
+    Today's date is part of the tag because serialized properties such as
+    deal age and overdue flags change with the calendar. For the same
+    reason Last-Modified is never earlier than today's midnight, so
+    ``If-Modified-Since`` clients refetch once the date rolls over.
+    """
+    state = (date.today(), sorted(request.args.items(multi=True)), *state)
+    etag = hashlib.sha1(repr(state).encode()).hexdigest()
+    # Stored times are naive UTC; the date rolls over at local midnight
+    midnight = datetime.combine(date.today(), time.min).astimezone(timezone.utc)
+    times = [value for value in state if isinstance(value, datetime)]
+    return etag, max([*times, midnight.replace(tzinfo=None)])
+
+
+def list_validators(model: type, extra: Tuple[str, ...] = ()) -> Validators:
+    """Get validators for a model's list endpoint.
+
+    Args:
+        model: Entity model class.
+        extra: Other tables the response reads.
+
+    Returns:
+        Tuple of ETag and Last-Modified time.
+    """
+    columns = [column for table in _tables(model, extra) for column in _table_state(table)]
+    return _validators(db.session.execute(select(*columns)).one())
+
+
+def detail_validators(
+    model: type, entity_id: int, extra: Tuple[str, ...] = ()
+) -> Optional[Validators]:
+    """Get validators for one entity from its id, change sequence and ``updated_at``.
+
+    The change sequence also moves on link writes, which leave
+    ``updated_at`` alone.
+
+    Args:
+        model: Entity model class.
+        entity_id: Entity id.
+        extra: Other tables the response reads.
+
+    Returns:
+        Tuple of ETag and Last-Modified time, or None when the entity does
+        not exist.
+    """
+    tables = _tables(model, extra)
+    table = model.__table__
+    seq = (
+        select(EntityChange.seq)
+        .where(EntityChange.table_name == table.name, EntityChange.entity_id == table.c.id)
+        .scalar_subquery()
+    )
+    row = db.session.execute(
+        select(
+            table.c.updated_at,
+            seq,
+            *[column for table_name in tables[1:] for column in _table_state(table_name)],
+        ).where(table.c.id == entity_id)
+    ).first()
+    if row is None:
+        return None
+    return _validators((entity_id, *row))
+
+
+def is_not_modified(etag: str, last_modified: Optional[datetime]) -> bool:
+    """Check the request's conditional headers against validators.
+
+    ``If-Modified-Since`` is only consulted without ``If-None-Match``.
+    """
+    if request.if_none_match:
+        return request.if_none_match.contains(etag)
+    if request.if_modified_since and last_modified:
+        modified = last_modified.replace(microsecond=0, tzinfo=timezone.utc)
+        return modified <= request.if_modified_since
+    return False
+
+
+def with_validators(
+    response: Response, etag: str, last_modified: Optional[datetime]
+) -> Response:
+    """Attach validators so clients revalidate instead of refetching."""
+    response.set_etag(etag)
+    if last_modified:
+        response.last_modified = last_modified.replace(tzinfo=timezone.utc)
+    response.cache_control.no_cache = True
+    return response
+
+
+def conditional(validators: Optional[Validators], build) -> Response:
+    """Answer 304 when the client is current, otherwise build the response.
+
+    Args:
+        validators: ETag and Last-Modified time, or None to skip.
+        build: Callable returning the full response.
+
+    Returns:
+        304 response or the built response with validators attached.
+    """
+    if validators is None:
+        return build()
+    if is_not_modified(*validators):
+        return with_validators(Response(status=304), *validators)
+    return with_validators(build(), *validators)
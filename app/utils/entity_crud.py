@@ -1,9 +1,32 @@
 """Modern entity CRUD utilities with safe deletion."""
 
-from typing import Dict, Any
-from flask import abort, jsonify
+from typing import Dict, Any, Iterator
+from flask import (
+    Response,
+    abort,
+    current_app,
+    jsonify,
+    request,
+    stream_with_context,
+    url_for,
+)
 from sqlalchemy import inspect
+from app import config
 from app.models import db, MODEL_REGISTRY
+from app.services import (
+    BulkService,
+    ChangeLogService,
+    ExportService,
+    ImportService,
+    IncludeService,
+    SerializationService,
+)
+from app.services.export_service import FORMATS as EXPORT_FORMATS
+from app.utils.conditional_requests import conditional, detail_validators, list_validators
+from app.utils.model_utils import blocking_relationships
+
+# Rows fetched per round trip, and serialized rows per response chunk, when streaming
+STREAM_BATCH_SIZE = 1000
 
 
 def get_model_by_table_name(table_name: str):
@@ -19,24 +42,120 @@ def get_model_by_table_name(table_name: str):
 
 
 def get_entity_list(table_name: str):
-    """Get list of entities."""
+    """Get list of entities.
+
+    ``?format=ndjson`` streams one JSON object per line and ``?stream=1``
+    streams a JSON array; both keep memory flat for any table size. Answers
+    304 from the table validators when the client's copy is current.
+    ``?include=company,tasks`` wraps the list as ``{"data", "included"}``
+    with each relationship loaded in one query for the whole list.
+    """
     model = get_model_by_table_name(table_name)
     if not model:
         abort(404)
+    includes = requested_includes(model)
 
     sort_field = model.get_default_sort_field()
-    entities = model.query.order_by(getattr(model, sort_field)).all()
-    return jsonify([entity.to_dict() for entity in entities])
+    query = model.query.options(*SerializationService.load_options(model)).order_by(
+        getattr(model, sort_field)
+    )
+
+    output_format = request.args.get("format", "json")
+    if output_format not in ("json", "ndjson"):
+        abort(400, description="format must be json or ndjson")
+    streaming = output_format == "ndjson" or request.args.get(
+        "stream", type=lambda v: v in ("1", "true")
+    )
+    if includes and streaming:
+        abort(400, description="include is not supported on streamed lists")
+
+    def build():
+        if output_format == "ndjson":
+            return stream_entity_list(query, model, ndjson=True)
+        if streaming:
+            return stream_entity_list(query, model, ndjson=False)
+        rows = SerializationService.serialize_many(query.all(), model)
+        if not includes:
+            return jsonify(rows)
+        ids = query.with_entities(model.id).order_by(None)
+        included = IncludeService.resolve(includes, rows, ids)
+        return jsonify({"data": rows, "included": included})
+
+    return conditional(list_validators(model, IncludeService.tables(includes)), build)
+
+
+def requested_includes(model):
+    """Get the relationships named by ``?include=``, or abort with 400."""
+    try:
+        return IncludeService.parse(model, request.args.get("include", ""))
+    except ValueError as e:
+        abort(400, description=str(e))
+
+
+def stream_entity_list(query, model, ndjson: bool) -> Response:
+    """Stream a list query as NDJSON or as a JSON array.
+
+    Rows are iterated with ``yield_per`` (a server-side cursor where the
+    driver supports one) and written in chunks as they are serialized, so
+    neither the rows nor the encoded body are ever held in full.
+
+    Args:
+        query: Ordered entity query.
+        model: Model class of the rows.
+        ndjson: Write newline-delimited objects instead of one array.
+
+    Returns:
+        Streamed JSON response.
+    """
+    serializer = SerializationService.get_serializer(model, native=True)
+    dumps = current_app.json.dumps_bytes
+    separator = b"\n" if ndjson else b","
+
+    def generate() -> Iterator[bytes]:
+        if not ndjson:
+            yield b"["
+        chunk = []
+        first = True
+        for entity in query.yield_per(STREAM_BATCH_SIZE):
+            chunk.append(dumps(serializer(entity)))
+            if len(chunk) == STREAM_BATCH_SIZE:
+                yield _join_chunk(chunk, separator, ndjson, first)
+                chunk, first = [], False
+        if chunk:
+            yield _join_chunk(chunk, separator, ndjson, first)
+        if not ndjson:
+            yield b"]"
+
+    mimetype = "application/x-ndjson" if ndjson else "application/json"
+    return Response(stream_with_context(generate()), mimetype=mimetype)
+
+
+def _join_chunk(chunk, separator: bytes, ndjson: bool, first: bool) -> bytes:
+    """Join encoded rows into one write, keeping separators between chunks."""
+    body = separator.join(chunk)
+    if ndjson:
+        return body + separator
+    return body if first else separator + body
 
 
 def get_entity_detail(table_name: str, entity_id: int):
-    """Get single entity details."""
+    """Get single entity details, as ``{"data", "included"}`` with ``?include=``."""
     model = get_model_by_table_name(table_name)
     if not model:
         abort(404)
+    includes = requested_includes(model)
+
+    def build():
+        options = SerializationService.load_options(model)
+        entity = model.query.options(*options).get_or_404(entity_id)
+        row = SerializationService.get_serializer(model, native=True)(entity)
+        if not includes:
+            return jsonify(row)
+        included = IncludeService.resolve(includes, [row], [entity_id])
+        return jsonify({"data": row, "included": included})
 
-    entity = model.query.get_or_404(entity_id)
-    return jsonify(entity.to_dict())
+    validators = detail_validators(model, entity_id, IncludeService.tables(includes))
+    return conditional(validators, build)
 
 
 def create_entity(model_class, data: dict):
@@ -67,6 +186,117 @@ def update_entity(model_class, entity_id: int, data: dict):
         raise e
 
 
+def get_entity_changes(model_class):
+    """Get changes to a table after a sync cursor, for delta sync.
+
+    ``?since=<cursor>`` is the ``cursor`` of the previous page (0 or omitted
+    for a full sync) and ``?limit=`` caps the page size. Each change is an
+    upsert carrying the entity's current data or a delete; clients repeat
+    while ``has_more`` is true.
+    """
+    try:
+        since = int(request.args.get("since", 0))
+        limit = int(request.args.get("limit", config.CHANGES_MAX_LIMIT))
+    except ValueError:
+        abort(400, description="since and limit must be integers")
+    if since < 0:
+        abort(400, description="since must be a non-negative cursor")
+    if not 1 <= limit <= config.CHANGES_MAX_LIMIT:
+        abort(400, description=f"limit must be between 1 and {config.CHANGES_MAX_LIMIT}")
+
+    return jsonify(ChangeLogService.changes_since(model_class, since, limit))
+
+
+def export_entities(model_class):
+    """Export a table as a streamed Arrow IPC stream or Parquet file.
+
+    ``?format=arrow|parquet`` (default arrow), ``?columns=id,name,...``
+    (default all) and any QueryService filter args, e.g. ``?stage=closed-won``.
+    """
+    if not ExportService.available():
+        abort(501, description="Exports require pyarrow")
+
+    output_format = request.args.get("format", "arrow")
+    if output_format not in EXPORT_FORMATS:
+        abort(400, description=f"format must be one of {', '.join(EXPORT_FORMATS)}")
+
+    names = ExportService.column_names(model_class)
+    columns = [name for name in request.args.get("columns", "").split(",") if name] or names
+    unknown = [name for name in columns if name not in names]
+    if unknown:
+        abort(400, description=f"Unknown columns: {', '.join(unknown)}")
+
+    filters = {k: v for k, v in request.args.items() if k not in ("format", "columns")}
+    mimetype, extension = EXPORT_FORMATS[output_format]
+    response = Response(
+        stream_with_context(ExportService.stream(model_class, columns, filters, output_format)),
+        mimetype=mimetype,
+    )
+    response.headers["Content-Disposition"] = (
+        f"attachment; filename={model_class.__tablename__}.{extension}"
+    )
+    return response
+
+
+def start_import(model_class):
+    """Start a background import of an uploaded CSV or XLSX file.
+
+    The file is the ``file`` field of a multipart request; its extension
+    picks the format. Responds 202 with the job, whose progress is polled
+    at the ``Location`` URL.
+    """
+    upload = request.files.get("file")
+    if upload is None or not upload.filename:
+        abort(400, description="Upload the file as the 'file' field")
+
+    file_format = upload.filename.rsplit(".", 1)[-1].lower()
+    if file_format not in ImportService.formats():
+        abort(400, description=f"File must be one of: {', '.join(ImportService.formats())}")
+
+    job = ImportService.start(model_class, upload, file_format)
+    response = jsonify(job.to_dict())
+    response.status_code = 202
+    response.headers["Location"] = url_for("api_entities.get_import", job_id=job.id)
+    return response
+
+
+def get_import_progress(job_id: str):
+    """Get the progress report of an import job."""
+    job = ImportService.get_job(job_id)
+    if job is None:
+        abort(404)
+    return jsonify(job.to_dict())
+
+
+def bulk_write_entities(model_class, data: Any):
+    """Apply a bulk request of creates, updates and deletes in one transaction.
+
+    The body is ``{"create": [...], "update": [...], "delete": [...]}`` with
+    an optional ``"atomic": true`` to roll back everything on any failure.
+    Responds 200 when every item applied and 207 with per-item errors
+    otherwise.
+    """
+    if not isinstance(data, dict):
+        return jsonify({"error": "Request body must be a JSON object"}), 400
+
+    operations = {key: data.get(key) or [] for key in ("create", "update", "delete")}
+    if not all(isinstance(items, list) for items in operations.values()):
+        return jsonify({"error": "create, update and delete must be arrays"}), 400
+
+    total = sum(len(items) for items in operations.values())
+    if total > config.BULK_MAX_ITEMS:
+        return jsonify({"error": f"At most {config.BULK_MAX_ITEMS} items per request"}), 413
+
+    result = BulkService.execute(
+        model_class,
+        creates=operations["create"],
+        updates=operations["update"],
+        deletes=operations["delete"],
+        atomic=bool(data.get("atomic")),
+    )
+    return jsonify(result.to_dict()), 207 if result.failed else 200
+
+
 def get_deletion_impact(model_class, entity_id: int) -> Dict[str, Any]:
     """Analyze deletion impact for an entity."""
     entity = model_class.query.get_or_404(entity_id)
@@ -78,8 +308,13 @@ def get_deletion_impact(model_class, entity_id: int) -> Dict[str, Any]:
         "safe_to_delete": True,
     }
 
-    # Check relationships that will cascade
+    # Check relationships that will cascade or block, by the rule bulk deletes share
+    blocking = blocking_relationships(model_class)
     for rel_name, rel in inspector.relationships.items():
+        # Viewonly relationships (the card projection) go with the entity
+        if rel.viewonly:
+            continue
+
         if hasattr(entity, rel_name):
             related_items = getattr(entity, rel_name)
 
@@ -88,41 +323,16 @@ def get_deletion_impact(model_class, entity_id: int) -> Dict[str, Any]:
                 related_items = [related_items] if related_items else []
 
             if related_items:
-                # Check if this relationship will cascade
-                fk_columns = (
-                    rel.local_columns
-                    if rel.direction.name == "ONETOMANY"
-                    else rel.remote_side
-                )
-
-                cascades = any(
-                    fk.foreign_keys
-                    and any(
-                        fk_constraint.ondelete == "CASCADE"
-                        for fk_constraint in fk.foreign_keys
-                    )
-                    for fk in fk_columns
-                )
-
-                if cascades:
-                    impact["will_cascade"].append(
-                        {
-                            "relationship": rel_name,
-                            "count": len(related_items),
-                            "items": [
-                                str(item) for item in related_items[:5]
-                            ],  # Sample
-                        }
-                    )
-                else:
-                    impact["dependent_entities"].append(
-                        {
-                            "relationship": rel_name,
-                            "count": len(related_items),
-                            "items": [str(item) for item in related_items[:5]],
-                        }
-                    )
+                summary = {
+                    "relationship": rel_name,
+                    "count": len(related_items),
+                    "items": [str(item) for item in related_items[:5]],  # Sample
+                }
+                if rel_name in blocking:
+                    impact["dependent_entities"].append(summary)
                     impact["safe_to_delete"] = False
+                else:
+                    impact["will_cascade"].append(summary)
 
     return impact
 
@@ -0,0 +1,103 @@
+"""Jinja fragment cache tag.
+
+``{% cache value, ... %}...{% endcache %}`` renders its body once per key
+and serves the stored HTML afterwards. The key is the given values plus
+the template version (a hash of every template source, so a deploy that
+edits any template or macro never serves old markup) and today's date,
+since cards render relative dates such as "3 days ago". The values must
+change whenever the output would, e.g. an entity's id and ``updated_at``.
+
+Values are reduced to plain scalars before keying - dates to ISO strings
+and dicts or lists to a hash of their sorted JSON - so every worker builds
+the same key for the shared tier. Other objects, such as an entity itself,
+are rejected; pass the fields that identify their version instead.
+"""
+
+import hashlib
+import json
+from datetime import date
+from enum import Enum
+from typing import Any, Callable, List, Mapping, Optional
+
+from jinja2 import nodes
+from jinja2.ext import Extension
+from markupsafe import Markup
+
+from app import config
+from app.services import Cache
+
+# Rendered fragments; keys carry the entity version, so workers can share them
+fragment_cache = Cache(
+    "card-fragments",
+    ttl=24 * 60 * 60,  # Keys carry the date, so older entries are never hit
+    max_entries=config.CARD_CACHE_MAX_ENTRIES,
+    shared=True,
+)
+
+
+def key_part(value: Any) -> Any:
+    """Reduce a ``{% cache %}`` value to a scalar that is equal in every process.
+
+    Args:
+        value: Value passed to the tag.
+
+    Returns:
+        The value itself for scalars, an ISO string for dates, the value of
+        an enum member, or a hash of the sorted JSON of a dict or list.
+
+    Raises:
+        TypeError: For any other object, whose repr may differ between processes.
+    """
+    if value is None or isinstance(value, (str, int, float, bool)):
+        return value
+    if isinstance(value, date):
+        return value.isoformat()
+    if isinstance(value, Enum):
+        return key_part(value.value)
+    if isinstance(value, (Mapping, list, tuple)):
+        encoded = json.dumps(value, sort_keys=True, default=key_part)
+        return hashlib.sha1(encoded.encode()).hexdigest()[:16]
+    raise TypeError(
+        f"{{% cache %}} values must be scalars, dates or plain containers, "
+        f"not {type(value).__name__}"
+    )
+
+
+class FragmentCacheExtension(Extension):
+    """Adds the ``{% cache %}`` tag to a Jinja environment."""
+
+    tags = {"cache"}
+
+    def __init__(self, environment: Any) -> None:
+        super().__init__(environment)
+        self._version: Optional[str] = None
+
+    def parse(self, parser: Any) -> nodes.Node:
+        """Parse ``cache value, ...`` and the body up to ``endcache``."""
+        lineno = next(parser.stream).lineno
+        values = [parser.parse_expression()]
+        while parser.stream.skip_if("comma"):
+            values.append(parser.parse_expression())
+        body = parser.parse_statements(("name:endcache",), drop_needle=True)
+        call = self.call_method("_render", [nodes.List(values)])
+        return nodes.CallBlock(call, [], [], body).set_lineno(lineno)
+
+    def template_version(self) -> str:
+        """Hash of every template source, computed once per process."""
+        if self._version is None:
+            loader = self.environment.loader
+            digest = hashlib.sha1()
+            for name in sorted(loader.list_templates()) if loader else ():
+                digest.update(name.encode())
+                digest.update(loader.get_source(self.environment, name)[0].encode())
+            self._version = digest.hexdigest()[:12]
+        return self._version
+
+    def _render(self, values: List[Any], caller: Callable[[], str]) -> Markup:
+        """Get the body's HTML from the cache, rendering it on a miss."""
+        key = (
+            self.template_version(),
+            date.today().isoformat(),
+            *(key_part(value) for value in values),
+        )
+        return fragment_cache.get_or_compute(key, lambda: Markup(caller()))
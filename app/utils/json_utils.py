@@ -0,0 +1,80 @@
+"""Fast JSON encoding - orjson-backed Flask JSON provider."""
+
+from datetime import date
+from typing import Any
+
+from flask import Response
+from flask.json.provider import DefaultJSONProvider
+
+try:
+    import orjson
+except ImportError:  # Optional speedup - falls back to the stdlib encoder
+    orjson = None
+
+
+class OrjsonProvider(DefaultJSONProvider):
+    """
+    Flask JSON provider encoding with orjson when it is installed.
+
+    orjson serializes dates, datetimes, enums and dataclasses natively and
+    writes bytes, so ``jsonify`` responses skip the str round trip of the
+    stdlib encoder. Other types go through Flask's default handler.
+    """
+
+    @staticmethod
+    def default(o: Any) -> Any:
+        """Encode types orjson (or the stdlib encoder) does not handle.
+
+        Dates are ISO 8601 on both encoders, matching model ``to_dict``.
+        """
+        if isinstance(o, date):
+            return o.isoformat()
+        return DefaultJSONProvider.default(o)
+
+    def _options(self, **kwargs: Any) -> int:
+        """orjson option flags matching the provider's sort and indent settings."""
+        options = orjson.OPT_NON_STR_KEYS
+        if kwargs.get("sort_keys", self.sort_keys):
+            options |= orjson.OPT_SORT_KEYS
+        if kwargs.get("indent"):
+            options |= orjson.OPT_INDENT_2
+        return options
+
+    def dumps_bytes(self, obj: Any, **kwargs: Any) -> bytes:
+        """Serialize data as JSON bytes.
+
+        Args:
+            obj: The data to serialize.
+            **kwargs: Passed to the stdlib encoder when orjson is missing.
+
+        Returns:
+            UTF-8 encoded JSON.
+        """
+        if orjson is None:
+            return super().dumps(obj, **kwargs).encode()
+        return orjson.dumps(obj, default=self.default, option=self._options(**kwargs))
+
+    def dumps(self, obj: Any, **kwargs: Any) -> str:
+        """Serialize data as a JSON string."""
+        if orjson is None:
+            return super().dumps(obj, **kwargs)
+        return self.dumps_bytes(obj, **kwargs).decode()
+
+    def loads(self, s: Any, **kwargs: Any) -> Any:
+        """Deserialize JSON data from a string or bytes."""
+        if orjson is None or kwargs:
+            return super().loads(s, **kwargs)
+        return orjson.loads(s)
+
+    def response(self, *args: Any, **kwargs: Any) -> Response:
+        """Build a JSON response whose body is encoded straight to bytes."""
+        obj = self._prepare_response_obj(args, kwargs)
+        dump_args = {}
+        if (self.compact is None and self._app.debug) or self.compact is False:
+            dump_args["indent"] = 2
+        else:
+            dump_args["separators"] = (",", ":")
+
+        return self._app.response_class(
+            self.dumps_bytes(obj, **dump_args), mimetype=self.mimetype
+        )
@@ -7,18 +7,22 @@ from app.utils.formatters import format_currency_short
 
 def get_recent_items(model_class, limit: int = 5) -> List:
     """Get recent entities - uniform interface for all models."""
+    from app.services.projection_service import ProjectionService
+
+    query = ProjectionService.with_cards(model_class.query, model_class)
     if hasattr(model_class, "created_at"):
-        return (
-            model_class.query.order_by(model_class.created_at.desc()).limit(limit).all()
-        )
-    return model_class.query.order_by(model_class.id.desc()).limit(limit).all()
+        return query.order_by(model_class.created_at.desc()).limit(limit).all()
+    return query.order_by(model_class.id.desc()).limit(limit).all()
 
 
 def get_overdue_items(model_class, limit: int = 5) -> List:
     """Get overdue items - only for models with due_date."""
+    from app.services.projection_service import ProjectionService
+
     if hasattr(model_class, "due_date") and hasattr(model_class, "status"):
         return (
-            model_class.query.filter(
+            ProjectionService.with_cards(model_class.query, model_class)
+            .filter(
                 model_class.due_date < date.today(), model_class.status != "complete"
             )
             .limit(limit)
@@ -55,6 +59,9 @@ def get_model_meta_data(model_instance) -> Dict[str, Any]:
 
     meta = {}
     entity_type = model_instance.__class__.__name__.lower()
+    # Denormalized card projection, only when already loaded - reading the
+    # attribute would lazy-load it one query per row
+    card = model_instance.__dict__.get("card")
 
     # Universal fields - return both actual date and relative for display flexibility
     # Created date
@@ -79,28 +86,33 @@ def get_model_meta_data(model_instance) -> Dict[str, Any]:
 
     # Entity-specific metadata
     if entity_type == "company":
-        # Pipeline value - sum of active opportunities
-        if hasattr(model_instance, "opportunities"):
+        if card is not None:
+            pipeline_value = card.pipeline_value
+            active_count = card.active_opportunities
+            stakeholder_count = card.stakeholders
+            account_team_size = card.account_team
+        else:
             active_opps = [opp for opp in model_instance.opportunities if opp.stage not in ["closed-won", "closed-lost"]]
             pipeline_value = sum(opp.value or 0 for opp in active_opps)
-            if pipeline_value > 0:
-                meta["pipeline_value"] = format_currency_short(pipeline_value)
+            active_count = len(active_opps)
+            stakeholder_count = len(model_instance.stakeholders)
+            account_team_size = len(model_instance.account_team_assignments)
 
-            # Active opportunities count
-            if active_opps:
-                meta["active_opportunities"] = f"{len(active_opps)}"
+        # Pipeline value - sum of active opportunities
+        if pipeline_value > 0:
+            meta["pipeline_value"] = format_currency_short(pipeline_value)
+
+        # Active opportunities count
+        if active_count:
+            meta["active_opportunities"] = f"{active_count}"
 
         # Stakeholders count (previously team_size)
-        if hasattr(model_instance, "stakeholders"):
-            stakeholder_count = len(model_instance.stakeholders)
-            if stakeholder_count > 0:
-                meta["stakeholders"] = f"{stakeholder_count}"
+        if stakeholder_count > 0:
+            meta["stakeholders"] = f"{stakeholder_count}"
 
         # Account team size
-        if hasattr(model_instance, "account_team_assignments"):
-            account_team_size = len(model_instance.account_team_assignments)
-            if account_team_size > 0:
-                meta["account_team"] = f"{account_team_size}"
+        if account_team_size > 0:
+            meta["account_team"] = f"{account_team_size}"
 
     elif entity_type == "stakeholder":
         # Last contacted
@@ -113,20 +125,24 @@ def get_model_meta_data(model_instance) -> Dict[str, Any]:
             meta["last_contacted_date"] = last_contacted_date.strftime("%B %d, %Y")
             meta["last_contacted"] = get_relative_time_only(last_contacted_date)
 
-        # Active opportunities count
-        if hasattr(model_instance, "opportunities"):
+        if card is not None:
+            active_count = card.active_opportunities
+            roles = sorted(card.meddpicc_roles.split(",")) if card.meddpicc_roles else []
+        else:
             active_opps = [opp for opp in model_instance.opportunities if opp.stage not in ["closed-won", "closed-lost"]]
-            if active_opps:
-                meta["active_opportunities"] = f"{len(active_opps)} active opp{'s' if len(active_opps) != 1 else ''}"
+            active_count = len(active_opps)
+            roles = sorted(model_instance.get_meddpicc_role_names())
+
+        # Active opportunities count
+        if active_count:
+            meta["active_opportunities"] = f"{active_count} active opp{'s' if active_count != 1 else ''}"
 
         # MEDDPICC roles
-        if hasattr(model_instance, "get_meddpicc_role_names"):
-            roles = model_instance.get_meddpicc_role_names()
-            if roles:
-                # Format roles nicely - capitalize and join with commas
-                formatted_roles = [role.replace("_", " ").title() for role in roles]
-                meta["meddpicc_roles"] = f"MEDDPICC: {', '.join(formatted_roles)}"
-                meta["meddpicc_count"] = f"{len(roles)}"
+        if roles:
+            # Format roles nicely - capitalize and join with commas
+            formatted_roles = [role.replace("_", " ").title() for role in roles]
+            meta["meddpicc_roles"] = f"MEDDPICC: {', '.join(formatted_roles)}"
+            meta["meddpicc_count"] = f"{len(roles)}"
 
     elif entity_type == "opportunity":
         # Deal size and stage
@@ -152,64 +168,59 @@ def get_model_meta_data(model_instance) -> Dict[str, Any]:
                 meta["days_overdue"] = f"{abs(days_to_close)} days overdue"
 
     elif entity_type == "user":
-        # Company assignments count
-        if hasattr(model_instance, "company_assignments"):
+        if card is not None:
+            company_count = card.assigned_companies
+            opportunity_count = card.assigned_opportunities
+            total_pipeline = card.total_pipeline
+            stakeholder_count = card.stakeholder_relationships
+        else:
             company_count = len(model_instance.company_assignments)
-            if company_count > 0:
-                meta["assigned_companies"] = f"{company_count}"
-
-        # Opportunity assignments count
-        if hasattr(model_instance, "opportunity_assignments"):
             opportunity_count = len(model_instance.opportunity_assignments)
-            if opportunity_count > 0:
-                meta["assigned_opportunities"] = f"{opportunity_count}"
 
-        # Total pipeline value for assigned opportunities
-        if hasattr(model_instance, "opportunity_assignments"):
+            # Only count active opportunities (not closed)
             total_pipeline = 0
             for assignment in model_instance.opportunity_assignments:
                 opp = assignment.opportunity
-                # Only count active opportunities (not closed)
                 if opp and opp.stage not in ["closed-won", "closed-lost"] and opp.value:
                     total_pipeline += opp.value
 
-            if total_pipeline > 0:
-                meta["total_pipeline"] = format_currency_short(total_pipeline)
-
-        # Total stakeholder relationships (through opportunities or direct)
-        # Count unique stakeholders user is working with
-        stakeholder_ids = set()
-
-        # Through opportunity assignments
-        if hasattr(model_instance, "opportunity_assignments"):
-            for assignment in model_instance.opportunity_assignments:
-                if assignment.opportunity and hasattr(assignment.opportunity, "stakeholder_id"):
-                    if assignment.opportunity.stakeholder_id:
-                        stakeholder_ids.add(assignment.opportunity.stakeholder_id)
-
-        # Through company assignments
-        if hasattr(model_instance, "company_assignments"):
+            # Count unique stakeholders at the companies the user is assigned to
+            stakeholder_ids = set()
             for assignment in model_instance.company_assignments:
-                if assignment.company and hasattr(assignment.company, "stakeholders"):
+                if assignment.company:
                     for stakeholder in assignment.company.stakeholders:
                         stakeholder_ids.add(stakeholder.id)
+            stakeholder_count = len(stakeholder_ids)
+
+        # Company assignments count
+        if company_count > 0:
+            meta["assigned_companies"] = f"{company_count}"
 
-        if stakeholder_ids:
-            meta["stakeholder_relationships"] = f"{len(stakeholder_ids)}"
+        # Opportunity assignments count
+        if opportunity_count > 0:
+            meta["assigned_opportunities"] = f"{opportunity_count}"
+
+        # Total pipeline value for assigned opportunities
+        if total_pipeline > 0:
+            meta["total_pipeline"] = format_currency_short(total_pipeline)
+
+        # Total stakeholder relationships
+        if stakeholder_count:
+            meta["stakeholder_relationships"] = f"{stakeholder_count}"
 
     elif entity_type == "task":
         # Task type and progress indicators
         if hasattr(model_instance, "task_type") and model_instance.task_type:
             if model_instance.task_type == "parent":
                 # Multi-task with progress
-                if hasattr(model_instance, "child_tasks"):
+                if card is not None:
+                    total_children = card.child_tasks
+                    completed_children = card.completed_child_tasks
+                else:
                     total_children = len(model_instance.child_tasks)
                     completed_children = sum(1 for child in model_instance.child_tasks if child.status == "complete")
-                    meta["task_progress"] = f"{completed_children}/{total_children}"
-                    meta["task_type_display"] = "multi"
-                else:
-                    meta["task_type_display"] = "multi"
-                    meta["task_progress"] = "0/0"
+                meta["task_progress"] = f"{completed_children}/{total_children}"
+                meta["task_type_display"] = "multi"
             elif model_instance.task_type == "child":
                 meta["task_type_display"] = "subtask"
             else:
@@ -240,3 +251,120 @@ def get_model_meta_data(model_instance) -> Dict[str, Any]:
         }
 
     return meta
+
+
+def cascades_on_delete(relationship) -> bool:
+    """Check whether a relationship's rows are deleted along with the entity.
+
+    Args:
+        relationship: SQLAlchemy relationship property.
+
+    Returns:
+        True when the foreign key holding the relationship is ON DELETE CASCADE.
+    """
+    fk_columns = (
+        relationship.local_columns
+        if relationship.direction.name == "ONETOMANY"
+        else relationship.remote_side
+    )
+    return any(
+        foreign_key.ondelete == "CASCADE"
+        for column in fk_columns
+        for foreign_key in column.foreign_keys
+    )
+
+
+def blocking_relationships(model_class) -> Dict[str, Any]:
+    """Get the relationships whose related rows prevent deleting an entity.
+
+    The one deletion rule shared by single and bulk deletes. Viewonly
+    relationships (the card projection) are maintained by the write hooks
+    and removed with the entity, and cascading relationships go with it;
+    every other related row, parents included, blocks the delete.
+
+    Args:
+        model_class: Entity model class.
+
+    Returns:
+        Dictionary of relationship name to relationship property.
+    """
+    from sqlalchemy import inspect
+
+    return {
+        name: relationship
+        for name, relationship in inspect(model_class).relationships.items()
+        if not relationship.viewonly and not cascades_on_delete(relationship)
+    }
+
+
+def ensure_column(model_class, column_name: str) -> bool:
+    """Add a model column and its indexes to databases created before it existed.
+
+    Args:
+        model_class: Model class declaring the column.
+        column_name: Name of the column to add.
+
+    Returns:
+        True when the column was added and may need a backfill.
+    """
+    from sqlalchemy import inspect, text
+    from app.models import db
+
+    table = model_class.__table__
+    column = table.c[column_name]
+
+    existing = {col["name"] for col in inspect(db.engine).get_columns(table.name)}
+    if column.name in existing:
+        return False
+
+    column_type = column.type.compile(db.engine.dialect)
+    db.session.execute(
+        text(f"ALTER TABLE {table.name} ADD COLUMN {column.name} {column_type}")
+    )
+    for index in table.indexes:
+        if column.name in index.columns:
+            index.create(db.session.connection())
+    db.session.commit()
+    return True
+
+
+def backfill_updated_at(model_class) -> None:
+    """Start ``updated_at`` at ``created_at`` for rows written before it was tracked.
+
+    Args:
+        model_class: Model class with ``created_at`` and ``updated_at`` columns.
+    """
+    from app.models import db
+
+    table = model_class.__table__
+    db.session.execute(
+        table.update()
+        .where(table.c.updated_at.is_(None))
+        .values(updated_at=table.c.created_at)
+    )
+    db.session.commit()
+
+
+def ensure_indexes(table) -> List[str]:
+    """Create declared indexes missing from databases created before them.
+
+    ``create_all`` skips tables that already exist, so indexes added to an
+    existing table's columns are only created here.
+
+    Args:
+        table: Table whose declared indexes to create.
+
+    Returns:
+        Names of the indexes created.
+    """
+    from sqlalchemy import inspect
+    from app.models import db
+
+    existing = {index["name"] for index in inspect(db.engine).get_indexes(table.name)}
+    created = []
+    for index in table.indexes:
+        if index.name not in existing:
+            index.create(db.session.connection())
+            created.append(index.name)
+    db.session.commit()
+    return created
@@ -2,6 +2,7 @@
 
 from datetime import datetime
 from typing import Dict, List, Optional, Any
+from sqlalchemy import func
 
 
 def calculate_deal_age(created_at: datetime) -> int:
@@ -24,19 +25,26 @@ def calculate_priority_by_value(value: Optional[int]) -> str:
 
 def get_pipeline_value(opportunity_model_class, stage: Optional[str] = None) -> float:
     """Calculate total pipeline value for stage."""
-    query = opportunity_model_class.query
+    query = opportunity_model_class.query.with_entities(
+        func.coalesce(func.sum(opportunity_model_class.value), 0)
+    )
     if stage:
         query = query.filter(opportunity_model_class.stage == stage)
-    return sum(opp.value or 0 for opp in query.all())
+    return query.scalar()
 
 
 def get_pipeline_breakdown(opportunity_model_class) -> Dict[str, float]:
-    """Get pipeline value breakdown by stage."""
-    stages = get_stage_choices()
-    breakdown = {
-        stage: get_pipeline_value(opportunity_model_class, stage) for stage in stages
-    }
-    breakdown["total"] = get_pipeline_value(opportunity_model_class)
+    """Get pipeline value breakdown by stage in one grouped query."""
+    totals = dict(
+        opportunity_model_class.query.with_entities(
+            opportunity_model_class.stage,
+            func.coalesce(func.sum(opportunity_model_class.value), 0),
+        )
+        .group_by(opportunity_model_class.stage)
+        .all()
+    )
+    breakdown = {stage: totals.get(stage, 0) for stage in get_stage_choices()}
+    breakdown["total"] = sum(totals.values())
     return breakdown
 
 
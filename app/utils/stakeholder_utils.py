@@ -0,0 +1,146 @@
+"""Stakeholder utilities - job title seniority classification."""
+
+import re
+from collections import defaultdict
+from functools import lru_cache
+from typing import Any, Dict, Optional, Tuple
+
+# Levels counted as decision makers in stats and filters (Seniority values)
+DECISION_MAKER_LEVELS = ("executive", "vp", "director")
+
+
+@lru_cache(maxsize=None)
+def _seniority_patterns() -> Tuple[Tuple[Any, Any], ...]:
+    """Compile the title patterns, checked in order.
+
+    Support roles come first so "Executive Assistant to the CEO" is not an
+    executive, and "Vice President" must be a VP before "President" matches.
+    Owner only counts as the business owner and lead only as a team lead or
+    "Lead <role>", not "Product Owner" or "Lead Generation Specialist".
+    """
+    from app.models.enums import Seniority  # app.models imports this module
+
+    return (
+        (
+            Seniority.INDIVIDUAL,
+            re.compile(
+                r"\b(?:(?:executive|personal|administrative)\s+assistant"
+                r"|(?:assistant|secretary|ea|pa)\s+to)\b",
+                re.IGNORECASE,
+            ),
+        ),
+        (Seniority.VP, re.compile(r"\b(?:[sea]?vp|vice[\s-]*president)\b", re.IGNORECASE)),
+        (
+            Seniority.EXECUTIVE,
+            re.compile(
+                r"\b(?:c[eftoi]o|ciso|c[mrps]o|chief|president|founder"
+                r"|managing\s+director|general\s+manager|co-?owner)\b"
+                r"|(?:^|[&/,])\s*owner\b",
+                re.IGNORECASE,
+            ),
+        ),
+        (Seniority.DIRECTOR, re.compile(r"\b(?:director|head\s+of)\b", re.IGNORECASE)),
+        (
+            Seniority.MANAGER,
+            re.compile(
+                r"\b(?:manager|supervisor|(?:team|tech|technical|project|group)\s+lead)\b"
+                r"|^\s*lead\s+(?!gen(?:eration)?\b)\w",
+                re.IGNORECASE,
+            ),
+        ),
+    )
+
+
+def classify_seniority(job_title: Optional[str]) -> Optional[str]:
+    """Classify a job title into a seniority level.
+
+    Args:
+        job_title: Free text job title.
+
+    Returns:
+        Seniority value, or None when there is no title.
+    """
+    from app.models.enums import Seniority  # app.models imports this module
+
+    if not job_title or not job_title.strip():
+        return None
+    for level, pattern in _seniority_patterns():
+        if pattern.search(job_title):
+            return level.value
+    return Seniority.INDIVIDUAL.value
+
+
+def get_seniority_choices() -> Dict[str, Dict[str, str]]:
+    """Get available stakeholder seniority levels."""
+    return {
+        "executive": {"label": "Executive", "description": "C-level, president or founder"},
+        "vp": {"label": "VP", "description": "Vice president level"},
+        "director": {"label": "Director", "description": "Director or head of function"},
+        "manager": {"label": "Manager", "description": "Manager or team lead"},
+        "individual": {"label": "Individual Contributor", "description": "No management title"},
+    }
+
+
+def ensure_seniority_column(stakeholder_model_class) -> bool:
+    """Add the seniority column and index to databases created before it existed.
+
+    Args:
+        stakeholder_model_class: Stakeholder model class.
+
+    Returns:
+        True when the column was added and still needs a backfill.
+    """
+    from app.utils.model_utils import ensure_column
+
+    return ensure_column(stakeholder_model_class, "seniority")
+
+
+def backfill_seniority(stakeholder_model_class, batch_size: int = 1000) -> Dict[str, int]:
+    """Classify every stakeholder's job title and store the seniority.
+
+    Rows are read in batches and written with one UPDATE per level;
+    entity counters are rebuilt and the change log updated because these
+    bulk statements bypass the write listeners.
+
+    Args:
+        stakeholder_model_class: Stakeholder model class.
+        batch_size: Rows fetched per round trip.
+
+    Returns:
+        Dictionary of seniority level to number of rows changed.
+    """
+    from sqlalchemy import select
+    from app.models import db
+    from app.services import ChangeLogService, CounterService
+
+    table = stakeholder_model_class.__table__
+    column = table.c.seniority
+
+    changed = defaultdict(list)
+    rows = db.session.execute(
+        select(table.c.id, table.c.job_title, column).execution_options(
+            yield_per=batch_size
+        )
+    )
+    for stakeholder_id, job_title, seniority in rows:
+        level = classify_seniority(job_title)
+        if level != seniority:
+            changed[level].append(stakeholder_id)
+
+    for level, ids in changed.items():
+        for start in range(0, len(ids), batch_size):
+            db.session.execute(
+                table.update()
+                .where(table.c.id.in_(ids[start : start + batch_size]))
+                .values({column.name: level})
+            )
+    ChangeLogService.record(
+        db.session.connection(),
+        {(table.name, stakeholder_id): False for ids in changed.values() for stakeholder_id in ids},
+    )
+    db.session.commit()
+
+    if changed:
+        CounterService.rebuild()
+
+    return {level or "none": len(ids) for level, ids in changed.items()}
@@ -151,6 +151,7 @@ def add_linked_entity(task_id: int, entity_type: str, entity_id: int) -> None:
                 created_at=datetime.utcnow(),
             )
         )
+        _record_link_write(task_id)
         db.session.commit()
 
 
@@ -166,6 +167,7 @@ def remove_linked_entity(task_id: int, entity_type: str, entity_id: int) -> None
             & (task_entities.c.entity_id == entity_id)
         )
     )
+    _record_link_write(task_id)
     db.session.commit()
 
 
@@ -188,4 +190,20 @@ def set_linked_entities(task_id: int, entities: List[Dict[str, Any]]) -> None:
                 created_at=datetime.utcnow(),
             )
         )
+    _record_link_write(task_id)
     db.session.commit()
+
+
+def _record_link_write(task_id: int) -> None:
+    """Log a relinked task and refresh its card in the writing transaction.
+
+    The link statements bypass the write listeners, so the task would
+    otherwise never reach delta sync, ETags or card-keyed caches.
+    """
+    from app.models import db
+    from app.models.projections import TaskCard
+    from app.services.change_log_service import ChangeLogService
+    from app.services.projection_service import ProjectionService
+
+    ChangeLogService.record_link_write(db.session, {"tasks": [task_id]})
+    ProjectionService.refresh(db.session.connection(), TaskCard, [task_id])
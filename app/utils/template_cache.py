@@ -0,0 +1,107 @@
+"""Jinja bytecode cache and startup template precompilation.
+
+Compiled templates are written to a filesystem bytecode cache keyed by
+template name and source checksum, so a restarted worker loads bytecode
+instead of parsing and compiling again; an edited template simply misses.
+``precompile_templates`` loads every template once at startup, moving the
+remaining compile cost out of the first requests that would hit it.
+"""
+
+import os
+import time
+from typing import Any, Dict, List, Optional
+
+from jinja2 import Environment, FileSystemBytecodeCache, TemplateError
+
+from app import config
+from app.utils.logging_config import get_crm_logger
+
+logger = get_crm_logger(__name__)
+
+
+class CountingBytecodeCache(FileSystemBytecodeCache):
+    """Filesystem bytecode cache that counts loads served from disk."""
+
+    def __init__(self, directory: Optional[str] = None) -> None:
+        super().__init__(directory)
+        self.hits = 0
+        self.misses = 0
+
+    def load_bytecode(self, bucket: Any) -> None:
+        """Load a bucket's bytecode and count whether it was found."""
+        super().load_bytecode(bucket)
+        if bucket.code is None:
+            self.misses += 1
+        else:
+            self.hits += 1
+
+
+def configure_bytecode_cache(env: Environment) -> Optional[CountingBytecodeCache]:
+    """Attach the filesystem bytecode cache configured by JINJA_BYTECODE_CACHE_DIR.
+
+    Args:
+        env: Jinja environment of the application.
+
+    Returns:
+        The attached cache, or None when disabled or the directory is unusable.
+    """
+    directory = config.JINJA_BYTECODE_CACHE_DIR
+    if directory == "none":
+        return None
+    try:
+        if directory:
+            os.makedirs(directory, exist_ok=True)
+        cache = CountingBytecodeCache(directory or None)
+    except (OSError, RuntimeError) as e:
+        logger.warning(
+            "Jinja bytecode cache disabled",
+            extra={"custom_fields": {"directory": directory, "error": str(e)}},
+        )
+        return None
+    env.bytecode_cache = cache
+    return cache
+
+
+def precompile_templates(env: Environment) -> Dict[str, Any]:
+    """Load every template once so requests find them compiled.
+
+    Templates that fail to compile are logged and reported; they raise
+    again when a request renders them.
+
+    Args:
+        env: Jinja environment of the application.
+
+    Returns:
+        Timing report: template count, total and slowest load times in
+        milliseconds, bytecode cache hits and misses, and failed templates.
+    """
+    cache = env.bytecode_cache
+    counted = isinstance(cache, CountingBytecodeCache)
+    hits, misses = (cache.hits, cache.misses) if counted else (0, 0)
+    timings: Dict[str, float] = {}
+    failed: List[str] = []
+
+    started = time.perf_counter()
+    for name in env.list_templates():
+        template_started = time.perf_counter()
+        try:
+            env.get_template(name)
+        except TemplateError as e:
+            failed.append(name)
+            logger.error(
+                "Template failed to precompile",
+                extra={"custom_fields": {"template": name, "error": str(e)}},
+            )
+            continue
+        timings[name] = round((time.perf_counter() - template_started) * 1000, 2)
+
+    report = {
+        "templates": len(timings),
+        "total_ms": round((time.perf_counter() - started) * 1000, 2),
+        "slowest": dict(sorted(timings.items(), key=lambda item: -item[1])[:5]),
+        "bytecode_hits": cache.hits - hits if counted else 0,
+        "bytecode_misses": cache.misses - misses if counted else 0,
+        "failed": failed,
+    }
+    logger.info("Templates precompiled", extra={"custom_fields": report})
+    return report
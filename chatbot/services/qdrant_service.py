@@ -3,11 +3,13 @@ Qdrant service for vector similarity search.
 Integrates with the CRM system to provide semantic search capabilities.
 """
 
+import hashlib
 import logging
 from typing import List, Dict, Any, Optional
 from datetime import datetime
 import threading
 from qdrant_client import QdrantClient
+from app.services.cache_service import Cache
 from ..config import ChatbotConfig
 from qdrant_client.models import (
     Distance,
@@ -22,6 +24,9 @@ from sentence_transformers import SentenceTransformer
 
 logger = logging.getLogger(__name__)
 
+# Embeddings by model and text hash; content-addressed, so shared across workers
+embedding_cache = Cache("embeddings", max_entries=10000, shared=True)
+
 
 class QdrantService:
     """Service for managing vector embeddings in Qdrant"""
@@ -41,7 +46,6 @@ class QdrantService:
         self.model = None
         self.embedding_dimension = 768  # Dimension for all-mpnet-base-v2
         self._model_lock = threading.Lock()  # Thread-safe model loading
-        self._embedding_cache = {}  # Cache for embeddings
 
     def _connect(self):
         """Connect to Qdrant with connection pooling"""
@@ -125,22 +129,16 @@ class QdrantService:
 
     def generate_embedding(self, text: str) -> List[float]:
         """Generate embedding for text with caching"""
-        # Check cache first
-        text_hash = hash(text)
-        if text_hash in self._embedding_cache:
-            return self._embedding_cache[text_hash]
+        # Stable across processes, unlike hash(), so workers share embeddings
+        key = (self.model_name, hashlib.sha256(text.encode()).hexdigest())
+        return embedding_cache.get_or_compute(key, lambda: self._encode(text))
 
+    def _encode(self, text: str) -> List[float]:
+        """Run the embedding model on text"""
         self._load_model()
 
         try:
-            embedding = self.model.encode(text)
-            embedding_list = embedding.tolist()
-
-            # Cache the result (limit cache size)
-            if len(self._embedding_cache) < 1000:
-                self._embedding_cache[text_hash] = embedding_list
-
-            return embedding_list
+            return self.model.encode(text).tolist()
         except Exception as e:
             logger.error(f"Failed to generate embedding: {e}")
             raise
@@ -0,0 +1,106 @@
+"""Benchmark list serialization: reflective to_dict + stdlib JSON vs compiled + orjson.
+
+Loads 10k companies (relationships eager loaded, so no queries are timed)
+from an in-memory database and serializes them the way the list API did
+before and after compiled serializers. Run from the repository root:
+
+    python scripts/benchmark_serialization.py [rows]
+"""
+
+import json
+import os
+import sys
+import time
+from datetime import date, datetime, timedelta
+
+from sqlalchemy.orm import selectinload
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+os.environ.setdefault("DATABASE_URL", "sqlite:///:memory:")
+
+from app.main import create_app  # noqa: E402
+from app.models import db, Company  # noqa: E402
+from app.services import SerializationService  # noqa: E402
+
+
+def reflective_to_dict(instance):
+    """The per-row reflective serializer the compiled serializers replaced."""
+    result = {}
+    for column in instance.__table__.columns:
+        value = getattr(instance, column.name, None)
+        result[column.name] = value.isoformat() if isinstance(value, (datetime, date)) else value
+    for prop in getattr(instance.__class__, "__include_properties__", []):
+        if hasattr(instance, prop):
+            value = getattr(instance, prop)
+            result[prop] = value.isoformat() if isinstance(value, (datetime, date)) else value
+    for field, transform in getattr(instance.__class__, "__relationship_transforms__", {}).items():
+        try:
+            result[field] = transform(instance)
+        except Exception:
+            result[field] = None
+    return result
+
+
+def best_of(runs, func):
+    """Best wall time of several runs, in milliseconds."""
+    timings = []
+    for _ in range(runs):
+        started = time.perf_counter()
+        func()
+        timings.append((time.perf_counter() - started) * 1000)
+    return min(timings)
+
+
+def main(rows: int = 10_000) -> None:
+    app = create_app()
+    with app.app_context():
+        db.create_all()
+        now = datetime.utcnow()
+        db.session.execute(
+            Company.__table__.insert(),
+            [
+                {
+                    "name": f"Company {i}",
+                    "industry": "technology",
+                    "website": f"https://company{i}.example.com",
+                    "size": ["startup", "small", "medium", "large"][i % 4],
+                    "created_at": now - timedelta(days=i % 365),
+                }
+                for i in range(rows)
+            ],
+        )
+        db.session.commit()
+
+        # Eager load what properties and transforms read so no queries are timed
+        companies = Company.query.options(
+            selectinload(Company.stakeholders),
+            selectinload(Company.opportunities),
+            selectinload(Company.account_team_assignments),
+        ).all()
+
+        def before():
+            return json.dumps([reflective_to_dict(c) for c in companies]).encode()
+
+        def after():
+            return app.json.dumps_bytes(SerializationService.serialize_many(companies))
+
+        assert json.loads(before()) == json.loads(after()), "outputs differ"
+
+        results = {
+            "reflective + json": best_of(5, before),
+            "compiled + orjson": best_of(5, after),
+            "reflective only": best_of(5, lambda: [reflective_to_dict(c) for c in companies]),
+            "compiled only": best_of(
+                5, lambda: SerializationService.serialize_many(companies)
+            ),
+        }
+
+    print(f"Serializing {rows} companies (best of 5)")
+    for name, ms in results.items():
+        print(f"  {name:<20} {ms:8.1f} ms")
+    speedup = results["reflective + json"] / results["compiled + orjson"]
+    print(f"  speedup              {speedup:8.1f}x")
+
+
+if __name__ == "__main__":
+    main(int(sys.argv[1]) if len(sys.argv) > 1 else 10_000)
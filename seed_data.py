@@ -26,6 +26,7 @@ from app.models import (
     CompanyAccountTeam,
     OpportunityAccountTeam
 )
+from app.services import ChangeLogService, CounterService, ProjectionService
 
 
 def seed_users():
@@ -887,6 +888,11 @@ def main():
         User.query.delete()
 
         db.session.commit()
+
+        # Bulk deletes skip the write listeners: bring read models back in line
+        ChangeLogService.reconcile()
+        ProjectionService.rebuild()
+        CounterService.rebuild()
         print("✓ Cleared all existing data")
 
         # Seed data in correct order
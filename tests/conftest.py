@@ -0,0 +1,27 @@
+"""Shared test fixtures.
+
+``app.config`` reads DATABASE_URL when it is first imported, so it is set
+here, before any test module imports the app: every app a test creates
+gets its own empty in-memory SQLite database, never the instance database.
+"""
+
+import os
+
+os.environ["DATABASE_URL"] = "sqlite:///:memory:"
+
+import pytest  # noqa: E402
+
+from app.main import create_app  # noqa: E402
+from app.models import db  # noqa: E402
+
+
+@pytest.fixture
+def app():
+    """Create app with an empty database, inside an application context."""
+    app = create_app()
+    app.config["TESTING"] = True
+
+    with app.app_context():
+        yield app
+        db.session.remove()
+        db.drop_all()
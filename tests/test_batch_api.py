@@ -0,0 +1,63 @@
+"""Tests for the batch request endpoint."""
+
+import pytest
+from sqlalchemy import event
+
+from app.models import db, Company, Stakeholder
+
+
+@pytest.fixture
+def client(app):
+    """Test client over a company with one stakeholder."""
+    company = Company(name="Acme")
+    db.session.add(company)
+    db.session.flush()
+    db.session.add(Stakeholder(name="Ann", company_id=company.id))
+    db.session.commit()
+    return app.test_client()
+
+
+class TestBatch:
+    """Test sub-request dispatch and responses."""
+
+    def test_responses_in_order(self, client):
+        """Verify each sub-request gets its own status and body."""
+        response = client.post(
+            "/api/batch",
+            json={
+                "requests": [
+                    {"method": "PUT", "path": "/api/companies/1", "body": {"name": "Acme Corp"}},
+                    {"path": "/api/companies/1"},
+                    {"path": "/api/companies/changes?since=x"},
+                    {"path": "/api/missing"},
+                    {"path": "/api/batch"},
+                ]
+            },
+        )
+
+        responses = response.get_json()["responses"]
+        assert response.status_code == 200
+        assert [item["status"] for item in responses] == [200, 200, 400, 404, 400]
+        assert responses[1]["body"]["name"] == "Acme Corp"
+        assert "ETag" in responses[1]["headers"]
+
+    def test_repeated_entities_loaded_once(self, client):
+        """Verify an entity loaded by one sub-request is reused by the next."""
+        statements = []
+        event.listen(
+            db.engine,
+            "before_cursor_execute",
+            lambda conn, cursor, statement, *args: statements.append(statement),
+        )
+
+        client.post(
+            "/api/batch",
+            json={"requests": [{"path": "/api/companies/1"}, {"path": "/api/stakeholders/1"}]},
+        )
+
+        entity_loads = [s for s in statements if "stakeholders.name AS stakeholders_name" in s]
+        assert len(entity_loads) == 1  # the company's collection, not the detail lookup
+
+    def test_rejects_malformed_body(self, client):
+        """Verify the body must carry a requests array."""
+        assert client.post("/api/batch", json=[{"path": "/api/companies"}]).status_code == 400
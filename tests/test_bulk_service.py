@@ -0,0 +1,87 @@
+"""Tests for single-transaction bulk writes."""
+
+import pytest
+
+from app.models import db, Company, CompanyCard, Opportunity, Stakeholder
+from app.services import BulkService, CounterService
+
+
+@pytest.fixture
+def app(app):
+    """Create app with one company for testing."""
+    db.session.add(Company(name="Acme"))
+    db.session.commit()
+    return app
+
+
+def statuses(result, operation: str) -> list:
+    """Item statuses of one operation in submission order."""
+    return [item["status"] for item in result.results[operation]]
+
+
+class TestBulkService:
+    """Test bulk creates, updates and deletes."""
+
+    def test_partial_failure_reports_items(self, app):
+        """Verify invalid items fail alone while the rest apply."""
+        company_id = Company.query.one().id
+        result = BulkService.execute(
+            Opportunity,
+            creates=[
+                {"name": "Won", "value": 100, "stage": "closed-won", "company_id": company_id},
+                {"value": 5},
+                {"name": "Dated", "company_id": company_id, "expected_close_date": "2026-03-01"},
+            ],
+            deletes=[999],
+        )
+
+        assert statuses(result, "create") == ["created", "failed", "created"]
+        assert "name" in result.results["create"][1]["error"]
+        assert statuses(result, "delete") == ["failed"]
+        assert Opportunity.query.count() == 2
+
+    def test_side_effects_match_orm_writes(self, app):
+        """Verify counters, cards and derived columns stay in step."""
+        company_id = Company.query.one().id
+        created = BulkService.execute(
+            Opportunity,
+            creates=[{"name": f"Deal {i}", "value": 10, "company_id": company_id} for i in range(3)],
+        )
+        ids = [item["id"] for item in created.results["create"]]
+
+        # Updates apply before deletes, so unlinking the company unblocks the delete
+        BulkService.execute(
+            Opportunity,
+            updates=[{"id": ids[0], "stage": "closed-won"}, {"id": ids[1], "company_id": None}],
+            deletes=[ids[1]],
+        )
+        BulkService.execute(
+            Stakeholder, creates=[{"name": "Ann", "job_title": "VP Sales", "company_id": company_id}]
+        )
+
+        assert CounterService.reconcile() == []
+        card = db.session.get(CompanyCard, company_id)
+        assert (card.active_opportunities, card.pipeline_value, card.stakeholders) == (1, 10, 1)
+        assert Stakeholder.query.one().seniority == "vp"
+
+    def test_atomic_rolls_back_everything(self, app):
+        """Verify one failed item undoes the whole atomic request."""
+        result = BulkService.execute(
+            Company, creates=[{"name": "Globex"}, {"industry": "finance"}], atomic=True
+        )
+
+        assert result.rolled_back
+        assert statuses(result, "create") == ["failed", "failed"]
+        assert Company.query.count() == 1
+        assert CounterService.reconcile() == []
+
+    def test_delete_blocked_by_dependents(self, app):
+        """Verify rows with dependents are not deleted."""
+        company = Company.query.one()
+        db.session.add(Opportunity(name="Deal", value=1, company_id=company.id))
+        db.session.commit()
+
+        result = BulkService.execute(Company, deletes=[company.id])
+
+        assert result.results["delete"][0]["error"] == "Cannot delete entity with dependencies"
+        assert Company.query.count() == 1
@@ -0,0 +1,117 @@
+"""Tests for the tiered cache."""
+
+import threading
+import time
+
+from app.models import db, Company
+from app.services import cache_service
+from app.services.cache_service import MISSING, Cache, DataVersions, SQLiteTier
+
+
+class TestCache:
+    """Test limits, versions, single-flight computes and the shared tier."""
+
+    def test_lru_entry_and_byte_limits(self):
+        """Verify least recently used entries go first past either limit."""
+        cache = Cache("test-limits", max_entries=2, max_bytes=None)
+        cache.set("a", 1)
+        cache.set("b", 2)
+        cache.get("a")
+        cache.set("c", 3)
+        assert (cache.get("a"), cache.get("b"), cache.get("c")) == (1, MISSING, 3)
+
+        sized = Cache("test-bytes", max_entries=None, max_bytes=250)
+        sized.set("x", "x" * 100)
+        sized.set("y", "y" * 100)
+        sized.get("x")
+        sized.set("w", "w" * 100)
+        sized.set("big", "z" * 1000)
+        assert sized.get("y") == MISSING
+        assert sized.get("x") == "x" * 100
+        assert sized.get("big") == MISSING
+        assert (sized.metrics["evictions"], sized.metrics["oversize"]) == (1, 1)
+
+    def test_ttl_and_versions(self):
+        """Verify expired entries and other versions are misses."""
+        cache = Cache("test-ttl", ttl=0.05)
+        cache.set("key", "value", version=(1,))
+
+        assert cache.get("key", version=(1,)) == "value"
+        assert cache.get("key", version=(2,)) == MISSING
+        time.sleep(0.06)
+        assert cache.get("key", version=(1,)) == MISSING
+        assert cache.stats()["hit_rate"] == round(1 / 3, 3)
+
+    def test_concurrent_misses_compute_once(self):
+        """Verify a stampede on one key runs the computation once."""
+        cache = Cache("test-stampede")
+        calls = []
+
+        def compute():
+            calls.append(1)
+            time.sleep(0.05)
+            return "value"
+
+        results = []
+        threads = [
+            threading.Thread(target=lambda: results.append(cache.get_or_compute("k", compute)))
+            for _ in range(8)
+        ]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+
+        assert results == ["value"] * 8
+        assert len(calls) == 1
+        assert cache.metrics["coalesced"] == 7
+
+    def test_shared_tier_between_processes(self, tmp_path, monkeypatch):
+        """Verify a value stored by one worker is read from the shared tier by another."""
+        monkeypatch.setattr(cache_service, "_shared_tier", SQLiteTier(str(tmp_path / "c.db"), 300))
+        writer = Cache("test-shared", shared=True)
+        writer.set("old", "o" * 200)
+        writer.set("new", "n" * 200)
+        writer.set("k", [1.0, 2.0])
+        reader = Cache("test-shared", shared=True)
+
+        assert reader.get("k") == [1.0, 2.0]
+        assert reader.metrics["shared_hits"] == 1
+        assert reader.get("old") == MISSING  # Trimmed past the byte limit
+        assert reader.get("new") == "n" * 200
+        reader.invalidate()
+        assert Cache("test-shared", shared=True).get("k") == MISSING
+
+    def test_sqlite_tier_keeps_a_running_byte_total(self, tmp_path):
+        """Verify the byte total follows writes and trims only past the limit."""
+        path = str(tmp_path / "c.db")
+        tier = SQLiteTier(path, 1000)
+
+        def total():
+            return tier._connection.execute("SELECT bytes FROM cache_size").fetchone()[0]
+
+        tier.set("ns:a", b"a" * 400, None)
+        tier.set("ns:a", b"a" * 300, None)
+        tier.set("other:b", b"b" * 500, None)
+        assert total() == 800
+        tier.set("ns:c", b"c" * 300, None)  # 1100 bytes: trimmed to 900 or less
+        assert (tier.get("ns:a"), total()) == (None, 800)
+        tier.clear("ns:")
+        assert total() == 500
+        assert SQLiteTier(path, 1000).get("other:b") == b"b" * 500
+        tier.delete("other:b")
+        assert total() == 0
+
+    def test_versioned_values_shared_until_a_write(self, app, tmp_path, monkeypatch):
+        """Verify versions come from the change log, so workers share versioned values."""
+        monkeypatch.setattr(cache_service, "_shared_tier", SQLiteTier(str(tmp_path / "c.db"), 1000))
+        tables = ("companies", "stakeholder_opportunities")
+        Cache("test-versioned", shared=True).set("k", "old", version=DataVersions.get(tables))
+
+        reader = Cache("test-versioned", shared=True)
+        assert reader.get("k", version=DataVersions.get(tables)) == "old"
+        assert len(DataVersions.get(tables)) == 1  # Link tables move with their owners
+
+        db.session.add(Company(name="Acme"))
+        db.session.commit()
+        assert Cache("test-versioned", shared=True).get("k", DataVersions.get(tables)) == MISSING
@@ -0,0 +1,95 @@
+"""Tests for the entity change log behind delta sync."""
+
+import pytest
+
+from app.models import db, Company, CompanyAccountTeam, EntityTombstone, Note, Task, User
+from app.services import BulkService, ChangeLogService
+
+
+@pytest.fixture
+def client(app):
+    """Test client over two companies."""
+    db.session.add_all([Company(name="Acme"), Company(name="Globex")])
+    db.session.commit()
+    return app.test_client()
+
+
+def sync(client, cursor: int = 0, limit: int = 1000) -> dict:
+    """Fetch one page of company changes."""
+    response = client.get(f"/api/companies/changes?since={cursor}&limit={limit}")
+    assert response.status_code == 200
+    return response.get_json()
+
+
+class TestChangeLog:
+    """Test change sequences, tombstones and paging."""
+
+    def test_full_then_delta_sync(self, client):
+        """Verify a later sync returns only entities written since the cursor."""
+        full = sync(client)
+        assert [change["data"]["name"] for change in full["changes"]] == ["Acme", "Globex"]
+
+        client.put("/api/companies/1", json={"name": "Acme Corp"})
+        client.put("/api/companies/1", json={"industry": "technology"})
+        delta = sync(client, full["cursor"])
+
+        assert [(c["op"], c["id"]) for c in delta["changes"]] == [("upsert", 1)]
+        assert delta["changes"][0]["data"]["name"] == "Acme Corp"
+        assert sync(client, delta["cursor"])["changes"] == []
+
+    def test_deletes_leave_tombstones(self, client):
+        """Verify deletes sync as tombstones, ORM and bulk alike."""
+        created = BulkService.execute(Company, creates=[{"name": "Initech"}])
+        cursor = sync(client)["cursor"]
+        client.delete("/api/companies/2")
+        BulkService.execute(Company, deletes=[created.results["create"][0]["id"]])
+
+        changes = sync(client, cursor)["changes"]
+
+        assert [(change["op"], change["id"]) for change in changes] == [("delete", 2), ("delete", 3)]
+        assert all(change["deleted_at"] for change in changes)
+        assert EntityTombstone.query.count() == 2
+
+    def test_paging_and_rollback(self, client):
+        """Verify pages follow the cursor and rolled back writes are not logged."""
+        db.session.add(Note(content="Call back", entity_type="company", entity_id=1))
+        db.session.flush()
+        db.session.rollback()
+
+        first = sync(client, limit=1)
+        second = sync(client, first["cursor"], limit=1)
+
+        assert first["has_more"] and not second["has_more"]
+        assert [first["changes"][0]["id"], second["changes"][0]["id"]] == [1, 2]
+        assert client.get("/api/notes/changes").get_json()["changes"] == []
+        assert client.get("/api/companies/changes?since=x").status_code == 400
+
+    def test_link_writes_log_their_owners(self, client):
+        """Verify relinking a task and assigning an account team are logged."""
+        task, user = Task(description="Call"), User(name="Ann", email="ann@example.com")
+        db.session.add_all([task, user])
+        db.session.commit()
+        task.set_linked_entities([{"type": "company", "id": 1}])
+        cursor = ChangeLogService.changes_since(Task, 0, 100)["cursor"]
+
+        task.set_linked_entities([{"type": "company", "id": 2}])
+        relinked = ChangeLogService.changes_since(Task, cursor, 100)
+        assert [(c["op"], c["id"]) for c in relinked["changes"]] == [("upsert", task.id)]
+
+        cursor = sync(client)["cursor"]
+        db.session.add(CompanyAccountTeam(company_id=2, user_id=user.id))
+        db.session.commit()
+        assert [c["id"] for c in sync(client, cursor)["changes"]] == [2]
+
+    def test_reconcile_logs_bulk_deletes(self, client):
+        """Verify rows removed by Query.delete() are logged as deletes on reconcile."""
+        cursor = sync(client)["cursor"]
+        Company.query.filter_by(name="Globex").delete()
+        db.session.commit()
+
+        assert ChangeLogService.reconcile() == {"companies": 1}
+        changes = sync(client, cursor)["changes"]
+
+        assert [(change["op"], change["id"]) for change in changes] == [("delete", 2)]
+        assert EntityTombstone.query.count() == 1
+
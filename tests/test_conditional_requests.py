@@ -0,0 +1,87 @@
+"""Tests for ETag and Last-Modified conditional GETs."""
+
+from datetime import datetime, timedelta, timezone
+
+import pytest
+from sqlalchemy import event, update
+from werkzeug.http import http_date
+
+from app.models import db, Company, EntityChange, Opportunity, Stakeholder, Task
+
+
+@pytest.fixture
+def client(app):
+    """Test client over a company with two opportunities."""
+    company = Company(name="Acme")
+    db.session.add(company)
+    db.session.flush()
+    db.session.add_all(
+        [
+            Opportunity(name="Deal", value=100, company_id=company.id),
+            Opportunity(name="Other", value=200, company_id=company.id),
+            Stakeholder(name="Ann", company_id=company.id),
+        ]
+    )
+    db.session.commit()
+    return app.test_client()
+
+
+class TestConditionalRequests:
+    """Test 304 responses and validator changes."""
+
+    @pytest.mark.parametrize("path", ["/api/opportunities", "/api/opportunities/1"])
+    def test_matching_etag_skips_loading(self, client, path):
+        """Verify a current client gets 304 from one validator query."""
+        first = client.get(path)
+        statements = []
+        event.listen(db.engine, "before_cursor_execute", lambda *args: statements.append(1))
+
+        response = client.get(path, headers={"If-None-Match": first.headers["ETag"]})
+
+        assert response.status_code == 304
+        assert len(statements) == 1
+        since = client.get(path, headers={"If-Modified-Since": first.headers["Last-Modified"]})
+        assert since.status_code == 304
+
+    @pytest.mark.parametrize("path", ["/api/opportunities", "/api/opportunities/1"])
+    def test_modified_since_yesterday_refetches(self, client, path):
+        """Verify data unchanged since yesterday is still resent after midnight."""
+        two_days_ago = datetime.utcnow() - timedelta(days=2)
+        db.session.execute(update(EntityChange).values(changed_at=two_days_ago))
+        db.session.execute(update(Opportunity).values(updated_at=two_days_ago))
+        db.session.commit()
+        yesterday = http_date(datetime.now(timezone.utc) - timedelta(days=1))
+
+        response = client.get(path, headers={"If-Modified-Since": yesterday})
+
+        assert response.status_code == 200
+        since = client.get(path, headers={"If-Modified-Since": response.headers["Last-Modified"]})
+        assert since.status_code == 304
+
+    def test_related_write_changes_etag(self, client):
+        """Verify writes to the listed and serialized tables change the tag."""
+        etag = client.get("/api/opportunities").headers["ETag"]
+        client.put("/api/opportunities/1", json={"name": "Renamed"})
+        changed = client.get("/api/opportunities", headers={"If-None-Match": etag})
+        assert changed.status_code == 200
+
+        etag = changed.headers["ETag"]
+        client.put("/api/stakeholders/1", json={"name": "Bea"})
+        assert client.get("/api/opportunities", headers={"If-None-Match": etag}).status_code == 200
+
+    @pytest.mark.parametrize("path", ["/api/tasks", "/api/tasks/1"])
+    def test_relink_changes_etag(self, client, path):
+        """Verify moving a task's link to another company changes the tag."""
+        db.session.add(Company(name="Globex"))
+        task = Task(description="Call")
+        db.session.add(task)
+        db.session.commit()
+        task.set_linked_entities([{"type": "company", "id": 1}])
+        etag = client.get(path).headers["ETag"]
+
+        task.set_linked_entities([{"type": "company", "id": 2}])
+        response = client.get(path, headers={"If-None-Match": etag})
+
+        assert response.status_code == 200
+        assert response.headers["ETag"] != etag
+
@@ -0,0 +1,101 @@
+"""Tests for incrementally maintained entity counters."""
+
+from app.models import db, Company, CompanyCard, EntityCounter, Opportunity, Task
+from app.services import CounterService, ProjectionService
+
+
+def stored(table_name: str, name: str = "total") -> int:
+    """Read one stored counter, 0 when missing."""
+    return CounterService.stored().get((table_name, name), 0)
+
+
+class TestCounterService:
+    """Test counter maintenance from write listeners."""
+
+    def test_insert_and_delete_adjust_totals(self, app):
+        """Verify totals follow inserts and deletes of committed rows."""
+        company = Company(name="Acme")
+        db.session.add_all([company, Company(name="Globex")])
+        db.session.commit()
+        assert stored("companies") == 2
+
+        db.session.delete(company)
+        db.session.commit()
+        assert stored("companies") == 1
+
+    def test_transitions_move_counts(self, app):
+        """Verify stage and status changes move counts between values."""
+        opportunity = Opportunity(name="Deal", value=100)
+        task = Task(description="Call", status="todo")
+        db.session.add_all([opportunity, task])
+        db.session.commit()
+
+        opportunity.stage = "closed-won"
+        task.status = "complete"
+        db.session.commit()
+
+        assert stored("opportunities", "stage:prospect") == 0
+        assert stored("opportunities", "stage:closed-won") == 1
+        assert stored("tasks", "status:todo") == 0
+        assert stored("tasks", "status:complete") == 1
+        assert CounterService.reconcile() == []
+
+    def test_rollback_leaves_counters_unchanged(self, app):
+        """Verify deltas of a rolled back flush are not applied."""
+        db.session.add(Task(description="Call"))
+        db.session.flush()
+        db.session.rollback()
+
+        db.session.add(Company(name="Acme"))
+        db.session.commit()
+        assert stored("tasks") == 0
+        assert CounterService.reconcile() == []
+
+    def test_reconcile_reports_and_fixes_drift(self, app):
+        """Verify reconciliation finds drifted counters and rebuilds them."""
+        db.session.add(Task(description="Call"))
+        db.session.commit()
+        db.session.execute(
+            EntityCounter.__table__.update()
+            .where(EntityCounter.table_name == "tasks", EntityCounter.name == "total")
+            .values(value=5)
+        )
+        db.session.commit()
+
+        drift = CounterService.reconcile(fix=True)
+        assert drift == [{"table": "tasks", "name": "total", "stored": 5, "actual": 1}]
+        assert CounterService.reconcile() == []
+
+    def test_bulk_delete_then_reseed_keeps_counts(self, app):
+        """Verify repair after Query.delete() keeps counters and cards exact."""
+        db.session.add_all([Company(name=name) for name in ("Acme", "Globex", "Initech")])
+        db.session.commit()
+        Company.query.delete()  # Skips the write listeners, like seed_data.py
+        db.session.commit()
+
+        CounterService.rebuild()
+        ProjectionService.rebuild()
+        db.session.add(Company(name="Hooli"))
+        db.session.commit()
+
+        assert CounterService.stored() == CounterService.compute()
+        assert stored("companies") == 1
+        assert [card.entity_id for card in CompanyCard.query] == [Company.query.one().id]
+
+
+    def test_startup_builds_only_empty_counters(self, app):
+        """Verify ensure_built fills an empty table but leaves drift to reconcile."""
+        db.session.add_all([Company(name="Acme"), Task(description="Call")])
+        db.session.commit()
+        EntityCounter.query.delete()
+        db.session.commit()
+
+        CounterService.ensure_built()
+        assert CounterService.stored() == CounterService.compute()
+
+        Company.query.delete()
+        db.session.commit()
+        CounterService.ensure_built()
+        assert stored("companies") == 1
+        assert CounterService.reconcile(fix=True) != []
+        assert stored("companies") == 0
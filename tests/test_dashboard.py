@@ -0,0 +1,121 @@
+"""Tests for independently cached dashboard sections."""
+
+import re
+import threading
+import time
+
+import pytest
+
+from app.models import db, Company
+from app.routes.web.dashboard_service import DashboardSection, DashboardService
+
+
+@pytest.fixture
+def client(app):
+    """Test client over one company, with every section cache empty."""
+    db.session.add(Company(name="Acme"))
+    db.session.commit()
+    for section in DashboardService.get_sections():
+        section.cache.invalidate()
+    return app.test_client()
+
+
+def get_section(client, key, user=None):
+    """Request a section, returning its HTML and cache status."""
+    environ = {"REMOTE_USER": user} if user else {}
+    response = client.get(f"/dashboard/sections/{key}", environ_overrides=environ)
+    assert response.status_code == 200
+    status = re.search(r'cache;desc="(\w+)"', response.headers["Server-Timing"]).group(1)
+    return response.get_data(as_text=True), status
+
+
+def wait_for_refreshes():
+    """Wait for background section refreshes to finish."""
+    for thread in threading.enumerate():
+        if thread.name.endswith("-cache-refresh"):
+            thread.join()
+
+
+class TestSectionCache:
+    """Test how section payloads are shared and invalidated."""
+
+    def test_payload_shared_across_users(self, client):
+        """Verify one cached payload serves every user."""
+        assert get_section(client, "recent-companies", "ann")[1] == "miss"
+        assert get_section(client, "recent-companies", "bob")[1] == "hit"
+        assert get_section(client, "recent-companies")[1] == "hit"
+
+    def test_write_invalidates_payload(self, client):
+        """Verify a write serves the old payload once, then the rebuilt one."""
+        page, _ = get_section(client, "recent-companies")
+        assert "Acme" in page and "Globex" not in page
+
+        db.session.add(Company(name="Globex"))
+        db.session.commit()
+
+        page, status = get_section(client, "recent-companies")
+        assert status == "stale" and "Globex" not in page
+        wait_for_refreshes()
+        page, status = get_section(client, "recent-companies")
+        assert status == "hit" and "Globex" in page
+
+
+class TestSections:
+    """Test the section registry and section endpoints."""
+
+    def test_index_loads_every_section(self, client):
+        """Verify the page shell requests each registered section."""
+        page = client.get("/").get_data(as_text=True)
+
+        for section in DashboardService.get_sections():
+            assert f'hx-get="/dashboard/sections/{section.key}"' in page
+
+    def test_sections_render_with_server_timing(self, client):
+        """Verify every section renders and reports its timing and cache status."""
+        for section in DashboardService.get_sections():
+            response = client.get(f"/dashboard/sections/{section.key}")
+
+            assert response.status_code == 200
+            assert re.fullmatch(
+                rf'section;desc="{section.key}";dur=\d+\.\d, cache;desc="miss"',
+                response.headers["Server-Timing"],
+            )
+        assert client.get("/dashboard/sections/nope").status_code == 404
+
+    def test_stale_conditions(self, client):
+        """Verify a payload is stale past its TTL or version, and rebuilt past the stale window."""
+        builds = []
+
+        def build():
+            builds.append(1)
+            return {"build": len(builds)}
+
+        section = DashboardSection(
+            key="test",
+            title="Test",
+            template="dashboard/sections/pipeline.html",
+            build=build,
+            tables=("companies",),
+            ttl=0.1,
+            stale_ttl=0.2,
+        )
+
+        def get():
+            context, status = DashboardService.get_section_data(section)
+            wait_for_refreshes()
+            return context["build"], status
+
+        assert get() == (1, "miss")
+        assert get() == (1, "hit")
+        # Past the TTL the old payload is served while it is rebuilt
+        time.sleep(0.1)
+        assert get() == (1, "stale")
+        assert get() == (2, "hit")
+        # So is a payload built before a write to one of its tables
+        db.session.add(Company(name="Globex"))
+        db.session.commit()
+        assert get() == (2, "stale")
+        assert get() == (3, "hit")
+        # Past the stale window too, the payload is rebuilt before responding
+        time.sleep(0.3)
+        assert get() == (4, "miss")
@@ -0,0 +1,96 @@
+"""Tests for paged and streamed entity list content."""
+
+import html
+import re
+
+import pytest
+
+from app.models import db, Company, Opportunity
+
+
+@pytest.fixture
+def client(app):
+    """Test client over three prospects and two qualified deals."""
+    company = Company(name="Acme")
+    db.session.add(company)
+    db.session.flush()
+    stages = ["prospect", "qualified", "prospect", "qualified", "prospect"]
+    db.session.add_all(
+        [
+            Opportunity(name=f"Deal {i}", value=100, stage=stage, company_id=company.id)
+            for i, stage in enumerate(stages)
+        ]
+    )
+    db.session.commit()
+    return app.test_client()
+
+
+def load_pages(client, url):
+    """Follow "load more" links from a first page, returning each page's HTML."""
+    pages = []
+    while url:
+        pages.append(client.get(url).get_data(as_text=True))
+        match = re.search(r'hx-get="([^"]*page=[^"]*)"', pages[-1])
+        url = html.unescape(match.group(1)) if match else None
+    return pages
+
+
+def deals(page):
+    """Names of the deals rendered on a page."""
+    return set(re.findall(r"Deal \d", page))
+
+
+def headers(page):
+    """Group headers on a page as (label, badge count) pairs."""
+    pattern = r'<details class="card" data-group="([^"]+)".*?(?:badge-sm ml-2">\s*(\d+))?\s*</span>\s*</h3>'
+    return re.findall(pattern, page, re.DOTALL)
+
+
+class TestPagedGroups:
+    """Test groups that span "load more" pages."""
+
+    def test_group_continues_across_pages(self, client):
+        """Verify a cut-off group keeps one header with its full count."""
+        pages = load_pages(client, "/opportunities/content?group_by=stage&per_page=2")
+
+        assert len(pages) == 3
+        assert headers(pages[0]) == [("prospect", "3")]
+        # Page 2 finishes "prospect" in place and opens "qualified"
+        assert headers(pages[1]) == [("qualified", "2")]
+        assert 'hx-swap-oob="beforeend:#group-' in pages[1]
+        assert len(deals(pages[1])) == 2
+        assert headers(pages[2]) == []
+        assert pages[2].count('hx-swap-oob="beforeend:#group-') == 1
+
+    def test_ungrouped_pages_share_one_header(self, client):
+        """Verify later pages of an ungrouped list append to the first group."""
+        pages = load_pages(client, "/opportunities/content?per_page=2")
+
+        assert headers(pages[0]) == [("All Opportunities", "5")]
+        assert all(headers(page) == [] for page in pages[1:])
+        assert sorted(name for page in pages for name in deals(page)) == [
+            f"Deal {i}" for i in range(5)
+        ]
+
+
+class TestStreamedGroups:
+    """Test groups of streamed (``per_page=all``) lists."""
+
+    def test_stream_orders_by_group(self, client):
+        """Verify streamed groups appear once even when sorted by another field."""
+        page = client.get(
+            "/opportunities/content?group_by=stage&per_page=all&sort_by=name"
+        ).get_data(as_text=True)
+
+        assert re.findall(r'data-group="([^"]+)"', page) == ["prospect", "qualified"]
+        assert len(deals(page)) == 5
+
+    @pytest.mark.parametrize("group_by", ["company", "get_probability_range", "nope"])
+    def test_stream_lists_non_columns_ungrouped(self, client, group_by):
+        """Verify groupings without an SQL ordering stream as one group."""
+        page = client.get(
+            f"/opportunities/content?group_by={group_by}&per_page=all"
+        ).get_data(as_text=True)
+
+        assert re.findall(r'data-group="([^"]+)"', page) == ["All Opportunities"]
+        assert len(deals(page)) == 5
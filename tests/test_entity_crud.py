@@ -0,0 +1,66 @@
+"""Tests for entity CRUD utilities."""
+
+import pytest
+
+from app.models import db, Company, CompanyCard, Opportunity, Stakeholder, Task
+from app.services import BulkService
+from app.utils.entity_crud import get_deletion_impact
+
+
+@pytest.fixture
+def app(app):
+    """App over a company with one stakeholder."""
+    company = Company(name="Acme")
+    db.session.add(company)
+    db.session.flush()
+    db.session.add(Stakeholder(name="Ann", company_id=company.id))
+    db.session.commit()
+    return app
+
+
+class TestDeletionImpact:
+    """Test what the delete dialog reports for an entity."""
+
+    def test_reports_related_entities(self, app):
+        """Verify children and parents both appear as dependents."""
+        with app.app_context():
+            company = get_deletion_impact(Company, 1)
+            stakeholder = get_deletion_impact(Stakeholder, 1)
+
+        assert [dep["relationship"] for dep in company["dependent_entities"]] == ["stakeholders"]
+        assert [dep["relationship"] for dep in stakeholder["dependent_entities"]] == ["company"]
+        assert not company["safe_to_delete"] and not stakeholder["safe_to_delete"]
+
+    def test_card_projection_is_not_a_dependent(self, app):
+        """Verify an entity whose only related row is its card can be deleted."""
+        client = app.test_client()
+        with app.app_context():
+            db.session.add(Company(name="Initech"))
+            db.session.commit()
+            assert db.session.get(CompanyCard, 2) is not None
+
+            impact = get_deletion_impact(Company, 2)
+
+        assert impact["safe_to_delete"] and impact["dependent_entities"] == []
+        assert client.delete("/api/companies/2").status_code == 200
+        with app.app_context():
+            assert db.session.get(CompanyCard, 2) is None
+
+    def test_bulk_delete_applies_the_same_rule(self, app):
+        """Verify bulk deletes block exactly the entities the single delete blocks."""
+        with app.app_context():
+            parent = Task(description="Plan")
+            opportunity = Opportunity(name="Deal", value=1)
+            db.session.add_all([Company(name="Initech"), parent, opportunity])
+            db.session.flush()
+            db.session.add(Task(description="Call", parent_task_id=parent.id))
+            stakeholder = db.session.get(Stakeholder, 1)
+            stakeholder.opportunities.append(opportunity)
+            db.session.commit()
+
+            for model in (Company, Stakeholder, Opportunity, Task):
+                ids = {entity.id for entity in model.query}
+                blocked = BulkService.dependent_ids(model, ids)
+                for entity_id in ids:
+                    safe = get_deletion_impact(model, entity_id)["safe_to_delete"]
+                    assert safe == (entity_id not in blocked), (model.__name__, entity_id)
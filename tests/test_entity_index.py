@@ -0,0 +1,102 @@
+"""Tests for entity index pages and their cached fragments."""
+
+import re
+import threading
+
+import pytest
+from sqlalchemy import event
+
+from app.models import db, Company, Stakeholder, Task, User
+from app.routes.web.entities import fragment_cache
+from app.services.cache_service import Cache
+
+
+@pytest.fixture
+def app(app):
+    """App over one stakeholder and one user, with the fragment cache empty."""
+    company = Company(name="Acme")
+    db.session.add_all([company, User(name="Rep", email="rep@example.com")])
+    db.session.flush()
+    db.session.add(Stakeholder(name="Ann", company_id=company.id))
+    db.session.commit()
+    fragment_cache.invalidate()
+    return app
+
+
+@pytest.fixture
+def get_index(app):
+    """Request an index page, returning its HTML and the SQL it executed."""
+    client = app.test_client()
+
+    def get(url="/stakeholders"):
+        executed = []
+
+        def record(conn, cursor, statement, parameters, context, executemany):
+            executed.append(statement)
+
+        event.listen(db.engine, "before_cursor_execute", record)
+        try:
+            page = client.get(url).get_data(as_text=True)
+        finally:
+            event.remove(db.engine, "before_cursor_execute", record)
+        for thread in threading.enumerate():
+            if thread.name.endswith("-cache-refresh"):
+                thread.join()
+        return page, executed
+
+    return get
+
+
+def only_version_reads(executed):
+    """Whether every statement only read data versions from the change log."""
+    return all("FROM entity_changes" in statement for statement in executed)
+
+
+def first_stat(page):
+    """Value of the first stats card on a page."""
+    return re.search(r'stat-value">([^<]*)<', page).group(1)
+
+
+class TestIndexFragments:
+    """Test when index stats and filter bars are served from cache."""
+
+    def test_warm_index_only_reads_versions(self, get_index):
+        """Verify a repeat visit serves both fragments after reading their versions."""
+        _, executed = get_index()
+        assert not only_version_reads(executed)
+
+        assert only_version_reads(get_index()[1])
+
+    def test_write_serves_stale_stats_then_refreshes(self, get_index):
+        """Verify a write to the model's table serves the old stats once."""
+        page, _ = get_index()
+        assert first_stat(page) == "1"
+
+        db.session.add(Stakeholder(name="Bob", company_id=1))
+        db.session.commit()
+
+        assert first_stat(get_index()[0]) == "1"
+        assert first_stat(get_index()[0]) == "2"
+
+    def test_filter_bar_follows_its_source_tables(self, get_index):
+        """Verify only writes to dropdown source tables refresh the filter bar."""
+        get_index()
+
+        db.session.add(Task(description="Call"))
+        db.session.commit()
+        assert only_version_reads(get_index()[1])
+
+        db.session.add(User(name="Lead", email="lead@example.com"))
+        db.session.commit()
+        assert "<span>Lead</span>" not in get_index()[0]
+        assert "<span>Lead</span>" in get_index()[0]
+
+    def test_filter_args_cached_separately(self, get_index):
+        """Verify each set of filter args gets its own filter bar, stats are shared."""
+        page, _ = get_index()
+        assert Cache.all_stats()["entity-fragments"]["entries"] == 2
+
+        filtered, _ = get_index("/stakeholders?relationship_owners=1")
+        assert filtered.count("selected: [] }") == page.count("selected: [] }") - 1
+        get_index("/stakeholders?relationship_owners=1")
+        assert Cache.all_stats()["entity-fragments"]["entries"] == 3
@@ -0,0 +1,58 @@
+"""Tests for columnar Arrow and Parquet exports."""
+
+import io
+
+import pytest
+
+pa = pytest.importorskip("pyarrow")
+pq = pytest.importorskip("pyarrow.parquet")
+
+from app.models import db, Company, Opportunity
+from app.services import export_service
+
+
+@pytest.fixture
+def client(app):
+    """Test client over a company with three opportunities."""
+    company = Company(name="Acme")
+    db.session.add(company)
+    db.session.flush()
+    db.session.add_all(
+        [
+            Opportunity(name="Won", value=100, stage="closed-won", company_id=company.id),
+            Opportunity(name="Open", value=200, company_id=company.id),
+            Opportunity(name="Also won", value=300, stage="closed-won", company_id=company.id),
+        ]
+    )
+    db.session.commit()
+    return app.test_client()
+
+
+class TestExport:
+    """Test export formats, column selection and filters."""
+
+    def test_arrow_stream_in_batches(self, client, monkeypatch):
+        """Verify the IPC stream carries typed columns over several batches."""
+        monkeypatch.setattr(export_service, "EXPORT_BATCH_SIZE", 2)
+        response = client.get("/api/opportunities/export")
+
+        reader = pa.ipc.open_stream(io.BytesIO(response.data))
+        batches = list(reader)
+        assert response.mimetype == "application/vnd.apache.arrow.stream"
+        assert [batch.num_rows for batch in batches] == [2, 1]
+        assert reader.schema.field("value").type == pa.int64()
+        assert reader.schema.field("expected_close_date").type == pa.date32()
+
+    def test_parquet_with_columns_and_filters(self, client):
+        """Verify column selection and QueryService filters apply."""
+        response = client.get(
+            "/api/opportunities/export?format=parquet&columns=name,value&stage=closed-won"
+        )
+
+        table = pq.read_table(io.BytesIO(response.data))
+        assert table.to_pydict() == {"name": ["Won", "Also won"], "value": [100, 300]}
+
+    def test_rejects_unknown_columns_and_formats(self, client):
+        """Verify bad arguments fail before streaming starts."""
+        assert client.get("/api/opportunities/export?columns=nope").status_code == 400
+        assert client.get("/api/opportunities/export?format=csv").status_code == 400
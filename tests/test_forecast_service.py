@@ -0,0 +1,120 @@
+"""Tests for vectorized pipeline forecasts."""
+
+import tracemalloc
+from datetime import date
+
+import numpy as np
+import pytest
+
+from app.routes.api.pipeline import MAX_FORECAST_MONTHS, MAX_SIMULATIONS
+from app.services import forecast_service
+from app.services.forecast_service import (
+    NO_MONTH,
+    STAGES,
+    ForecastService,
+    PipelineColumns,
+    month_code,
+)
+
+START = date(2026, 1, 15)
+
+
+def make_columns(rows) -> PipelineColumns:
+    """Build pipeline columns from (value, probability %, stage, close date) rows."""
+    value, probability, stage, close = zip(*rows)
+    return PipelineColumns(
+        value=np.array(value, dtype=np.float64),
+        probability=np.array(probability, dtype=np.float64) / 100.0,
+        stage=np.array([STAGES.index(s) for s in stage], dtype=np.int8),
+        close_month=np.array(
+            [month_code(d) if d else NO_MONTH for d in close], dtype=np.int32
+        ),
+    )
+
+
+COLUMNS = make_columns(
+    [
+        (1000, 50, "prospect", date(2026, 1, 20)),
+        (2000, 25, "proposal", date(2026, 2, 1)),
+        (4000, 100, "negotiation", None),
+        (8000, 100, "closed-won", date(2026, 1, 5)),
+        (500, 0, "closed-lost", date(2026, 1, 5)),
+    ]
+)
+
+
+class TestForecastService:
+    """Test forecast figures on small column arrays."""
+
+    def test_weighted_by_month(self):
+        """Verify open deals are bucketed by close month and weighted."""
+        months = ForecastService.weighted_by_month(COLUMNS, START, 3)
+        assert [m["month"] for m in months] == ["2026-01", "2026-02", "2026-03"]
+        assert [m["opportunity_count"] for m in months] == [1, 1, 0]
+        assert months[0]["weighted_value"] == 500
+        assert months[1]["weighted_value"] == 500
+
+    def test_stage_conversion(self):
+        """Verify funnel steps count deals at or past each stage."""
+        conversion = ForecastService.stage_conversion(COLUMNS)
+        first = conversion["steps"][0]
+        assert (first["entered"], first["advanced"]) == (5, 3)
+        assert conversion["win_rate"] == 0.5
+
+    def test_simulate_is_reproducible_and_centered(self):
+        """Verify seeded scenarios repeat and center on the weighted value."""
+        first = ForecastService.simulate(COLUMNS, 5000, seed=7)
+        second = ForecastService.simulate(COLUMNS, 5000, seed=7)
+        assert first == second
+        assert first["open_opportunities"] == 3
+        assert first["expected_value"] == 5000
+        assert first["won_value"]["p10"] <= 5000 <= first["won_value"]["p90"]
+        assert first["won_deals"]["p10"] >= 1  # The 100% deal always wins
+
+    def test_simulate_in_chunks(self, monkeypatch):
+        """Verify scenarios span several chunks without growing memory."""
+        monkeypatch.setattr(forecast_service, "SIMULATION_CHUNK", 1000)
+        chunked = ForecastService.simulate(COLUMNS, 2500, seed=7)
+        assert chunked["simulations"] == 2500
+        assert chunked["won_value"]["p10"] <= 5000 <= chunked["won_value"]["p90"]
+
+        monkeypatch.undo()
+        tracemalloc.start()
+        try:
+            ForecastService.simulate(COLUMNS, MAX_SIMULATIONS, seed=7)
+            peak = tracemalloc.get_traced_memory()[1]
+        finally:
+            tracemalloc.stop()
+        assert peak < 64 * 1024 * 1024
+
+
+@pytest.fixture
+def client(app):
+    """Test client over an empty pipeline."""
+    return app.test_client()
+
+
+class TestForecastRoute:
+    """Test forecast request bounds."""
+
+    @pytest.mark.parametrize(
+        "query",
+        [
+            f"months={MAX_FORECAST_MONTHS + 1}",
+            "months=0",
+            f"simulations={MAX_SIMULATIONS + 1}",
+            "simulations=0",
+            "seed=-1",
+        ],
+    )
+    def test_rejects_out_of_bounds(self, client, query):
+        """Verify requests past the month, simulation or seed bounds get a 400."""
+        assert client.get(f"/api/pipeline/forecast?{query}").status_code == 400
+
+    def test_largest_request(self, client):
+        """Verify the largest allowed request is served."""
+        response = client.get(
+            f"/api/pipeline/forecast?months={MAX_FORECAST_MONTHS}&simulations={MAX_SIMULATIONS}"
+        )
+        assert response.status_code == 200
+        assert len(response.get_json()["months"]) == MAX_FORECAST_MONTHS
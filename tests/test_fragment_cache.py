@@ -0,0 +1,78 @@
+"""Tests for the {% cache %} template tag and cached entity cards."""
+
+from datetime import date, datetime
+
+import pytest
+
+from app.models import db, Company
+from app.models.base import BaseModel
+from app.models.enums import TaskStatus
+from app.utils.fragment_cache import fragment_cache, key_part
+
+
+@pytest.fixture
+def app(app, monkeypatch):
+    """App over three companies, counting card metadata lookups."""
+    fragment_cache.invalidate()
+    calls = []
+    get_meta_data = BaseModel.get_meta_data
+
+    def counted(self):
+        calls.append(self.id)
+        return get_meta_data(self)
+
+    monkeypatch.setattr(BaseModel, "get_meta_data", counted)
+    app.meta_calls = calls
+
+    db.session.add_all([Company(name=f"Company {i}") for i in range(3)])
+    db.session.commit()
+    yield app
+    fragment_cache.invalidate()
+
+
+class TestFragmentCache:
+    """Test fragment reuse and re-rendering on change."""
+
+    def test_body_renders_once_per_key(self, app):
+        """Verify the body renders once per key and again for a new key."""
+        template = app.jinja_env.from_string(
+            "{% cache 'test', key %}{{ render() }}{% endcache %}"
+        )
+        renders = []
+
+        def render():
+            renders.append(1)
+            return "render %d" % len(renders)
+
+        assert template.render(key=1, render=render) == "render 1"
+        assert template.render(key=1, render=render) == "render 1"
+        assert template.render(key=2, render=render) == "render 2"
+        assert len(renders) == 2
+
+    def test_keys_are_process_independent_scalars(self, app):
+        """Verify values key as scalars, containers by content, and objects fail."""
+        assert key_part(datetime(2026, 1, 2, 3, 4)) == "2026-01-02T03:04:00"
+        assert key_part(date(2026, 1, 2)) == "2026-01-02"
+        assert key_part(TaskStatus.TODO) == TaskStatus.TODO.value
+        assert key_part({"a": 1, "b": [2]}) == key_part({"b": [2], "a": 1})
+        assert key_part({"a": 1}) != key_part({"a": 2})
+
+        template = app.jinja_env.from_string("{% cache 'test', value %}x{% endcache %}")
+        with app.app_context():
+            with pytest.raises(TypeError):
+                template.render(value=db.session.get(Company, 1))
+
+    def test_index_reuses_unchanged_cards(self, app):
+        """Verify a repeated list renders no cards and an edit re-renders one."""
+        client = app.test_client()
+        client.get("/companies/content")
+        assert sorted(app.meta_calls) == [1, 2, 3]
+
+        del app.meta_calls[:]
+        first = client.get("/companies/content").data
+        assert app.meta_calls == []
+
+        client.put("/api/companies/2", json={"name": "Renamed"})
+        response = client.get("/companies/content")
+        assert app.meta_calls == [2]
+        assert b"Renamed" in response.data and b"Renamed" not in first
@@ -0,0 +1,98 @@
+"""Tests for streaming CSV/XLSX imports."""
+
+import io
+import time
+
+import pytest
+
+from app.models import db, Company, Opportunity, Stakeholder
+from app.services import CounterService, ImportService
+from app.services.import_service import ImportJob
+
+
+@pytest.fixture
+def client(app):
+    """Test client over two companies."""
+    db.session.add_all([Company(name="Acme"), Company(name="Globex")])
+    db.session.commit()
+    return app.test_client()
+
+
+def wait_for(client, location: str) -> dict:
+    """Poll an import job until it finishes."""
+    for _ in range(100):
+        job = client.get(location).get_json()
+        if job["status"] in ("completed", "failed"):
+            return job
+        time.sleep(0.05)
+    raise AssertionError("Import did not finish")
+
+
+class TestImport:
+    """Test background imports, validation and name lookups."""
+
+    def test_csv_import_reports_row_errors(self, client):
+        """Verify valid rows insert and invalid rows are reported by number."""
+        body = (
+            "Full Name,Job Title,Company,Email Address\n"
+            "Ann,VP Sales,acme,ann@example.com\n"
+            "Bob,CTO,Initech,bob@example.com\n"
+            ",CEO,Globex,cat@example.com\n"
+            "Dan,Engineer,2,dan@example.com\n"
+        )
+        response = client.post(
+            "/api/stakeholders/import",
+            data={"file": (io.BytesIO(body.encode()), "people.csv")},
+            content_type="multipart/form-data",
+        )
+        job = wait_for(client, response.headers["Location"])
+
+        assert response.status_code == 202
+        assert job["status"] == "completed"
+        assert (job["rows"], job["created"], job["failed"]) == (4, 2, 2)
+        assert [error["row"] for error in job["errors"]] == [3, 4]
+        ann = Stakeholder.query.filter_by(name="Ann").one()
+        assert (ann.company_id, ann.seniority) == (1, "vp")
+        assert CounterService.reconcile() == []
+
+    def test_values_converted_from_column_info(self, client, tmp_path):
+        """Verify choice labels, ranges and defaults follow column info."""
+        path = tmp_path / "deals.csv"
+        path.write_text(
+            "name,value,stage,probability,company\n"
+            "Won,100,Closed Won,90,Acme\n"
+            "Open,200,,,Globex\n"
+            "Sure,300,prospect,150,Acme\n"
+            "Odd,12.5,prospect,10,Acme\n"
+        )
+        job = ImportJob("1", "opportunities", "deals.csv")
+        ImportService.run(Opportunity, job, str(path), "csv")
+
+        assert (job.created, job.failed) == (2, 2)
+        stages = dict(db.session.query(Opportunity.name, Opportunity.stage))
+        assert stages == {"Won": "closed-won", "Open": "prospect"}
+
+    def test_unknown_header_fails_job(self, client, tmp_path):
+        """Verify headers are checked before any row is read."""
+        path = tmp_path / "companies.csv"
+        path.write_text("name,colour\nInitech,blue\n")
+        job = ImportJob("1", "companies", "companies.csv")
+        ImportService.run(Company, job, str(path), "csv")
+
+        assert job.status == "failed"
+        assert job.error == "Unknown column(s): colour"
+
+    def test_xlsx_import(self, client, tmp_path):
+        """Verify XLSX sheets import like CSV."""
+        openpyxl = pytest.importorskip("openpyxl")
+        workbook = openpyxl.Workbook()
+        workbook.active.append(["Company Name", "Industry", None])
+        workbook.active.append(["Initech", "technology", None])
+        path = tmp_path / "companies.xlsx"
+        workbook.save(path)
+
+        job = ImportJob("1", "companies", "companies.xlsx")
+        ImportService.run(Company, job, str(path), "xlsx")
+
+        assert (job.status, job.created) == ("completed", 1)
+        assert Company.query.filter_by(name="Initech").one().industry == "technology"
@@ -0,0 +1,83 @@
+"""Tests for batched ?include= relationship expansion."""
+
+import pytest
+from sqlalchemy import event
+
+from app.models import db, Company, Opportunity, Stakeholder, Task
+from app.models.task import task_entities
+
+
+@pytest.fixture
+def client(app):
+    """Test client over two companies, their deals, contacts and a task."""
+    acme, globex = Company(name="Acme"), Company(name="Globex")
+    db.session.add_all([acme, globex])
+    db.session.flush()
+    ann = Stakeholder(name="Ann", company_id=acme.id)
+    deals = [
+        Opportunity(name=f"Deal {i}", value=100, company_id=company.id)
+        for i, company in enumerate([acme, acme, globex])
+    ]
+    ann.opportunities = deals[:2]
+    task = Task(description="Call Ann")
+    db.session.add_all([ann, *deals, task])
+    db.session.flush()
+    db.session.execute(
+        task_entities.insert(),
+        [{"task_id": task.id, "entity_type": "opportunity", "entity_id": deals[0].id}],
+    )
+    db.session.commit()
+    return app.test_client()
+
+
+def count_statements(client, path):
+    """GET a path and count the SQL statements it ran."""
+    statements = []
+
+    def record(conn, cursor, statement, *args):
+        statements.append(statement)
+
+    event.listen(db.engine, "before_cursor_execute", record)
+    try:
+        response = client.get(path)
+    finally:
+        event.remove(db.engine, "before_cursor_execute", record)
+    return response, len(statements)
+
+
+class TestInclude:
+    """Test included entities, references and query batching."""
+
+    def test_list_includes_referenced_by_id(self, client):
+        """Verify rows reference included entities, each serialized once."""
+        response = client.get("/api/opportunities?include=company,stakeholders,tasks")
+
+        body = response.get_json()
+        assert response.status_code == 200
+        relationships = {row["name"]: row["relationships"] for row in body["data"]}
+        assert relationships["Deal 0"] == {"company": 1, "stakeholders": [1], "tasks": [1]}
+        assert relationships["Deal 2"] == {"company": 2, "stakeholders": [], "tasks": []}
+        assert sorted(c["name"] for c in body["included"]["companies"]) == ["Acme", "Globex"]
+        assert [s["name"] for s in body["included"]["stakeholders"]] == ["Ann"]
+        assert [t["description"] for t in body["included"]["tasks"]] == ["Call Ann"]
+
+    def test_one_query_per_include(self, client):
+        """Verify includes cost one query each, whatever the row count."""
+        _, without = count_statements(client, "/api/companies")
+        _, with_one = count_statements(client, "/api/companies?include=opportunities")
+        db.session.add_all([Opportunity(name=f"More {i}", value=1, company_id=2) for i in range(5)])
+        db.session.commit()
+        response, with_more = count_statements(client, "/api/companies?include=opportunities")
+
+        assert with_one == without + 1
+        assert with_more == with_one
+        assert len(response.get_json()["included"]["opportunities"]) == 8
+
+    def test_detail_include_and_validation(self, client):
+        """Verify detail includes, and unknown or streamed includes fail."""
+        body = client.get("/api/tasks/1?include=opportunities,notes").get_json()
+        assert body["data"]["relationships"] == {"opportunities": [1], "notes": []}
+        assert body["included"]["opportunities"][0]["name"] == "Deal 0"
+
+        assert client.get("/api/companies?include=nope").status_code == 400
+        assert client.get("/api/companies?include=stakeholders&format=ndjson").status_code == 400
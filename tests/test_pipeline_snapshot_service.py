@@ -0,0 +1,94 @@
+"""Tests for daily pipeline snapshots."""
+
+from datetime import date
+
+import pytest
+
+from app.models import db, Company, Opportunity, OpportunityAccountTeam, PipelineSnapshot, User
+from app.services.pipeline_snapshot_service import PipelineSnapshotService
+
+DAY = date(2026, 1, 2)
+
+
+@pytest.fixture
+def app(app):
+    """App over an owned open deal and an unowned won deal."""
+    company = Company(name="Acme", industry="technology")
+    rep = User(name="Rep", email="rep@example.com")
+    db.session.add_all([company, rep])
+    db.session.flush()
+    opportunity = Opportunity(
+        name="Open", value=1000, probability=50, stage="prospect", company_id=company.id
+    )
+    db.session.add_all(
+        [
+            opportunity,
+            Opportunity(
+                name="Won", value=2000, probability=100, stage="closed-won", company_id=company.id
+            ),
+        ]
+    )
+    db.session.flush()
+    db.session.add(OpportunityAccountTeam(user_id=rep.id, opportunity_id=opportunity.id))
+    db.session.commit()
+    return app
+
+
+def points(series):
+    """Map each bucket label to its (date, count, value, weighted value) points."""
+    return {
+        bucket["label"]: [
+            (point["date"], point["count"], point["value"], point["weighted_value"])
+            for point in bucket["points"]
+        ]
+        for bucket in series
+    }
+
+
+class TestPipelineSnapshots:
+    """Test writing snapshots and reading them back as series."""
+
+    def test_snapshot_round_trip(self, app):
+        """Verify snapshots read back per dimension, replacing a re-run day."""
+        with app.app_context():
+            assert PipelineSnapshotService.take_snapshot(DAY) == 4
+
+            stage = points(PipelineSnapshotService.get_series("stage", DAY, DAY))
+            assert stage == {
+                "Prospect": [("2026-01-02", 1, 1000, 500)],
+                "Closed Won": [("2026-01-02", 1, 2000, 2000)],
+            }
+            # Industry and owner cover the open pipeline only
+            assert points(PipelineSnapshotService.get_series("industry", DAY, DAY)) == {
+                "Technology": [("2026-01-02", 1, 1000, 500)]
+            }
+            assert points(PipelineSnapshotService.get_series("owner", DAY, DAY)) == {
+                "Rep": [("2026-01-02", 1, 1000, 500)]
+            }
+
+            Opportunity.query.filter_by(name="Open").one().value = 3000
+            db.session.commit()
+            PipelineSnapshotService.take_snapshot(DAY)
+            PipelineSnapshotService.take_snapshot(date(2026, 1, 3))
+
+            assert PipelineSnapshot.query.filter_by(snapshot_date=DAY).count() == 4
+            series = PipelineSnapshotService.get_series(
+                "stage", DAY, date(2026, 1, 31), keys=["prospect"]
+            )
+            assert points(series) == {
+                "Prospect": [("2026-01-02", 1, 3000, 1500), ("2026-01-03", 1, 3000, 1500)]
+            }
+
+    def test_cli_and_api(self, app):
+        """Verify the CLI writes a day that the series API returns."""
+        result = app.test_cli_runner().invoke(args=["snapshot-pipeline", "--date", "2026-01-02"])
+        assert result.output == "pipeline_snapshots: 4 rows for 2026-01-02\n"
+
+        client = app.test_client()
+        response = client.get(
+            "/api/pipeline/snapshots?dimension=owner&start=2026-01-01&end=2026-01-31"
+        )
+        assert response.status_code == 200
+        assert points(response.get_json()["series"]) == {"Rep": [("2026-01-02", 1, 1000, 500)]}
+        assert client.get("/api/pipeline/snapshots?dimension=nope").status_code == 400
+        assert client.get("/api/pipeline/snapshots?start=yesterday").status_code == 400
@@ -0,0 +1,119 @@
+"""Tests for card projection maintenance."""
+
+import pytest
+from sqlalchemy.orm.attributes import set_committed_value
+
+from app.models import (
+    db,
+    Company,
+    CompanyAccountTeam,
+    CompanyCard,
+    Opportunity,
+    Stakeholder,
+    StakeholderCard,
+    User,
+    UserCard,
+)
+from app.utils.model_utils import get_model_meta_data
+
+
+@pytest.fixture
+def app(app):
+    """App over two companies, a stakeholder and a team member."""
+    db.session.add_all(
+        [
+            Company(name="Acme"),
+            Company(name="Globex"),
+            User(name="Ann", email="ann@example.com"),
+        ]
+    )
+    db.session.flush()
+    db.session.add(Stakeholder(name="Bea", company_id=1))
+    db.session.commit()
+    return app
+
+
+def card(card_model, entity_id):
+    """Read a card row fresh from the database."""
+    db.session.expire_all()
+    return db.session.get(card_model, entity_id)
+
+
+class TestProjectionMaintenance:
+    """Test that writes refresh the cards of their parents."""
+
+    def test_opportunity_writes_refresh_company_and_stakeholder_cards(self, app):
+        """Verify opportunity insert, stage change, move and delete update cards."""
+        deal = Opportunity(name="Deal", value=100, stage="prospect", company_id=1)
+        stakeholder = db.session.get(Stakeholder, 1)
+        stakeholder.opportunities.append(deal)
+        db.session.add(deal)
+        db.session.commit()
+        company_card = card(CompanyCard, 1)
+        assert (company_card.pipeline_value, company_card.active_opportunities) == (100, 1)
+        assert card(StakeholderCard, 1).active_opportunities == 1
+
+        deal.stage = "closed-won"
+        db.session.commit()
+        assert card(CompanyCard, 1).active_opportunities == 0
+        assert card(StakeholderCard, 1).active_opportunities == 0
+
+        deal.stage, deal.company_id = "proposal", 2
+        db.session.commit()
+        assert card(CompanyCard, 1).pipeline_value == 0
+        assert card(CompanyCard, 2).pipeline_value == 100
+
+        db.session.delete(deal)
+        db.session.commit()
+        assert card(CompanyCard, 2).active_opportunities == 0
+        assert card(StakeholderCard, 1).active_opportunities == 0
+
+    def test_stakeholder_and_assignment_writes_refresh_cards(self, app):
+        """Verify stakeholder moves and account team rows update company and user cards."""
+        stakeholder = db.session.get(Stakeholder, 1)
+        stakeholder.company_id = 2
+        db.session.commit()
+        assert (card(CompanyCard, 1).stakeholders, card(CompanyCard, 2).stakeholders) == (0, 1)
+        assert card(StakeholderCard, 1).company_name == "Globex"
+
+        assignment = CompanyAccountTeam(company_id=2, user_id=1)
+        db.session.add(assignment)
+        db.session.commit()
+        assert card(CompanyCard, 2).account_team == 1
+        assert card(UserCard, 1).assigned_companies == 1
+        assert card(UserCard, 1).stakeholder_relationships == 1
+
+        db.session.delete(db.session.get(Stakeholder, 1))
+        db.session.delete(db.session.get(CompanyAccountTeam, (1, 2)))
+        db.session.commit()
+        assert card(CompanyCard, 2).stakeholders == 0
+        assert card(CompanyCard, 2).account_team == 0
+        assert card(StakeholderCard, 1) is None
+        assert card(UserCard, 1).assigned_companies == 0
+
+    def test_meta_data_matches_without_card(self, app):
+        """Verify card metadata is the same from the projection and from relationships."""
+        db.session.add_all(
+            [
+                Opportunity(name="Open", value=2500, stage="proposal", company_id=1),
+                Opportunity(name="Won", value=900, stage="closed-won", company_id=1),
+                CompanyAccountTeam(company_id=1, user_id=1),
+            ]
+        )
+        stakeholder = db.session.get(Stakeholder, 1)
+        stakeholder.opportunities = Opportunity.query.all()
+        db.session.commit()
+        for role in ("metric", "champion", "economic_buyer"):
+            stakeholder.add_meddpicc_role(role)
+
+        db.session.expire_all()
+        for model in (Company, Stakeholder, User):
+            entity = db.session.get(model, 1)
+            assert entity.card is not None
+            with_card = get_model_meta_data(entity)
+            set_committed_value(entity, "card", None)
+            assert get_model_meta_data(entity) == with_card
+
+        assert with_card  # User meta is not empty
+        roles = get_model_meta_data(db.session.get(Stakeholder, 1))["meddpicc_roles"]
+        assert roles == "MEDDPICC: Champion, Economic Buyer, Metric"
@@ -0,0 +1,87 @@
+"""Tests for filtered entity queries."""
+
+import re
+
+import pytest
+from sqlalchemy import event
+
+from app.models import db, Company, Stakeholder, User
+from app.services.query_service import QueryService
+
+
+@pytest.fixture
+def app(app):
+    """App over a stakeholder owned by two users and one owned by neither."""
+    company = Company(name="Acme")
+    db.session.add(company)
+    db.session.flush()
+    ann = Stakeholder(name="Ann", company_id=company.id)
+    ann.relationship_owners = [
+        User(name="Rep", email="rep@example.com"),
+        User(name="Lead", email="lead@example.com"),
+    ]
+    db.session.add_all([ann, Stakeholder(name="Bob", company_id=company.id)])
+    db.session.commit()
+    return app
+
+
+class TestRelationshipFilters:
+    """Test filters and groups on many-to-many relationships."""
+
+    def test_matching_several_related_rows_lists_once(self, app):
+        """Verify an entity matching through two related rows is one row."""
+        with app.app_context():
+            owner_ids = ",".join(str(user.id) for user in User.query.all())
+            query = QueryService.build_filtered_query(
+                Stakeholder, {"relationship_owners": owner_ids}
+            )
+
+            assert [stakeholder.name for stakeholder in query.all()] == ["Ann"]
+            assert QueryService.count_rows(query) == 1
+            assert QueryService.paginate(query, 1, 10) == (query.all(), False)
+
+    def test_listing_counts_each_match_once(self, app):
+        """Verify the list view's total counts a doubly matched entity once."""
+        with app.app_context():
+            owner_ids = ",".join(str(user.id) for user in User.query.all())
+
+        page = app.test_client().get(
+            f"/stakeholders/content?relationship_owners={owner_ids}"
+        ).get_data(as_text=True)
+
+        assert "Showing 1 Stakeholder\n" in page
+        assert page.count('data-entity-id="') == 1
+        assert "Bob" not in page
+
+    def test_pairs_group_by_owner_in_one_query(self, app):
+        """Verify owner pairs come from one join, ordered by owner, no owner last."""
+        with app.app_context():
+            executed = []
+
+            def record(conn, cursor, statement, parameters, context, executemany):
+                executed.append(statement)
+
+            event.listen(db.engine, "before_cursor_execute", record)
+            try:
+                query = QueryService.pair_with_relationship(
+                    Stakeholder.query, Stakeholder, "relationship_owners"
+                )
+                rows = [(stakeholder.name, label) for stakeholder, label in query]
+            finally:
+                event.remove(db.engine, "before_cursor_execute", record)
+
+            assert rows == [("Ann", "Lead"), ("Ann", "Rep"), ("Bob", None)]
+            assert len(executed) == 1
+            counts = QueryService.group_counts(
+                Stakeholder.query, Stakeholder, "relationship_owners"
+            )
+            assert dict(counts) == {"Lead": 1, "Rep": 1, None: 1}
+
+    def test_listing_groups_by_owner(self, app):
+        """Verify the owner grouped list shows an entity under each of its owners."""
+        page = app.test_client().get(
+            "/stakeholders/content?group_by=relationship_owners"
+        ).get_data(as_text=True)
+
+        assert re.findall(r'data-group="([^"]+)"', page) == ["Lead", "Rep", "No Owner"]
+        assert page.count('data-entity-id="') == 3
@@ -2,7 +2,6 @@
 
 import pytest
 from app.models import db
-from app.main import create_app
 from app.services import DisplayService, SerializationService, MetadataService
 from app.models.task import Task
 from app.models.opportunity import Opportunity
@@ -12,20 +11,6 @@ from app.utils.opportunity_utils import calculate_priority_by_value, get_stage_c
 from app.exceptions import ValidationError, NotFoundError
 
 
-@pytest.fixture
-def app():
-    """Create app for testing."""
-    app = create_app()
-    app.config["TESTING"] = True
-    app.config["SQLALCHEMY_DATABASE_URI"] = "sqlite:///:memory:"
-
-    with app.app_context():
-        db.create_all()
-        yield app
-        db.session.remove()
-        db.drop_all()
-
-
 @pytest.fixture
 def client(app):
     """Test client."""
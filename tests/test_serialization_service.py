@@ -0,0 +1,103 @@
+"""Tests for compiled model serializers and JSON encoding."""
+
+from datetime import date, datetime
+
+import pytest
+
+from app.models import db, Company, Opportunity
+from app.services import SerializationService
+
+
+class TestSerializationService:
+    """Test compiled serializers."""
+
+    def test_to_dict_formats_dates(self, app):
+        """Verify columns, properties and transforms with ISO dates."""
+        company = Company(name="Acme")
+        db.session.add(company)
+        db.session.flush()
+        opportunity = Opportunity(
+            name="Deal",
+            value=100,
+            company_id=company.id,
+            expected_close_date=date(2026, 3, 1),
+        )
+        db.session.add(opportunity)
+        db.session.commit()
+
+        result = opportunity.to_dict()
+        assert result["name"] == "Deal"
+        assert result["expected_close_date"] == "2026-03-01"
+        assert isinstance(result["created_at"], str)
+        assert result["deal_age"] == 0
+        assert result["stakeholders"] == []
+
+    def test_failing_property_is_left_out(self, app, monkeypatch):
+        """Verify a property raising AttributeError is skipped for that row only."""
+        owner_name = property(lambda self: self.owner.name)  # Opportunities have no owner
+        monkeypatch.setattr(Opportunity, "owner_name", owner_name, raising=False)
+        properties = [*Opportunity.__include_properties__, "owner_name"]
+        monkeypatch.setattr(Opportunity, "__include_properties__", properties)
+        opportunity = Opportunity(name="Deal", value=100)
+        db.session.add(opportunity)
+        db.session.commit()
+
+        result = SerializationService.compile_serializer(Opportunity)(opportunity)
+        assert "owner_name" not in result
+        assert result["deal_age"] == 0
+
+    def test_expired_instance_reloads_columns(self, app):
+        """Verify expired attributes are loaded rather than skipped."""
+        company = Company(name="Acme")
+        db.session.add(company)
+        db.session.commit()  # Expires all attributes
+
+        assert SerializationService.serialize_model(company)["name"] == "Acme"
+
+    def test_native_serializer_encodes_like_to_dict(self, app):
+        """Verify native dates encode to the same JSON as to_dict strings."""
+        company = Company(name="Acme", created_at=datetime(2026, 1, 2, 3, 4, 5))
+        db.session.add(company)
+        db.session.commit()
+
+        native = SerializationService.serialize_many([company])
+        assert native[0]["created_at"] == datetime(2026, 1, 2, 3, 4, 5)
+        assert app.json.loads(app.json.dumps_bytes(native)) == [company.to_dict()]
+
+
+class TestStreamedLists:
+    """Test streamed entity list responses."""
+
+    @pytest.fixture
+    def client(self, app):
+        """Test client over a few companies, more than one stream chunk."""
+        from app.utils import entity_crud
+
+        db.session.add_all(Company(name=f"Company {index:02d}") for index in range(25))
+        db.session.commit()
+        original = entity_crud.STREAM_BATCH_SIZE
+        entity_crud.STREAM_BATCH_SIZE = 10
+        yield app.test_client()
+        entity_crud.STREAM_BATCH_SIZE = original
+
+    def test_ndjson_matches_json(self, client, app):
+        """Verify one object per line, in list order."""
+        expected = client.get("/api/companies").get_json()
+        response = client.get("/api/companies?format=ndjson")
+
+        assert response.mimetype == "application/x-ndjson"
+        lines = response.get_data().splitlines()
+        assert [app.json.loads(line) for line in lines] == expected
+
+    def test_streamed_array_matches_json(self, client):
+        """Verify the streamed array decodes to the buffered list."""
+        expected = client.get("/api/companies").get_json()
+        response = client.get("/api/companies?stream=1")
+
+        assert response.is_streamed
+        assert response.get_json() == expected
+        assert len(expected) == 25
+
+    def test_unknown_format_rejected(self, client):
+        """Verify unsupported formats return 400."""
+        assert client.get("/api/companies?format=xml").status_code == 400
@@ -0,0 +1,39 @@
+"""Tests for stakeholder job title classification."""
+
+import pytest
+
+from app.utils.stakeholder_utils import classify_seniority
+
+
+class TestClassifySeniority:
+    """Test seniority classification of job titles."""
+
+    @pytest.mark.parametrize(
+        "job_title, expected",
+        [
+            ("CEO", "executive"),
+            ("Chief Revenue Officer", "executive"),
+            ("Co-Founder & CTO", "executive"),
+            ("Managing Director", "executive"),
+            ("Vice President, Engineering", "vp"),
+            ("SVP Sales", "vp"),
+            ("Director of Marketing", "director"),
+            ("Head of Procurement", "director"),
+            ("IT Manager", "manager"),
+            ("Team Lead", "manager"),
+            ("Lead Engineer", "manager"),
+            ("Owner", "executive"),
+            ("Co-Owner", "executive"),
+            ("Founder & Owner", "executive"),
+            ("Product Owner", "individual"),
+            ("Executive Assistant to the CEO", "individual"),
+            ("Lead Generation Specialist", "individual"),
+            ("Software Engineer", "individual"),
+            ("Victor Pryce", "individual"),  # "VP" only as a whole word
+            ("", None),
+            (None, None),
+        ],
+    )
+    def test_classify(self, job_title, expected):
+        """Verify titles map to the expected level."""
+        assert classify_seniority(job_title) == expected
@@ -0,0 +1,94 @@
+"""Tests for entity statistics generation."""
+
+from datetime import date, timedelta
+
+import pytest
+from sqlalchemy import event
+
+from app.core.stats import StatsGenerator
+from app.models import db, MODEL_REGISTRY, Company, Opportunity, Stakeholder, Task, User
+from app.models.enums import TaskStatus
+
+
+@pytest.fixture
+def app(app):
+    """Create app with a small data set for testing."""
+    company = Company(name="Acme", industry="technology")
+    db.session.add_all([company, User(name="Rep", email="rep@example.com")])
+    db.session.flush()
+    db.session.add_all(
+        [
+            Opportunity(name="Won", value=1000, stage="closed-won", company_id=company.id),
+            Opportunity(name="Lost", value=3000, stage="closed-lost", company_id=company.id),
+            Opportunity(name="Open", value=2000, stage="prospect", company_id=company.id),
+            Stakeholder(name="Ann", job_title="VP Sales", email="ann@example.com", company_id=company.id),
+            Stakeholder(name="Bob", job_title="Engineer", company_id=company.id),
+            Task(description="Late", due_date=date.today() - timedelta(days=1), status=TaskStatus.TODO),
+            Task(description="Soon", due_date=date.today() + timedelta(days=2), status=TaskStatus.TODO),
+            Task(description="Done", due_date=date.today() - timedelta(days=1), status=TaskStatus.COMPLETE),
+        ]
+    )
+    db.session.commit()
+
+    return app
+
+
+@pytest.fixture
+def statements(app):
+    """Record SQL statements executed against the engine."""
+    executed = []
+
+    def record(conn, cursor, statement, parameters, context, executemany):
+        executed.append(statement)
+
+    event.listen(db.engine, "before_cursor_execute", record)
+    yield executed
+    event.remove(db.engine, "before_cursor_execute", record)
+
+
+def stat_values(model) -> dict:
+    """Generate stats for a model as a label to value mapping."""
+    return {
+        stat.label: stat.value
+        for stat in StatsGenerator(model, model.__tablename__).generate()
+    }
+
+
+class TestStatsGenerator:
+    """Test StatsGenerator aggregates."""
+
+    @pytest.mark.parametrize("entity_type", sorted(MODEL_REGISTRY))
+    def test_one_query_per_model(self, app, statements, entity_type):
+        """Verify each model's stats come from a single SELECT."""
+        model = MODEL_REGISTRY[entity_type]
+        StatsGenerator(model, model.__tablename__).generate()
+        assert len(statements) == 1
+
+    def test_opportunity_stats(self, app):
+        """Verify pipeline totals and win rate."""
+        stats = stat_values(Opportunity)
+        assert stats["Total Opportunities"] == 3
+        assert stats["Pipeline Value"] == 6000
+        assert stats["Avg Deal Size"] == 2000
+        assert stats["Win Rate"] == 50
+
+    def test_task_stats(self, app):
+        """Verify completed tasks are excluded from overdue and due counts."""
+        stats = stat_values(Task)
+        assert stats["Overdue"] == 1
+        assert stats["Due This Week"] == 1
+        assert stats["Completed"] == 1
+
+    def test_stakeholder_stats(self, app):
+        """Verify decision maker and email counts."""
+        stats = stat_values(Stakeholder)
+        assert stats["Decision Makers"] == 1
+        assert stats["With Email"] == 1
+        assert stats["Companies"] == 1
+
+    def test_company_stats(self, app):
+        """Verify active companies and top industry."""
+        stats = stat_values(Company)
+        assert stats["Active Companies"] == 1
+        assert stats["Total Opportunities"] == 3
+        assert stats["In Technology"] == 1
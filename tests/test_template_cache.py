@@ -0,0 +1,44 @@
+"""Tests for the Jinja bytecode cache and template precompilation."""
+
+from jinja2 import DictLoader, Environment
+
+from app import config
+from app.utils.template_cache import configure_bytecode_cache, precompile_templates
+
+
+def make_env(base, directory, monkeypatch):
+    """Copy an environment, with its own template cache and bytecode in a directory."""
+    monkeypatch.setattr(config, "JINJA_BYTECODE_CACHE_DIR", str(directory))
+    env = base.overlay(cache_size=400)
+    configure_bytecode_cache(env)
+    return env
+
+
+class TestTemplateCache:
+    """Test precompilation, bytecode reuse and the timing report."""
+
+    def test_app_templates_precompile_then_load_from_bytecode(self, app, tmp_path, monkeypatch):
+        """Verify a restarted worker loads every app template from bytecode."""
+        first = precompile_templates(make_env(app.jinja_env, tmp_path, monkeypatch))
+        second = precompile_templates(make_env(app.jinja_env, tmp_path, monkeypatch))
+
+        count = len(app.jinja_env.list_templates())
+        assert "shared/entity_content.html" in app.jinja_env.list_templates()
+        assert (first["templates"], first["bytecode_misses"], first["failed"]) == (count, count, [])
+        assert (second["bytecode_hits"], second["bytecode_misses"]) == (count, 0)
+        assert len(second["slowest"]) == 5
+
+    def test_broken_template_is_reported(self, tmp_path, monkeypatch):
+        """Verify a template that fails to compile is reported, not raised."""
+        loader = DictLoader({"ok.html": "{{ 1 }}", "broken.html": "{% if %}"})
+        report = precompile_templates(make_env(Environment(loader=loader), tmp_path, monkeypatch))
+
+        assert report["failed"] == ["broken.html"]
+        assert report["templates"] == 1
+
+    def test_disabled(self, monkeypatch):
+        """Verify "none" leaves the environment without a bytecode cache."""
+        monkeypatch.setattr(config, "JINJA_BYTECODE_CACHE_DIR", "none")
+        env = Environment()
+        assert configure_bytecode_cache(env) is None
+        assert env.bytecode_cache is None